@@ -5,9 +5,366 @@ Recursively extracts all code files from any project into a single markdown docu
 Focuses on actual source code while excluding libraries and dependencies.
 """
 
+import codecs
 import os
 import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
+
+# Chunk size used when streaming file contents into the markdown output
+_COPY_BUFSIZE = 1 << 20
+
+# Reader threads and how many files may be read ahead of the writer
+_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+_PREFETCH_WINDOW = 64
+
+# Minimum seconds between progress lines
+_PROGRESS_INTERVAL = 1.0
+
+# Directory names never descended into (libraries, dependencies, VCS, build output)
+_IGNORE_DIRS = frozenset(
+    {
+        # Python
+        "__pycache__",
+        ".pytest_cache",
+        ".mypy_cache",
+        ".tox",
+        "dist",
+        "build",
+        ".egg-info",
+        "venv",
+        ".venv",
+        "env",
+        ".env",
+        "site-packages",
+        # Node.js/JavaScript
+        "node_modules",
+        ".next",
+        ".nuxt",
+        "coverage",
+        ".nyc_output",
+        "bower_components",
+        # Version control
+        ".git",
+        ".svn",
+        ".hg",
+        # IDEs
+        ".vscode",
+        ".idea",
+        "__MACOSX",
+        # Build/temp
+        "tmp",
+        "temp",
+        ".tmp",
+        ".cache",
+        # Logs
+        "logs",
+        "log",
+        # Testing
+        ".coverage",
+        "htmlcov",
+        # Documentation builds
+        "_build",
+        "docs/_build",
+        ".sphinx-build",
+    }
+)
+
+# Binary / non-code file extensions
+_IGNORE_EXTENSIONS = frozenset(
+    {
+        ".pyc",
+        ".pyo",
+        ".pyd",
+        ".so",
+        ".dll",
+        ".dylib",
+        ".log",
+        ".tmp",
+        ".temp",
+        ".bak",
+        ".backup",
+        ".exe",
+        ".msi",
+        ".dmg",
+        ".deb",
+        ".rpm",
+        ".zip",
+        ".tar",
+        ".gz",
+        ".rar",
+        ".7z",
+        ".pdf",
+        ".doc",
+        ".docx",
+        ".xls",
+        ".xlsx",
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".svg",
+        ".ico",
+        ".mp3",
+        ".mp4",
+        ".avi",
+        ".mov",
+        ".wav",
+        ".woff",
+        ".woff2",
+        ".ttf",
+        ".eot",
+    }
+)
+
+# Hidden files that are still worth including
+_HIDDEN_FILE_ALLOWLIST = frozenset(
+    {
+        ".gitignore",
+        ".env.example",
+        ".eslintrc.js",
+        ".babelrc",
+        ".prettierrc",
+        ".editorconfig",
+    }
+)
+
+# Hidden directories that are not ignored by the dot-prefix rule
+_HIDDEN_DIR_ALLOWLIST = frozenset({".github", ".vscode"})
+
+# Substrings (matched case-insensitively) that mark a directory as ignored
+_DIR_SUBSTR_IGNORES = ("cache", "backup")
+
+# Specific filenames to skip
+_IGNORE_FILES = frozenset(
+    {
+        "package-lock.json",
+        "yarn.lock",
+        "poetry.lock",
+        "Pipfile.lock",
+        ".DS_Store",
+        "Thumbs.db",
+        "desktop.ini",
+        "node_modules",
+        ".coverage",
+    }
+)
+
+# Extensions treated as code files
+_CODE_EXTENSIONS = frozenset(
+    {
+        # Python
+        ".py",
+        ".pyx",
+        ".pyi",
+        # JavaScript/TypeScript
+        ".js",
+        ".jsx",
+        ".ts",
+        ".tsx",
+        ".mjs",
+        ".cjs",
+        # Web frontend
+        ".html",
+        ".htm",
+        ".css",
+        ".scss",
+        ".sass",
+        ".less",
+        ".vue",
+        ".svelte",
+        ".astro",
+        # Config files (often code-like)
+        ".json",
+        ".yaml",
+        ".yml",
+        ".toml",
+        ".ini",
+        ".cfg",
+        ".xml",
+        ".config",
+        # Shell scripts
+        ".sh",
+        ".bash",
+        ".zsh",
+        ".fish",
+        ".ps1",
+        ".bat",
+        ".cmd",
+        # Other common languages
+        ".java",
+        ".kt",
+        ".scala",
+        ".go",
+        ".rs",
+        ".c",
+        ".cpp",
+        ".cc",
+        ".cxx",
+        ".h",
+        ".hpp",
+        ".cs",
+        ".php",
+        ".rb",
+        ".swift",
+        ".m",
+        ".mm",
+        ".sql",
+        ".r",
+        ".R",
+        ".matlab",
+        # Markup/Documentation as code
+        ".md",
+        ".rst",
+        ".txt",
+        # Build files
+        ".dockerfile",
+        ".containerfile",
+        # Data formats that might contain code
+        ".graphql",
+        ".proto",
+        # Template files
+        ".jinja",
+        ".j2",
+        ".handlebars",
+        ".mustache",
+    }
+)
+
+# Special filenames (often without extension) treated as code files
+_SPECIAL_FILES = frozenset(
+    {
+        "makefile",
+        "dockerfile",
+        "containerfile",
+        "vagrantfile",
+        "rakefile",
+        "gruntfile.js",
+        "gulpfile.js",
+        "webpack.config.js",
+        "rollup.config.js",
+        "vite.config.js",
+        "package.json",
+        "composer.json",
+        "requirements.txt",
+        "setup.py",
+        "setup.cfg",
+        "pyproject.toml",
+        "poetry.toml",
+        "__init__.py",
+        "conftest.py",
+        ".gitignore",
+        ".dockerignore",
+        ".eslintrc.js",
+        ".babelrc",
+        ".prettierrc",
+        ".editorconfig",
+    }
+)
+
+# Extension -> markdown code fence language
+_LANGUAGE_MAP = {
+    ".py": "python",
+    ".pyx": "python",
+    ".pyi": "python",
+    ".js": "javascript",
+    ".jsx": "jsx",
+    ".ts": "typescript",
+    ".tsx": "tsx",
+    ".mjs": "javascript",
+    ".cjs": "javascript",
+    ".html": "html",
+    ".htm": "html",
+    ".css": "css",
+    ".scss": "scss",
+    ".sass": "sass",
+    ".less": "less",
+    ".vue": "vue",
+    ".svelte": "svelte",
+    ".json": "json",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".toml": "toml",
+    ".xml": "xml",
+    ".sh": "bash",
+    ".bash": "bash",
+    ".zsh": "zsh",
+    ".fish": "fish",
+    ".ps1": "powershell",
+    ".bat": "batch",
+    ".cmd": "batch",
+    ".java": "java",
+    ".kt": "kotlin",
+    ".scala": "scala",
+    ".go": "go",
+    ".rs": "rust",
+    ".c": "c",
+    ".cpp": "cpp",
+    ".cc": "cpp",
+    ".cxx": "cpp",
+    ".h": "c",
+    ".hpp": "cpp",
+    ".cs": "csharp",
+    ".php": "php",
+    ".rb": "ruby",
+    ".swift": "swift",
+    ".m": "objective-c",
+    ".mm": "objective-c",
+    ".sql": "sql",
+    ".r": "r",
+    ".R": "r",
+    ".md": "markdown",
+    ".rst": "rst",
+    ".txt": "text",
+    ".ini": "ini",
+    ".cfg": "ini",
+    ".config": "xml",
+    ".graphql": "graphql",
+    ".proto": "protobuf",
+    ".dockerfile": "dockerfile",
+    ".containerfile": "dockerfile",
+}
+
+# Filename -> language for files whose extension is not in _LANGUAGE_MAP
+_SPECIAL_FILENAMES = {
+    "dockerfile": "dockerfile",
+    "containerfile": "dockerfile",
+    "makefile": "makefile",
+    "vagrantfile": "ruby",
+    ".gitignore": "gitignore",
+    ".dockerignore": "gitignore",
+}
+
+
+def _lower_ext(name):
+    """Return the lower-cased extension of a bare filename ('' if none).
+
+    Same result as ``os.path.splitext(name)[1].lower()`` (leading dots do not start an
+    extension, so ``.gitignore`` has none) without the extra call and tuple per file.
+    """
+    dot = name.rfind(".")
+    if dot <= 0 or (name[0] == "." and not name[:dot].lstrip(".")):
+        return ""
+    return name[dot:].lower()
+
+
+def _is_target_file(name):
+    """Return whether a bare filename should be documented.
+
+    Same decision as ``not should_ignore_file(name) and is_code_file(name)``, folded
+    into one pass with a single extension extraction per file.
+    """
+    # Hidden files (except allowlisted ones) and specific ignored files
+    if (name[0] == "." and name not in _HIDDEN_FILE_ALLOWLIST) or name in _IGNORE_FILES:
+        return False
+    ext = _lower_ext(name)
+    if ext in _IGNORE_EXTENSIONS:
+        return False
+    # Code extensions, or special filenames (often without extension)
+    return ext in _CODE_EXTENSIONS or name.lower() in _SPECIAL_FILES
 
 
 class CodeSpider:
@@ -17,275 +374,67 @@ class CodeSpider:
             self.root_dir = os.path.abspath(root_dir)
         else:
             self.root_dir = os.getcwd()
+        # root_dir is absolute and normalized, so scanned paths all start with this prefix
+        self._root_prefix = self.root_dir.rstrip(os.sep) + os.sep
 
         if not os.path.exists(self.root_dir):
             raise ValueError(f"Target directory does not exist: {self.root_dir}")
 
-    def should_ignore_directory(self, dir_path):
-        """Check if directory should be ignored (libraries, dependencies, etc)."""
-        ignore_dirs = {
-            # Python
-            "__pycache__",
-            ".pytest_cache",
-            ".mypy_cache",
-            ".tox",
-            "dist",
-            "build",
-            ".egg-info",
-            "venv",
-            ".venv",
-            "env",
-            ".env",
-            "site-packages",
-            # Node.js/JavaScript
-            "node_modules",
-            ".next",
-            ".nuxt",
-            "coverage",
-            ".nyc_output",
-            "bower_components",
-            # Version control
-            ".git",
-            ".svn",
-            ".hg",
-            # IDEs
-            ".vscode",
-            ".idea",
-            "__MACOSX",
-            # Build/temp
-            "tmp",
-            "temp",
-            ".tmp",
-            ".cache",
-            # Logs
-            "logs",
-            "log",
-            # Testing
-            ".coverage",
-            "htmlcov",
-            # Documentation builds
-            "_build",
-            "docs/_build",
-            ".sphinx-build",
-        }
-
-        dir_name = os.path.basename(dir_path)
+    def should_ignore_directory(self, dir_name):
+        """Check if directory should be ignored (libraries, dependencies, etc).
 
+        Takes the bare directory name (e.g. ``DirEntry.name``), not a full path.
+        """
         # Check exact matches
-        if dir_name in ignore_dirs:
+        if dir_name in _IGNORE_DIRS:
             return True
 
-        # Check patterns
+        # Check patterns ("cache" also covers "__pycache__")
+        lower = dir_name.lower()
         if (
-            (dir_name.startswith(".") and dir_name not in {".github", ".vscode"})
+            (dir_name.startswith(".") and dir_name not in _HIDDEN_DIR_ALLOWLIST)
             or dir_name.endswith(".egg-info")
-            or "cache" in dir_name.lower()
-            or "backup" in dir_name.lower()
-            or "__pycache__" in dir_name
+            or any(tok in lower for tok in _DIR_SUBSTR_IGNORES)
         ):
             return True
 
         return False
 
-    def should_ignore_file(self, file_path):
-        """Check if file should be ignored."""
-        filename = os.path.basename(file_path)
+    def should_ignore_file(self, filename, file_ext=None):
+        """Check if file should be ignored.
 
+        Takes the bare filename plus its lower-cased extension (computed if omitted).
+        """
         # Ignore hidden files (except some exceptions)
-        if filename.startswith(".") and filename not in {
-            ".gitignore",
-            ".env.example",
-            ".eslintrc.js",
-            ".babelrc",
-            ".prettierrc",
-            ".editorconfig",
-        }:
+        if filename.startswith(".") and filename not in _HIDDEN_FILE_ALLOWLIST:
             return True
 
         # Ignore common non-code files
-        ignore_extensions = {
-            ".pyc",
-            ".pyo",
-            ".pyd",
-            ".so",
-            ".dll",
-            ".dylib",
-            ".log",
-            ".tmp",
-            ".temp",
-            ".bak",
-            ".backup",
-            ".exe",
-            ".msi",
-            ".dmg",
-            ".deb",
-            ".rpm",
-            ".zip",
-            ".tar",
-            ".gz",
-            ".rar",
-            ".7z",
-            ".pdf",
-            ".doc",
-            ".docx",
-            ".xls",
-            ".xlsx",
-            ".png",
-            ".jpg",
-            ".jpeg",
-            ".gif",
-            ".svg",
-            ".ico",
-            ".mp3",
-            ".mp4",
-            ".avi",
-            ".mov",
-            ".wav",
-            ".woff",
-            ".woff2",
-            ".ttf",
-            ".eot",
-        }
-
-        file_ext = os.path.splitext(filename)[1].lower()
-        if file_ext in ignore_extensions:
+        if file_ext is None:
+            file_ext = _lower_ext(filename)
+        if file_ext in _IGNORE_EXTENSIONS:
             return True
 
         # Ignore specific files
-        ignore_files = {
-            "package-lock.json",
-            "yarn.lock",
-            "poetry.lock",
-            "Pipfile.lock",
-            ".DS_Store",
-            "Thumbs.db",
-            "desktop.ini",
-            "node_modules",
-            ".coverage",
-        }
-
-        if filename in ignore_files:
+        if filename in _IGNORE_FILES:
             return True
 
         return False
 
-    def is_code_file(self, filepath):
-        """Check if file is a code file that should be included."""
-        code_extensions = {
-            # Python
-            ".py",
-            ".pyx",
-            ".pyi",
-            # JavaScript/TypeScript
-            ".js",
-            ".jsx",
-            ".ts",
-            ".tsx",
-            ".mjs",
-            ".cjs",
-            # Web frontend
-            ".html",
-            ".htm",
-            ".css",
-            ".scss",
-            ".sass",
-            ".less",
-            ".vue",
-            ".svelte",
-            ".astro",
-            # Config files (often code-like)
-            ".json",
-            ".yaml",
-            ".yml",
-            ".toml",
-            ".ini",
-            ".cfg",
-            ".xml",
-            ".config",
-            # Shell scripts
-            ".sh",
-            ".bash",
-            ".zsh",
-            ".fish",
-            ".ps1",
-            ".bat",
-            ".cmd",
-            # Other common languages
-            ".java",
-            ".kt",
-            ".scala",
-            ".go",
-            ".rs",
-            ".c",
-            ".cpp",
-            ".cc",
-            ".cxx",
-            ".h",
-            ".hpp",
-            ".cs",
-            ".php",
-            ".rb",
-            ".swift",
-            ".m",
-            ".mm",
-            ".sql",
-            ".r",
-            ".R",
-            ".matlab",
-            # Markup/Documentation as code
-            ".md",
-            ".rst",
-            ".txt",
-            # Build files
-            ".dockerfile",
-            ".containerfile",
-            # Data formats that might contain code
-            ".graphql",
-            ".proto",
-            # Template files
-            ".jinja",
-            ".j2",
-            ".handlebars",
-            ".mustache",
-        }
-
-        file_ext = os.path.splitext(filepath)[1].lower()
-        filename = os.path.basename(filepath).lower()
+    def is_code_file(self, filename, file_ext=None):
+        """Check if file is a code file that should be included.
+
+        Takes the bare filename plus its lower-cased extension (computed if omitted).
+        """
+        if file_ext is None:
+            file_ext = _lower_ext(filename)
 
         # Check extension
-        if file_ext in code_extensions:
+        if file_ext in _CODE_EXTENSIONS:
             return True
 
         # Check special filenames (no extension)
-        special_files = {
-            "makefile",
-            "dockerfile",
-            "containerfile",
-            "vagrantfile",
-            "rakefile",
-            "gruntfile.js",
-            "gulpfile.js",
-            "webpack.config.js",
-            "rollup.config.js",
-            "vite.config.js",
-            "package.json",
-            "composer.json",
-            "requirements.txt",
-            "setup.py",
-            "setup.cfg",
-            "pyproject.toml",
-            "poetry.toml",
-            "__init__.py",
-            "conftest.py",
-            ".gitignore",
-            ".dockerignore",
-            ".eslintrc.js",
-            ".babelrc",
-            ".prettierrc",
-            ".editorconfig",
-        }
-
-        if filename in special_files:
+        if filename.lower() in _SPECIAL_FILES:
             return True
 
         return False
@@ -294,22 +443,38 @@ class CodeSpider:
         """Get all target code files recursively."""
         target_files = []
 
-        for root, dirs, files in os.walk(self.root_dir):
-            # Remove ignored directories from dirs list to prevent os.walk from entering them
-            dirs[:] = [d for d in dirs if not self.should_ignore_directory(os.path.join(root, d))]
-
-            for file in files:
-                file_path = os.path.join(root, file)
-
-                # Skip ignored files
-                if self.should_ignore_file(file_path):
-                    continue
-
-                # Include only code files
-                if self.is_code_file(file_path):
-                    target_files.append(file_path)
-
-        return sorted(target_files)
+        # Stack-based DFS over os.scandir: DirEntry type info comes from the directory
+        # listing itself, so there is no extra stat() per entry like os.walk does.
+        # Each directory's entries are sorted on their own, keyed so that the DFS emits
+        # paths in exactly the order a global sorted() would: a directory sorts as
+        # "name" + os.sep, which places its subtree where its full paths would fall
+        # (e.g. "a.py" < "a/x.py" < "a0.py").
+        stack = [(self.root_dir, True)]
+        while stack:
+            path, is_dir = stack.pop()
+            if not is_dir:
+                target_files.append(path)
+                continue
+            children = []
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        name = entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            # Skip ignored directories so we never descend into them
+                            if not self.should_ignore_directory(name):
+                                children.append((name + os.sep, entry.path, True))
+                        elif entry.is_file() and _is_target_file(name):
+                            # Skip ignored files; include only code files
+                            children.append((name, entry.path, False))
+            except OSError:
+                # Unreadable directory (permissions, removed mid-scan); skip it
+                continue
+            # Names are unique within a directory, so only the sort key is ever compared
+            children.sort()
+            stack.extend((child, child_is_dir) for _, child, child_is_dir in reversed(children))
+
+        return target_files
 
     def read_file_content(self, file_path):
         """Read file content with robust error handling."""
@@ -334,96 +499,70 @@ class CodeSpider:
         except OSError as e:
             return f"Error reading file: {e}"
 
+    def prefetch_file(self, file_path):
+        """Read a small file's raw bytes ahead of time (runs in a worker thread).
+
+        Returns None for files larger than one copy buffer, or on any read error;
+        those are streamed (or reported) by write_file_content() instead.
+        """
+        try:
+            if os.path.getsize(file_path) > _COPY_BUFSIZE:
+                return None
+            with open(file_path, "rb") as src:
+                return src.read()
+        except OSError:
+            return None
+
+    def write_file_content(self, file_path, sink, prefetched=None):
+        """Stream file content into the binary sink; return True if it ended with a newline.
+
+        Valid UTF-8 is copied through as raw bytes in fixed-size chunks, so memory stays
+        O(buffer) regardless of file size and nothing is decoded and re-encoded. If the
+        file turns out not to be UTF-8 (or cannot be read), the partial output is rolled
+        back and read_file_content() handles the latin-1 fallback / error message.
+        `prefetched` holds the bytes already read by prefetch_file(), if any.
+        """
+        start = sink.tell()
+        validator = codecs.getincrementaldecoder("utf-8")()
+        last_chunk = b""
+        try:
+            if prefetched is not None:
+                validator.decode(prefetched)
+                sink.write(prefetched)
+                last_chunk = prefetched
+            else:
+                with open(file_path, "rb") as src:
+                    while chunk := src.read(_COPY_BUFSIZE):
+                        validator.decode(chunk)
+                        sink.write(chunk)
+                        last_chunk = chunk
+            validator.decode(b"", final=True)
+        except (UnicodeDecodeError, OSError):
+            sink.seek(start)
+            sink.truncate()
+            content = self.read_file_content(file_path)
+            sink.write(content.encode("utf-8"))
+            return content.endswith("\n")
+        return last_chunk.endswith(b"\n")
+
     def get_file_language(self, file_path):
         """Determine the language for markdown code blocks."""
-        ext = os.path.splitext(file_path)[1].lower()
-        filename = os.path.basename(file_path).lower()
-
-        language_map = {
-            ".py": "python",
-            ".pyx": "python",
-            ".pyi": "python",
-            ".js": "javascript",
-            ".jsx": "jsx",
-            ".ts": "typescript",
-            ".tsx": "tsx",
-            ".mjs": "javascript",
-            ".cjs": "javascript",
-            ".html": "html",
-            ".htm": "html",
-            ".css": "css",
-            ".scss": "scss",
-            ".sass": "sass",
-            ".less": "less",
-            ".vue": "vue",
-            ".svelte": "svelte",
-            ".json": "json",
-            ".yaml": "yaml",
-            ".yml": "yaml",
-            ".toml": "toml",
-            ".xml": "xml",
-            ".sh": "bash",
-            ".bash": "bash",
-            ".zsh": "zsh",
-            ".fish": "fish",
-            ".ps1": "powershell",
-            ".bat": "batch",
-            ".cmd": "batch",
-            ".java": "java",
-            ".kt": "kotlin",
-            ".scala": "scala",
-            ".go": "go",
-            ".rs": "rust",
-            ".c": "c",
-            ".cpp": "cpp",
-            ".cc": "cpp",
-            ".cxx": "cpp",
-            ".h": "c",
-            ".hpp": "cpp",
-            ".cs": "csharp",
-            ".php": "php",
-            ".rb": "ruby",
-            ".swift": "swift",
-            ".m": "objective-c",
-            ".mm": "objective-c",
-            ".sql": "sql",
-            ".r": "r",
-            ".R": "r",
-            ".md": "markdown",
-            ".rst": "rst",
-            ".txt": "text",
-            ".ini": "ini",
-            ".cfg": "ini",
-            ".config": "xml",
-            ".graphql": "graphql",
-            ".proto": "protobuf",
-        }
-
-        # Check filename-based languages
-        if filename in ["dockerfile", "containerfile"] or "dockerfile" in filename:
-            return "dockerfile"
-        elif filename == "makefile" or filename.endswith("makefile"):
-            return "makefile"
-        elif filename == "vagrantfile":
-            return "ruby"
-        elif filename in ["package.json", "composer.json"]:
-            return "json"
-        elif filename in [".gitignore", ".dockerignore"]:
-            return "gitignore"
-        elif filename in [
-            ".eslintrc.js",
-            "webpack.config.js",
-            "rollup.config.js",
-            "vite.config.js",
-        ]:
-            return "javascript"
-        elif filename == "__init__.py":
-            return "python"
-
-        return language_map.get(ext, "text")
+        filename = file_path.rpartition(os.sep)[2].lower()
+
+        # Extension lookup first: it answers for nearly every file
+        lang = _LANGUAGE_MAP.get(_lower_ext(filename))
+        if lang is not None:
+            return lang
+
+        # Filename-based languages (extensionless build and ignore files)
+        return _SPECIAL_FILENAMES.get(filename, "text")
 
     def get_relative_path(self, file_path):
         """Get relative path from project root."""
+        # Paths from get_target_files are root_dir + os.sep + ...; slice off the prefix
+        # rather than having os.path.relpath re-normalize both paths for every file.
+        if file_path.startswith(self._root_prefix):
+            return file_path[len(self._root_prefix) :]
         try:
             return os.path.relpath(file_path, self.root_dir)
         except ValueError:
@@ -450,45 +589,65 @@ class CodeSpider:
         print(f"Processing {len(target_files)} files...")
         print(f"Output will be saved to: {output_path}")
 
-        with open(output_path, "w", encoding="utf-8") as out_file:
+        # Binary output with a large buffer: markdown fragments are encoded once and
+        # written in as few calls as possible; file bodies are streamed in between.
+        with open(output_path, "wb", buffering=_COPY_BUFSIZE) as out_file:
             project_name = os.path.basename(self.root_dir)
 
-            # Write header
-            out_file.write(f"# Codebase Documentation: {project_name}\n\n")
-            out_file.write(f"**Source Directory:** `{os.path.abspath(self.root_dir)}`  \n")
-            out_file.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  \n")
-            out_file.write(f"**Total Files:** {len(target_files)}\n\n")
-
-            # Write table of contents
-            out_file.write("## Table of Contents\n\n")
-            for i, file_path in enumerate(target_files, 1):
-                rel_path = self.get_relative_path(file_path)
+            # Write header and table of contents
+            chunk = bytearray()
+            chunk += (
+                f"# Codebase Documentation: {project_name}\n\n"
+                f"**Source Directory:** `{os.path.abspath(self.root_dir)}`  \n"
+                f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  \n"
+                f"**Total Files:** {len(target_files)}\n\n"
+                "## Table of Contents\n\n"
+            ).encode()
+            # Relative paths are derived once and shared by the TOC and the file sections
+            rel_paths = [self.get_relative_path(file_path) for file_path in target_files]
+            for i, rel_path in enumerate(rel_paths, 1):
                 anchor = rel_path.replace("/", "").replace(".", "").replace(" ", "-").lower()
-                out_file.write(f"{i}. [{rel_path}](#{anchor})\n")
-            out_file.write("\n---\n\n")
-
-            # Write file contents
-            for i, file_path in enumerate(target_files, 1):
-                rel_path = self.get_relative_path(file_path)
-
-                # Progress indicator
-                if i % 10 == 0:
-                    print(f"Processed {i}/{len(target_files)} files...")
-
-                # File header
-                out_file.write(f"## {i}. {rel_path}\n\n")
-                out_file.write(f"**Full Path:** `{os.path.abspath(file_path)}`\n\n")
-
-                # Read and write file content
-                content = self.read_file_content(file_path)
-                language = self.get_file_language(file_path)
-
-                out_file.write(f"```{language}\n")
-                out_file.write(content)
-                if not content.endswith("\n"):
-                    out_file.write("\n")
-                out_file.write("```\n\n")
-                out_file.write("---\n\n")
+                chunk += f"{i}. [{rel_path}](#{anchor})\n".encode()
+            chunk += b"\n---\n\n"
+            out_file.write(chunk)
+
+            # Write file contents. Reads run ahead in a thread pool (file I/O releases the
+            # GIL) over a sliding window, while writes stay in deterministic order.
+            with ThreadPoolExecutor(max_workers=_READ_WORKERS) as executor:
+                upcoming = iter(target_files)
+                pending = deque(
+                    executor.submit(self.prefetch_file, path)
+                    for path in islice(upcoming, _PREFETCH_WINDOW)
+                )
+                next_report = time.monotonic() + _PROGRESS_INTERVAL
+                for i, (file_path, rel_path) in enumerate(
+                    zip(target_files, rel_paths, strict=True), 1
+                ):
+                    prefetched = pending.popleft().result()
+                    next_path = next(upcoming, None)
+                    if next_path is not None:
+                        pending.append(executor.submit(self.prefetch_file, next_path))
+
+                    # Progress indicator, throttled by wall clock and kept off stdout
+                    now = time.monotonic()
+                    if now >= next_report:
+                        print(f"Processed {i}/{len(target_files)} files...", file=sys.stderr)
+                        next_report = now + _PROGRESS_INTERVAL
+
+                    # File header and opening fence in one write (scanned paths are
+                    # already absolute, being built from the absolute root_dir)
+                    language = self.get_file_language(file_path)
+                    out_file.write(
+                        f"## {i}. {rel_path}\n\n"
+                        f"**Full Path:** `{file_path}`\n\n"
+                        f"```{language}\n".encode()
+                    )
+
+                    # Stream file content into the code fence, then close it
+                    if self.write_file_content(file_path, out_file, prefetched):
+                        out_file.write(b"```\n\n---\n\n")
+                    else:
+                        out_file.write(b"\n```\n\n---\n\n")
 
         print(f"Codebase documentation saved to: {output_path}")
         return output_path
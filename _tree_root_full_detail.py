@@ -1,12 +1,17 @@
 import ast
+import hashlib
 import logging
 import os
+import pickle
 
 from treelib import Tree
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+# Part of every parse cache key; bump when _extract_structure's output shape changes
+_STRUCTURE_VERSION = 1
+
 
 class ProjectAnalyzer:
     def __init__(self) -> None:
@@ -14,66 +19,140 @@ class ProjectAnalyzer:
         script_dir = os.path.dirname(os.path.abspath(__file__))
         self.project_root = script_dir
         logging.info(f"Project root set to: {self.project_root}")
+        # Per-file parse results are memoized here (skipped by the '.'-prefix dir filter)
+        self.cache_dir = os.path.join(self.project_root, ".cache", "tree_analysis")
+        # Cache file names used by this run; everything else is pruned after the walk
+        self._live_cache_files: set[str] = set()
         self.tree = Tree()
         self.tree.create_node("Project Root/", "Project Root")  # Append / to indicate directory
 
     def parse_python_file(self, filepath, parent_id) -> None:
-        """Parse Python file to extract classes, methods, functions."""
+        """Parse Python file to extract classes, methods, functions.
+
+        The extracted structure is memoized on disk keyed by (format version, path,
+        mtime, size), so unchanged files are not re-parsed on repeated runs.
+        """
         try:
-            with open(filepath) as file:
-                node = ast.parse(file.read(), filename=filepath)
-                for elem in node.body:
-                    if isinstance(elem, ast.ClassDef):
-                        class_id = f"{parent_id}-{elem.name}"
-                        self.tree.create_node(f"Class: {elem.name}", class_id, parent=parent_id)
-                        for method in [n for n in elem.body if isinstance(n, ast.FunctionDef)]:
-                            method_id = f"{class_id}-{method.name}"
-                            self.tree.create_node(
-                                f"Method: {method.name}", method_id, parent=class_id
-                            )
-                    elif isinstance(elem, ast.FunctionDef):
-                        func_id = f"{parent_id}-{elem.name}"
-                        self.tree.create_node(f"Function: {elem.name}", func_id, parent=parent_id)
+            st = os.stat(filepath)
+            key_src = f"{_STRUCTURE_VERSION}|{filepath}|{st.st_mtime_ns}|{st.st_size}"
+            key = hashlib.blake2b(key_src.encode()).hexdigest()
+            self._live_cache_files.add(f"{key}.pkl")
+            cache_path = os.path.join(self.cache_dir, f"{key}.pkl")
+            structure = self._load_cached_structure(cache_path)
+            if structure is None:
+                # ast.parse accepts bytes and honours PEP 263 cookies, so skip the text decode
+                with open(filepath, "rb") as file:
+                    node = ast.parse(file.read(), filename=filepath, type_comments=False)
+                structure = self._extract_structure(node)
+                self._store_cached_structure(cache_path, structure)
+
+            for kind, name, methods in structure:
+                elem_id = f"{parent_id}-{name}"
+                if kind == "class":
+                    self.tree.create_node(f"Class: {name}", elem_id, parent=parent_id)
+                    for method in methods:
+                        method_id = f"{elem_id}-{method}"
+                        self.tree.create_node(f"Method: {method}", method_id, parent=elem_id)
+                else:
+                    self.tree.create_node(f"Function: {name}", elem_id, parent=parent_id)
         except Exception as e:
             logging.exception(f"Failed to parse {filepath}: {e}")
 
+    @staticmethod
+    def _extract_structure(node) -> list[tuple[str, str, list[str]]]:
+        """Reduce a module AST to (kind, name, method_names) tuples for top-level defs."""
+        class_def, function_def = ast.ClassDef, ast.FunctionDef
+        structure = []
+        for elem in node.body:
+            # Exact type checks: neither node class has subclasses
+            t = type(elem)
+            if t is class_def:
+                methods = [n.name for n in elem.body if type(n) is function_def]
+                structure.append(("class", elem.name, methods))
+            elif t is function_def:
+                structure.append(("function", elem.name, []))
+        return structure
+
+    @staticmethod
+    def _load_cached_structure(cache_path):
+        """Return the memoized structure, or None on a miss or unusable entry.
+
+        Any failure to load or unpack counts as a miss, so a bad entry is re-parsed
+        instead of dropping the file from the tree.
+        """
+        try:
+            with open(cache_path, "rb") as file:
+                structure = pickle.load(file)
+            for kind, name, methods in structure:
+                if kind not in ("class", "function") or not isinstance(name, str):
+                    return None
+                if not all(isinstance(m, str) for m in methods):
+                    return None
+            return structure
+        except Exception:
+            return None
+
+    def _store_cached_structure(self, cache_path, structure) -> None:
+        """Write a cache entry atomically (tmp file + os.replace)."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{cache_path}.tmp"
+            with open(tmp_path, "wb") as file:
+                pickle.dump(structure, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logging.warning(f"Failed to write parse cache {cache_path}: {e}")
+
+    def _prune_cache(self) -> None:
+        """Delete cache entries for files that were edited, moved or removed since written."""
+        try:
+            with os.scandir(self.cache_dir) as it:
+                stale = [e.path for e in it if e.name not in self._live_cache_files]
+        except OSError:
+            return
+        for path in stale:
+            try:
+                os.remove(path)
+            except OSError as e:
+                logging.warning(f"Failed to prune parse cache {path}: {e}")
+
     def analyze_project(self) -> None:
         """Traverse and parse project files."""
-        for root, dirs, files in os.walk(self.project_root, topdown=True):
-            # Ignore __pycache__ directories
-            dirs[:] = [d for d in dirs if d != "__pycache__"]
-            # Ignore directories starting with '.' or '_' and any 'backup' directories
-            dirs[:] = [
-                d for d in dirs if not d.startswith(".") and not d.startswith("_") and d != "backup"
-            ]
-            # Ignore files starting with '.' or '_'
-            files = [f for f in files if not f.startswith(".") and not f.startswith("_")]
-
-            relative_root_path = os.path.relpath(root, self.project_root)
-            parent_id = (
-                "Project Root"
-                if relative_root_path == "."
-                else os.path.join("Project Root", relative_root_path.replace(os.sep, "/"))
-            )
-
-            if relative_root_path != ".":
-                directory_tag = os.path.basename(root) + "/"
-                self.tree.create_node(
-                    tag=directory_tag,
-                    identifier=parent_id,
-                    parent=os.path.dirname(parent_id) or "Project Root",
-                )
-
-            for name in files:
-                if name.endswith(".py"):
-                    filepath = os.path.join(root, name)
-                    file_id = os.path.join(parent_id, name)
-                    self.tree.create_node(tag=name, identifier=file_id, parent=parent_id)
-                    self.parse_python_file(filepath, file_id)
-                elif name.endswith((".yaml", ".yml")):
-                    filepath = os.path.join(root, name)
-                    file_id = os.path.join(parent_id, name)
-                    self.tree.create_node(tag=f"📄 {name}", identifier=file_id, parent=parent_id)
+        self._walk(self.project_root, "Project Root")
+        self._prune_cache()
+
+    def _walk(self, path, parent_id) -> None:
+        """Add the entries of one directory under `parent_id`, recursing into subdirectories.
+
+        Ignore rules are checked on `DirEntry.name` before recursing, so skipped
+        directories are never listed.
+        """
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return
+
+        for entry in entries:
+            name = entry.name
+            # Ignore entries starting with '.' or '_' (this also covers __pycache__)
+            if name.startswith((".", "_")):
+                continue
+            is_dir = entry.is_dir()
+            if is_dir:
+                # Ignore 'backup' directories; symlinked directories are not followed
+                if name == "backup" or entry.is_symlink():
+                    continue
+                dir_id = f"{parent_id}{os.sep}{name}"
+                self.tree.create_node(tag=f"{name}/", identifier=dir_id, parent=parent_id)
+                self._walk(entry.path, dir_id)
+            elif name.endswith(".py"):
+                file_id = f"{parent_id}{os.sep}{name}"
+                self.tree.create_node(tag=name, identifier=file_id, parent=parent_id)
+                self.parse_python_file(entry.path, file_id)
+            elif name.endswith((".yaml", ".yml")):
+                file_id = f"{parent_id}{os.sep}{name}"
+                self.tree.create_node(tag=f"📄 {name}", identifier=file_id, parent=parent_id)
 
     def generate_reports(self) -> None:
         """Generate and save project analysis reports."""
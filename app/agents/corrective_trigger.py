@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
 import os
+from dataclasses import dataclass
 from typing import Any
 
+import orjson
 from pydantic import BaseModel, Field
 
 from app.agents.orchestrator import OrchestratorResult
@@ -29,16 +30,35 @@ class CorrectiveTriggerConfig(BaseModel):
     )
 
 
-class CorrectiveTriggerResult(BaseModel):
-    triggered: bool = Field(description="Whether a corrective job was enqueued")
-    reason: str | None = Field(default=None, description="Reason for trigger decision")
-    payload: dict[str, Any] | None = Field(
-        default=None, description="Payload enqueued to corrective queue"
-    )
+@dataclass(slots=True)
+class CorrectiveTriggerResult:
+    triggered: bool  # Whether a corrective job was enqueued
+    reason: str | None = None  # Reason for trigger decision
+    payload: dict[str, Any] | None = None  # Payload enqueued to corrective queue
+
+
+# Redis clients cached per URL. Each wraps its own connection pool, so repeated triggers
+# reuse open connections instead of paying connect + AUTH + SELECT on every call.
+_clients: dict[str, Any] = {}
+
+
+def _get_redis(redis_url: str) -> Any:
+    client = _clients.get(redis_url)
+    if client is None:
+        if Redis is None:  # pragma: no cover - test will monkeypatch
+            raise RuntimeError("redis.asyncio module unavailable")
+        client = Redis.from_url(redis_url, decode_responses=True)
+        _clients[redis_url] = client
+    return client
+
+
+def _dumps(payload: dict[str, Any]) -> str:
+    # C-accelerated encoding; OPT_NON_STR_KEYS keeps json.dumps' handling of e.g. int keys
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode()
 
 
 async def _enqueue(redis: Any, queue: str, payload: dict[str, Any]) -> None:
-    data = json.dumps(payload)
+    data = _dumps(payload)
     # Use RPUSH to append to a list queue; switch to XADD if streams are preferred
     await redis.rpush(queue, data)
 
@@ -61,28 +81,30 @@ async def trigger_corrective_if_needed(
         return CorrectiveTriggerResult(triggered=False, reason="threshold_met")
 
     redis_url = os.getenv(cfg.redis_url_env, "redis://localhost:6379/0")
-    if Redis is None:  # pragma: no cover - test will monkeypatch
-        raise RuntimeError("redis.asyncio module unavailable")
-
-    redis = Redis.from_url(redis_url, decode_responses=True)
-    try:
-        payload = {
-            "task_id": task_id,
-            "aggregate_confidence": agg,
-            "context": orchestrator_result.context or {},
-            "results": [
-                {
-                    "stage": str(r.stage),
-                    "content": r.response.content,
-                    "confidence": r.response.confidence,
-                }
-                for r in orchestrator_result.results
-            ],
-        }
-        await _enqueue(redis, cfg.queue_name, payload)
-        return CorrectiveTriggerResult(triggered=True, reason="threshold_not_met", payload=payload)
-    finally:
+    redis = _get_redis(redis_url)
+    payload = {
+        "task_id": task_id,
+        "aggregate_confidence": agg,
+        "context": orchestrator_result.context or {},
+        "results": [
+            {
+                "stage": r.stage.value,
+                "content": r.response.content,
+                "confidence": r.response.confidence,
+            }
+            for r in orchestrator_result.results
+        ],
+    }
+    await _enqueue(redis, cfg.queue_name, payload)
+    return CorrectiveTriggerResult(triggered=True, reason="threshold_not_met", payload=payload)
+
+
+async def close() -> None:
+    """Close all cached trigger clients (used on shutdown and by tests)."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
         try:
-            await redis.aclose()
+            await client.aclose()
         except Exception:
             pass
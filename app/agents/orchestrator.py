@@ -1,27 +1,27 @@
 from __future__ import annotations
 
 import asyncio
+from array import array
+from dataclasses import dataclass
 from typing import Any
 
-from pydantic import BaseModel, Field
-
 from app.agents.base import Agent, AgentRequest, AgentResponse
 from app.config_schema import QAStage
 
 
-class AgentRunResult(BaseModel):
-    stage: QAStage = Field(description="QA stage executed")
-    response: AgentResponse = Field(description="Agent response for the stage")
+# Internal result containers: built only from already-validated AgentResponse objects,
+# so they skip Pydantic validation and use slots.
+@dataclass(slots=True)
+class AgentRunResult:
+    stage: QAStage  # QA stage executed
+    response: AgentResponse  # Agent response for the stage
 
 
-class OrchestratorResult(BaseModel):
-    results: list[AgentRunResult] = Field(description="Per-stage results")
-    aggregate_confidence: float = Field(
-        ge=0.0, le=1.0, description="Aggregate confidence across stages"
-    )
-    context: dict[str, Any] | None = Field(
-        default=None, description="Orchestrator-shared context for downstream steps"
-    )
+@dataclass(slots=True)
+class OrchestratorResult:
+    results: list[AgentRunResult]  # Per-stage results
+    aggregate_confidence: float  # Aggregate confidence across stages (mean, in [0, 1])
+    context: dict[str, Any] | None = None  # Orchestrator-shared context for downstream steps
 
 
 class EnhancedQAOrchestrator:
@@ -33,6 +33,7 @@ class EnhancedQAOrchestrator:
 
     def __init__(self, max_concurrency: int = 8) -> None:
         self._registry: dict[QAStage, Agent] = {}
+        self._max_concurrency = max_concurrency
         self._sem = asyncio.Semaphore(max_concurrency)
 
     def register(self, stage: QAStage, agent: Agent) -> None:
@@ -44,11 +45,48 @@ class EnhancedQAOrchestrator:
     def list_registered(self) -> list[QAStage]:
         return list(self._registry.keys())
 
-    async def _run_agent(self, stage: QAStage, request: AgentRequest) -> AgentRunResult:
+    async def _invoke(
+        self,
+        stage: QAStage,
+        request: AgentRequest,
+        confidences: array | None = None,
+        idx: int = 0,
+    ) -> AgentRunResult:
+        agent = self._registry[stage]
+        resp: AgentResponse = await agent.run(request)
+        if confidences is not None:
+            # Record the confidence in a flat array so aggregation is a C-level sum
+            confidences[idx] = resp.confidence
+        return AgentRunResult(stage=stage, response=resp)
+
+    async def _run_agent(
+        self,
+        stage: QAStage,
+        request: AgentRequest,
+        confidences: array | None = None,
+        idx: int = 0,
+    ) -> AgentRunResult:
+        # The semaphore is per orchestrator, so concurrent run_all calls share one budget
         async with self._sem:
-            agent = self._registry[stage]
-            resp: AgentResponse = await agent.run(request)
-            return AgentRunResult(stage=stage, response=resp)
+            return await self._invoke(stage, request, confidences, idx)
+
+    async def _run_pooled(
+        self, stages: list[QAStage], request: AgentRequest, confidences: array
+    ) -> list[AgentRunResult]:
+        """Run stages through max_concurrency workers pulling from a shared iterator.
+
+        Avoids creating one task per stage that then parks on the semaphore; each
+        worker still holds it per stage. Results keep the order of `stages`.
+        """
+        results: list[AgentRunResult | None] = [None] * len(stages)
+        pending = iter(enumerate(stages))
+
+        async def worker() -> None:
+            for idx, stage in pending:
+                results[idx] = await self._run_agent(stage, request, confidences, idx)
+
+        await asyncio.gather(*(worker() for _ in range(self._max_concurrency)))
+        return results  # type: ignore[return-value]
 
     async def run_all(
         self, request: AgentRequest, stages: list[QAStage] | None = None
@@ -57,20 +95,22 @@ class EnhancedQAOrchestrator:
 
         6.4 will build sequential orchestration; here we focus on coordination.
         """
-        selected = stages or list(self._registry.keys())
-        tasks: list[asyncio.Task[AgentRunResult]] = []
-        for stage in selected:
-            if stage in self._registry:
-                tasks.append(asyncio.create_task(self._run_agent(stage, request)))
+        selected = [s for s in (stages or list(self._registry.keys())) if s in self._registry]
         results: list[AgentRunResult] = []
-        if tasks:
-            results = await asyncio.gather(*tasks)
+        # Confidences kept alongside results (by stage index) for the aggregate below
+        confidences = array("d", [0.0]) * len(selected)
+        if len(selected) > self._max_concurrency:
+            results = await self._run_pooled(selected, request, confidences)
+        elif selected:
+            # Fits within the concurrency budget: one task per stage, no worker pool
+            results = list(
+                await asyncio.gather(
+                    *(self._run_agent(s, request, confidences, i) for i, s in enumerate(selected))
+                )
+            )
 
         # Simple aggregate: mean of confidences
-        if results:
-            agg = sum(r.response.confidence for r in results) / len(results)
-        else:
-            agg = 0.0
+        agg = sum(confidences) / len(confidences) if confidences else 0.0
 
         # Placeholder for shared context propagation to 6.4
         shared_context: dict[str, Any] | None = None
@@ -99,7 +139,11 @@ class EnhancedQAOrchestrator:
         ordered = stages or default_order
 
         results: list[AgentRunResult] = []
+        confidences = array("d")
         shared_context: dict[str, Any] = {}
+        # Request context plus stage outputs, grown in place rather than re-merged per
+        # stage; AgentRequest validation already copies it into each stage request.
+        merged_context: dict[str, Any] = dict(request.context or {})
 
         for stage in ordered:
             if stage not in self._registry:
@@ -109,17 +153,18 @@ class EnhancedQAOrchestrator:
                 analysis_type=request.analysis_type,
                 qa_stage=stage,
                 prompt=request.prompt,
-                context={**(request.context or {}), **shared_context}
-                if shared_context
-                else request.context,
+                context=merged_context if shared_context else request.context,
             )
             res = await self._run_agent(stage, stage_req)
             results.append(res)
+            confidences.append(res.response.confidence)
 
             # Simple propagation: attach each stage's content into context for next stage
-            shared_context[f"{str(stage)}_content"] = res.response.content
+            key = f"{stage.value}_content"
+            shared_context[key] = res.response.content
+            merged_context[key] = res.response.content
 
-        agg = sum(r.response.confidence for r in results) / len(results) if results else 0.0
+        agg = sum(confidences) / len(confidences) if confidences else 0.0
         return OrchestratorResult(
             results=results, aggregate_confidence=agg, context=shared_context or None
         )
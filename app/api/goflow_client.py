@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 from typing import Any
 
 import httpx
+import orjson
 from pydantic import BaseModel, Field, HttpUrl
 
 from app.api.goflow_errors import (
@@ -38,42 +40,91 @@ except Exception:  # pragma: no cover - tests will not rely on real tenacity
     stop_after_attempt = None  # type: ignore
     wait_exponential_jitter = None  # type: ignore
 
+try:  # HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1
+    import h2  # type: ignore # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except Exception:  # pragma: no cover
+    _HTTP2_AVAILABLE = False
+
+
+# GoFlow agent API paths. Per-project paths are filled in with f-strings at the call
+# sites: CPython builds those in one BUILD_STRING step, which is cheaper than
+# str.format_map against a template.
+_PATH_NEXT_JOB = "/api/v1/agent/next-job"
+_PATH_PROJECTS = "/api/v1/agent/projects"
+
 
 class GoFlowConfig(BaseModel):
     base_url: HttpUrl = Field(description="GoFlow API base URL")
     api_key: str = Field(description="Bearer API key for GoFlow")
     timeout_seconds: float = Field(default=30.0, description="HTTP timeout in seconds")
     max_retries: int = Field(default=3, ge=0, description="Max retry attempts for requests")
+    http2: bool = Field(default=True, description="Negotiate HTTP/2 when h2 is installed")
+    max_connections: int = Field(default=100, ge=1, description="Max open connections in pool")
+    max_keepalive_connections: int = Field(
+        default=20, ge=0, description="Max idle keep-alive connections retained in pool"
+    )
+    keepalive_expiry: float = Field(
+        default=30.0, ge=0.0, description="Seconds an idle keep-alive connection is kept"
+    )
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+def _build_http_client(cfg: GoFlowConfig) -> httpx.AsyncClient:
+    # Encoded to bytes once per client, from the config as it is now (a cached copy on
+    # the mutable config would outlive an api_key rotation); httpx sends them as-is
+    headers = httpx.Headers(
+        [
+            (b"Authorization", f"Bearer {cfg.api_key}".encode("ascii")),
+            (b"Content-Type", b"application/json"),
+            (b"Accept", b"application/json"),
+        ]
+    )
+    return httpx.AsyncClient(
+        base_url=str(cfg.base_url),
+        timeout=cfg.timeout_seconds,
+        headers=headers,
+        # Keep-alive pool (and HTTP/2 multiplexing) so concurrent calls
+        # reuse connections instead of re-handshaking
+        limits=cfg.limits,
+        http2=cfg.http2 and _HTTP2_AVAILABLE,
+    )
 
 
 class GoFlowClient:
-    """Async GoFlow API client with typed config and retry policy."""
+    """Async GoFlow API client with typed config and retry policy.
 
-    def __init__(self, cfg: GoFlowConfig) -> None:
+    Pass a shared `http_client` (see GoFlowClientFactory) to reuse one connection pool
+    across call sites; otherwise `async with` creates and closes a private one.
+    """
+
+    def __init__(self, cfg: GoFlowConfig, http_client: httpx.AsyncClient | None = None) -> None:
         self.cfg = cfg
-        self._client: httpx.AsyncClient | None = None
-        self._lock = asyncio.Lock()
+        self._client: httpx.AsyncClient | None = http_client
+        self._owns_client = http_client is None
         self._log = logging.getLogger(__name__)
 
     async def __aenter__(self) -> GoFlowClient:
-        async with self._lock:
-            if self._client is None:
-                self._client = httpx.AsyncClient(
-                    base_url=str(self.cfg.base_url),
-                    timeout=self.cfg.timeout_seconds,
-                    headers={
-                        "Authorization": f"Bearer {self.cfg.api_key}",
-                        "Content-Type": "application/json",
-                        "Accept": "application/json",
-                    },
-                )
+        # No lock needed: construction is synchronous, so check-and-set cannot be
+        # interleaved by another task
+        if self._client is None:
+            self._client = _build_http_client(self.cfg)
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
-        async with self._lock:
-            if self._client is not None:
-                await self._client.aclose()
-                self._client = None
+        # A shared client belongs to its factory and outlives this scope
+        if self._client is not None and self._owns_client:
+            # Detach before awaiting so concurrent users never see a closing client
+            client, self._client = self._client, None
+            await client.aclose()
 
     @property
     def client(self) -> httpx.AsyncClient:
@@ -104,7 +155,8 @@ class GoFlowClient:
 
             raise RuntimeError("Retry loop exited unexpectedly")
 
-        # Fallback retry when tenacity is unavailable
+        # Fallback retry when tenacity is unavailable. Like stop_after_attempt above,
+        # max_retries counts total attempts; 0 means a single try with no retry.
         attempts = max(1, self.cfg.max_retries or 1)
         last_exc: Exception | None = None
         for i in range(attempts):
@@ -120,7 +172,7 @@ class GoFlowClient:
                         resp.status_code,
                     )
                     last_exc = GoFlowServerError(f"server error {resp.status_code}")
-                    await asyncio.sleep(min(2**i * 0.2, 2.0))
+                    await self._backoff(i, attempts)
                     continue
                 self._raise_for_status_map(resp)
                 return resp
@@ -134,11 +186,20 @@ class GoFlowClient:
                     e,
                 )
                 last_exc = GoFlowRetryableError(str(e))
-                await asyncio.sleep(min(2**i * 0.2, 2.0))
+                await self._backoff(i, attempts)
                 continue
         assert last_exc is not None
         raise last_exc
 
+    @staticmethod
+    async def _backoff(attempt: int, attempts: int) -> None:
+        # Nothing left to retry after the final attempt
+        if attempt + 1 >= attempts:
+            return
+        # Exponential backoff with 0.5x-1.5x jitter so concurrent clients do not retry
+        # in lock-step after a server blip
+        await asyncio.sleep(min(2**attempt * 0.2, 2.0) * (0.5 + random.random()))
+
     def _raise_for_status_map(self, resp: httpx.Response) -> None:
         if resp.status_code < 400:
             return
@@ -154,39 +215,95 @@ class GoFlowClient:
         raise GoFlowError(f"unexpected status {code}")
 
     async def get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        # _request has already mapped every 4xx/5xx to a typed GoFlowError
         resp = await self._request("GET", path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return self._decode(resp)
+
+    async def post(
+        self,
+        path: str,
+        json: dict[str, Any] | None = None,  # noqa: A002
+        content: bytes | None = None,
+    ) -> dict[str, Any]:
+        # Pre-encoded bodies go out as-is (Content-Type is a client default header)
+        if content is not None:
+            resp = await self._request("POST", path, content=content)
+        else:
+            resp = await self._request("POST", path, json=json)
+        return self._decode(resp)
+
+    @staticmethod
+    def _decode(resp: httpx.Response) -> Any:
+        return orjson.loads(resp.content)
 
-    async def post(self, path: str, json: dict[str, Any] | None = None) -> dict[str, Any]:  # noqa: A002
-        resp = await self._request("POST", path, json=json)
-        resp.raise_for_status()
-        return resp.json()
+    async def _post_model(self, path: str, model: BaseModel) -> dict[str, Any]:
+        # pydantic-core serializes straight to JSON bytes, skipping the dict + stdlib json pass
+        return await self.post(path, content=model.model_dump_json().encode())
 
     # ---- Task 7.2: Job Acquisition and Status Management ----
     async def get_next_job(self) -> Job:
         """Fetch the next available job for this agent."""
-        data = await self.get("/api/v1/agent/next-job")
+        data = await self.get(_PATH_NEXT_JOB)
         return Job.model_validate(data)
 
     async def update_project_status(
         self, project_id: str, update: JobStatusUpdate
     ) -> dict[str, Any]:
         """Update processing status for a project (agent heartbeat/progress)."""
-        path = f"/api/v1/agent/projects/{project_id}/status"
-        return await self.post(path, json=update.model_dump())
+        path = f"{_PATH_PROJECTS}/{project_id}/status"
+        return await self._post_model(path, update)
+
+    async def update_many_statuses(
+        self, updates: list[tuple[str, JobStatusUpdate]]
+    ) -> list[dict[str, Any] | BaseException]:
+        """Send status updates for several projects concurrently.
+
+        Results keep the order of `updates`; a failed update is returned as its exception
+        rather than aborting the others.
+        """
+        return await asyncio.gather(
+            *(self.update_project_status(project_id, u) for project_id, u in updates),
+            return_exceptions=True,
+        )
 
     # ---- Task 7.3: Result Submission and Report Generation ----
     async def submit_analysis_result(self, payload: ResultPayload) -> dict[str, Any]:
         """Submit analysis result for a specific project/media/analysis."""
         path = (
-            f"/api/v1/agent/projects/{payload.project_id}/media/"
+            f"{_PATH_PROJECTS}/{payload.project_id}/media/"
             f"{payload.media_id}/analysis/{payload.analysis_id}"
         )
-        return await self.post(path, json=payload.model_dump())
+        return await self._post_model(path, payload)
 
     async def generate_project_report(self, req: ReportRequest) -> ReportResponse:
         """Trigger report generation for a project and return report info."""
-        path = f"/api/v1/agent/projects/{req.project_id}/reports"
-        data = await self.post(path, json=req.model_dump())
+        path = f"{_PATH_PROJECTS}/{req.project_id}/reports"
+        data = await self._post_model(path, req)
         return ReportResponse.model_validate(data)
+
+
+class GoFlowClientFactory:
+    """Process-wide owner of the httpx.AsyncClient used by GoFlowClient instances.
+
+    Register `startup()`/`shutdown()` with the app lifespan; `client()` then hands out
+    GoFlowClient objects bound to the one shared connection pool, so call sites no
+    longer pay TCP+TLS setup per `async with` scope.
+    """
+
+    def __init__(self, cfg: GoFlowConfig) -> None:
+        self.cfg = cfg
+        self._http_client: httpx.AsyncClient | None = None
+
+    async def startup(self) -> None:
+        if self._http_client is None:
+            self._http_client = _build_http_client(self.cfg)
+
+    async def shutdown(self) -> None:
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    def client(self) -> GoFlowClient:
+        if self._http_client is None:
+            raise RuntimeError("GoFlowClientFactory not started; await startup() first")
+        return GoFlowClient(self.cfg, http_client=self._http_client)
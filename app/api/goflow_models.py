@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from enum import StrEnum
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -15,7 +16,7 @@ class Job(BaseModel):
     )
 
 
-class JobStatus(str):
+class JobStatus(StrEnum):
     QUEUED = "queued"
     IN_PROGRESS = "in_progress"
     COMPLETED = "completed"
@@ -23,7 +24,7 @@ class JobStatus(str):
 
 
 class JobStatusUpdate(BaseModel):
-    status: str = Field(description="New job status")
+    status: JobStatus = Field(description="New job status")
     detail: str | None = Field(default=None, description="Optional detail message")
     progress: float | None = Field(
         default=None, ge=0.0, le=1.0, description="Optional progress 0..1"
@@ -14,8 +14,13 @@ ollama_optimization_vars: Mapping[str, str] = {
 def apply_ollama_optimizations() -> None:
     """Apply Ollama optimization environment variables.
 
-    Does not overwrite values already provided by the environment; only sets defaults.
+    The optimized values always win over what the environment provides, per
+    [OLLAMA-OPT]. Idempotent: keys already holding their value are not rewritten, so
+    repeat calls (re-imports, app factory re-runs) do no putenv work.
     Pattern: os.environ.update(ollama_optimization_vars)
     """
-    # [CORE-STD] Follow exact pattern: overwrite with the optimized values
-    os.environ.update(ollama_optimization_vars)
+    # [CORE-STD] Follow exact pattern: overwrite with the optimized values, but only
+    # the ones that differ
+    stale = {k: v for k, v in ollama_optimization_vars.items() if os.environ.get(k) != v}
+    if stale:
+        os.environ.update(stale)
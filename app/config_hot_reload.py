@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import os
 from pathlib import Path
 
 from watchfiles import awatch
@@ -8,27 +9,39 @@ from watchfiles import awatch
 from app.config_loader import ConfigRegistry
 
 
+def _polling_from_env() -> bool:
+    # Opt-in polling for mounts without native change events (network/bind mounts)
+    return os.getenv("GF_CONFIG_WATCH_POLLING", "false").lower() in ("1", "true", "yes")
+
+
 async def watch_and_reload_configs(
     directory: Path,
     registry: ConfigRegistry,
     *,
     debounce_ms: int = 200,
     stop_event: asyncio.Event | None = None,
+    force_polling: bool | None = None,
 ) -> None:
     """Watch a directory for YAML changes and hot-reload configs.
 
-    Uses watchfiles.awatch to monitor changes. Debounces bursts and refreshes
-    the in-memory registry atomically via ConfigRegistry.refresh().
+    Uses watchfiles.awatch to monitor changes. Debounces bursts and re-reads only
+    the changed files, swapping the registry atomically via
+    ConfigRegistry.apply_changes(). Native OS events (inotify/FSEvents) are used
+    unless `force_polling` is set or, when it is None, GF_CONFIG_WATCH_POLLING is
+    truthy.
     """
-    # Initial load
-    registry.load_all_configs(directory)
+    if force_polling is None:
+        force_polling = _polling_from_env()
+
+    # Initial load; parsing runs in worker threads so the event loop stays responsive
+    await registry.aload_all_configs(directory)
 
-    async for _changes in awatch(
+    async for changes in awatch(
         directory,
         debounce=debounce_ms / 1000.0,
-        force_polling=True,
+        force_polling=force_polling,
     ):
-        registry.refresh(directory)
+        await asyncio.to_thread(registry.apply_changes, directory, changes)
         if stop_event and stop_event.is_set():
             break
 
@@ -38,6 +51,7 @@ def start_config_watcher_task(
     registry: ConfigRegistry,
     *,
     debounce_ms: int = 200,
+    force_polling: bool | None = None,
 ) -> tuple[asyncio.Task[None], asyncio.Event]:
     """Start the async watcher task and return (task, stop_event)."""
     stop_event: asyncio.Event = asyncio.Event()
@@ -47,6 +61,7 @@ def start_config_watcher_task(
             registry,
             debounce_ms=debounce_ms,
             stop_event=stop_event,
+            force_polling=force_polling,
         )
     )
     return task, stop_event
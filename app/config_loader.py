@@ -1,43 +1,112 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterable
 from pathlib import Path
+from typing import Any
 
 import yaml
 
 from app.config_schema import AnalysisConfig, AnalysisType
 
+try:  # libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as _SafeLoader  # type: ignore
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _SafeLoader  # type: ignore
+
 
 class ConfigRegistry:
     """In-memory registry for analysis configurations with refresh capability."""
 
     def __init__(self) -> None:
         self._configs: dict[AnalysisType, AnalysisConfig] = {}
+        # Parsed configs keyed by path, valid while (st_mtime_ns, st_size) is unchanged
+        self._file_cache: dict[Path, tuple[int, int, AnalysisConfig]] = {}
 
     def load_config(self, path: Path) -> AnalysisConfig:
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
-        cfg = AnalysisConfig(**data)
-        return cfg
-
-    def load_all_configs(self, directory: Path) -> dict[AnalysisType, AnalysisConfig]:
-        if not directory.exists() or not directory.is_dir():
-            raise FileNotFoundError(f"Config directory not found: {directory}")
+        data = yaml.load(path.read_text(encoding="utf-8"), Loader=_SafeLoader)
+        return AnalysisConfig.model_validate(data)
+
+    def _load_entry(self, path: Path) -> tuple[int, int, AnalysisConfig]:
+        # Unchanged files reuse their parsed config; only edited ones are re-read
+        st = path.stat()
+        hit = self._file_cache.get(path)
+        if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            return hit
+        return (st.st_mtime_ns, st.st_size, self.load_config(path))
+
+    def _install(
+        self, cache: dict[Path, tuple[int, int, AnalysisConfig]]
+    ) -> dict[AnalysisType, AnalysisConfig]:
+        """Build the type mapping from per-path entries and swap it in atomically."""
         found: dict[AnalysisType, AnalysisConfig] = {}
-        for yml in sorted(directory.glob("*.yaml")):
-            cfg = self.load_config(yml)
+        for path in sorted(cache):
+            cfg = cache[path][2]
             if cfg.analysis_type in found:
                 raise ValueError(
-                    f"Duplicate analysis_type '{cfg.analysis_type.value}' in {yml.name}"
+                    f"Duplicate analysis_type '{cfg.analysis_type.value}' in {path.name}"
                 )
             found[cfg.analysis_type] = cfg
         self._configs = found
+        # Replaced wholesale so entries for deleted files are dropped
+        self._file_cache = cache
         return self._configs
 
+    def load_all_configs(self, directory: Path) -> dict[AnalysisType, AnalysisConfig]:
+        if not directory.exists() or not directory.is_dir():
+            raise FileNotFoundError(f"Config directory not found: {directory}")
+        cache = {yml: self._load_entry(yml) for yml in sorted(directory.glob("*.yaml"))}
+        return self._install(cache)
+
+    async def aload_all_configs(self, directory: Path) -> dict[AnalysisType, AnalysisConfig]:
+        """Async load_all_configs: files are read and parsed in worker threads.
+
+        Keeps file I/O and YAML parsing off the event loop; the registry swap happens
+        once every file has loaded, exactly as in the sync path.
+        """
+        if not directory.exists() or not directory.is_dir():
+            raise FileNotFoundError(f"Config directory not found: {directory}")
+        paths = sorted(directory.glob("*.yaml"))
+        entries = await asyncio.gather(*(asyncio.to_thread(self._load_entry, p) for p in paths))
+        return self._install(dict(zip(paths, entries, strict=True)))
+
     def get(self, analysis_type: AnalysisType) -> AnalysisConfig:
         return self._configs[analysis_type]
 
     def refresh(self, directory: Path) -> dict[AnalysisType, AnalysisConfig]:
         return self.load_all_configs(directory)
 
+    def apply_changes(
+        self, directory: Path, changes: Iterable[tuple[Any, str]]
+    ) -> dict[AnalysisType, AnalysisConfig]:
+        """Re-read only the YAML files named in a watch batch of (change, path) pairs.
+
+        Files that no longer exist drop out. The new mapping is built aside and swapped
+        in with one assignment; on error (invalid schema, duplicate analysis_type) the
+        previous configs stay in place.
+        """
+        if not self._file_cache:
+            # Nothing loaded yet to patch; fall back to a full load
+            return self.load_all_configs(directory)
+
+        root = directory.resolve()
+        touched: set[Path] = set()
+        for _change, raw in changes:
+            changed = Path(raw)
+            # Same scope as load_all_configs: *.yaml directly inside directory
+            if changed.suffix == ".yaml" and changed.parent.resolve() == root:
+                touched.add(directory / changed.name)
+        if not touched:
+            return self._configs
+
+        cache = dict(self._file_cache)
+        for path in touched:
+            cache.pop(path, None)
+            if path.is_file():
+                st = path.stat()
+                cache[path] = (st.st_mtime_ns, st.st_size, self.load_config(path))
+        return self._install(cache)
+
 
 # Convenience module-level helpers
 _registry = ConfigRegistry()
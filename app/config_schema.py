@@ -1,6 +1,6 @@
 from enum import Enum
 
-from pydantic import BaseModel, Field, ValidationInfo, field_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 
 
 class AnalysisType(str, Enum):
@@ -33,7 +33,18 @@ class QAStage(str, Enum):
     DOMAIN_EXPERT = "domain_expert"
 
 
+# One bit per stage so qa_stages uniqueness is checked without building a set
+_QA_STAGE_BITS: dict[QAStage, int] = {stage: 1 << i for i, stage in enumerate(QAStage)}
+
+
+# Parsed configs are shared across reloads (app.config_loader.ConfigRegistry caches them
+# per file), so every block is immutable; unknown keys are ignored rather than stored
+_CONFIG_BLOCK = ConfigDict(frozen=True, extra="ignore")
+
+
 class ModelConfiguration(BaseModel):
+    model_config = _CONFIG_BLOCK
+
     model: str = Field(description="Base model id, e.g. qwen2.5vl:32b")
     temperature: float = Field(ge=0.0, le=2.0, description="Sampling temperature")
     top_p: float = Field(ge=0.0, le=1.0, description="Top-p nucleus sampling")
@@ -49,6 +60,8 @@ class ModelConfiguration(BaseModel):
 
 
 class VisionOptimization(BaseModel):
+    model_config = _CONFIG_BLOCK
+
     max_edge_pixels: int = Field(
         ge=64,
         le=4096,
@@ -60,6 +73,8 @@ class VisionOptimization(BaseModel):
 
 
 class ParallelProcessing(BaseModel):
+    model_config = _CONFIG_BLOCK
+
     max_concurrency: int = Field(ge=1, le=64, description="Max concurrent analyses")
     worker_count: int | None = Field(
         default=None,
@@ -81,11 +96,15 @@ class ParallelProcessing(BaseModel):
 
 
 class Prompts(BaseModel):
+    model_config = _CONFIG_BLOCK
+
     system_prompt: str = Field(min_length=1, description="System prompt text")
     user_prompt: str = Field(min_length=1, description="User prompt template text")
 
 
 class ValidationConstraints(BaseModel):
+    model_config = _CONFIG_BLOCK
+
     rules: list[str] = Field(default_factory=list, description="Validation rules to enforce")
     output_format: str | None = Field(
         default=None,
@@ -102,6 +121,8 @@ class ValidationConstraints(BaseModel):
 
 
 class PerformanceTargets(BaseModel):
+    model_config = _CONFIG_BLOCK
+
     throughput_target: str | None = Field(
         default=None,
         description="Non-committal throughput target guidance (e.g., '800+ per worker acceptable')",
@@ -130,6 +151,8 @@ class PerformanceTargets(BaseModel):
 
 
 class Metadata(BaseModel):
+    model_config = _CONFIG_BLOCK
+
     name: str = Field(description="Human-friendly configuration name")
     version: str = Field(min_length=1, description="Configuration version")
     description: str = Field(description="Configuration description")
@@ -137,6 +160,8 @@ class Metadata(BaseModel):
 
 
 class AnalysisConfig(BaseModel):
+    model_config = _CONFIG_BLOCK
+
     analysis_type: AnalysisType = Field(description="One of 21 supported analysis types")
     version: str = Field(min_length=1, description="Config version identifier")
 
@@ -169,8 +194,12 @@ class AnalysisConfig(BaseModel):
     @field_validator("qa_stages")
     @classmethod
     def ensure_all_stages_unique(cls, v: list[QAStage]) -> list[QAStage]:
-        if len(v) != len(set(v)):
-            raise ValueError("qa_stages must be unique")
+        seen = 0
+        for stage in v:
+            bit = _QA_STAGE_BITS[stage]
+            if seen & bit:
+                raise ValueError("qa_stages must be unique")
+            seen |= bit
         return v
 
     @field_validator("metadata")
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import math
 import os
 
+import orjson
 from pydantic import BaseModel, Field
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -19,6 +22,14 @@ class DbSettings(BaseModel):
         ge=0,
         description="Max overflow connections beyond pool_size",
     )
+    pool_timeout: int = Field(
+        default=30, ge=1, description="Seconds to wait for a pooled connection before failing"
+    )
+    pool_recycle: int = Field(
+        default=1800,
+        ge=-1,
+        description="Recycle connections older than this many seconds (-1 disables)",
+    )
     echo: bool = Field(default=False, description="Enable SQL echo for debugging")
 
 
@@ -26,12 +37,59 @@ _engine: AsyncEngine | None = None
 _Session: async_sessionmaker[AsyncSession] | None = None
 
 
+# Applied to every new SQLite connection: WAL lets readers proceed alongside the single
+# writer, NORMAL syncs only at checkpoints, and mmap/temp_store keep page reads in memory.
+# In-memory databases report journal_mode=memory and ignore the WAL request.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_conn, _connection_record) -> None:
+    cur = dbapi_conn.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cur.execute(pragma)
+    finally:
+        cur.close()
+
+
+def pool_limits_for(max_concurrency: int) -> tuple[int, int]:
+    """(pool_size, max_overflow) sized so max_concurrency workers never queue on the pool."""
+    return math.ceil(max_concurrency * 1.2), max_concurrency
+
+
+def _json_dumps(value) -> str:
+    # Engine json_serializer for JSON/JSONB binds; OPT_NON_STR_KEYS keeps json.dumps'
+    # handling of e.g. int keys
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+_json_loads = orjson.loads
+
+
 def load_settings() -> DbSettings:
     url = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
-    pool_size = int(os.getenv("DB_POOL_SIZE", "10"))
-    max_overflow = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    # DB_MAX_CONCURRENCY derives pool limits from the expected number of concurrent
+    # DB users; explicit DB_POOL_SIZE / DB_MAX_OVERFLOW still take precedence.
+    concurrency = os.getenv("DB_MAX_CONCURRENCY")
+    size_default, overflow_default = pool_limits_for(int(concurrency)) if concurrency else (10, 20)
+    pool_size = int(os.getenv("DB_POOL_SIZE", str(size_default)))
+    max_overflow = int(os.getenv("DB_MAX_OVERFLOW", str(overflow_default)))
+    pool_timeout = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    pool_recycle = int(os.getenv("DB_POOL_RECYCLE", "1800"))
     echo = os.getenv("DB_ECHO", "false").lower() == "true"
-    return DbSettings(url=url, pool_size=pool_size, max_overflow=max_overflow, echo=echo)
+    return DbSettings(
+        url=url,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        echo=echo,
+    )
 
 
 async def get_engine() -> AsyncEngine:
@@ -43,13 +101,20 @@ async def get_engine() -> AsyncEngine:
             _engine = create_async_engine(
                 cfg.url,
                 echo=cfg.echo,
+                json_serializer=_json_dumps,
+                json_deserializer=_json_loads,
             )
+            event.listen(_engine.sync_engine, "connect", _apply_sqlite_pragmas)
         else:
             _engine = create_async_engine(
                 cfg.url,
                 echo=cfg.echo,
+                json_serializer=_json_dumps,
+                json_deserializer=_json_loads,
                 pool_size=cfg.pool_size,
                 max_overflow=cfg.max_overflow,
+                pool_timeout=cfg.pool_timeout,
+                pool_recycle=cfg.pool_recycle,
                 pool_pre_ping=True,
             )
         _Session = async_sessionmaker(_engine, expire_on_commit=False)
@@ -1,127 +1,267 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import os
 import time
 import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from typing import Any
 
-from sqlalchemy import text
+from sqlalchemy import JSON, bindparam, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.connection import get_sessionmaker
 
 
-# Simple in-process TTL cache for frequently accessed reads
+# Simple in-process TTL cache for frequently accessed reads, bounded with LRU eviction
 class _TTLCache:
-    def __init__(self, ttl_seconds: float = 5.0) -> None:
+    def __init__(self, ttl_seconds: float = 5.0, maxsize: int = 10_000) -> None:
         self.ttl = ttl_seconds
-        self.store: dict[str, tuple[float, Any]] = {}
+        # Monotonic nanoseconds: immune to wall-clock jumps, integer compare on lookup
+        self.ttl_ns = int(ttl_seconds * 1_000_000_000)
+        self.maxsize = maxsize
+        self.store: OrderedDict[str, tuple[int, Any]] = OrderedDict()
 
     def get(self, key: str) -> Any | None:
-        now = time.time()
         item = self.store.get(key)
         if not item:
             return None
         ts, value = item
-        if now - ts > self.ttl:
+        if time.monotonic_ns() - ts > self.ttl_ns:
             self.store.pop(key, None)
             return None
+        self.store.move_to_end(key)
         return value
 
     def set(self, key: str, value: Any) -> None:
-        self.store[key] = (time.time(), value)
+        self.store[key] = (time.monotonic_ns(), value)
+        self.store.move_to_end(key)
+        if len(self.store) > self.maxsize:
+            self.store.popitem(last=False)
 
     def invalidate(self, key: str) -> None:
         self.store.pop(key, None)
 
 
-_task_cache = _TTLCache(ttl_seconds=5.0)
-_audit_cache = _TTLCache(ttl_seconds=5.0)
+_task_cache = _TTLCache(ttl_seconds=5.0, maxsize=int(os.getenv("TASK_CACHE_MAX", "10000")))
+# Audit entries hold whole per-process log lists, so keep fewer of them
+_audit_cache = _TTLCache(ttl_seconds=5.0, maxsize=int(os.getenv("AUDIT_CACHE_MAX", "1000")))
 
 
-def _uuid() -> str:
-    return uuid.uuid4().hex
+class _Ambient:
+    """Session of an open TransactionManager block, shared by the DAO calls inside it."""
+
+    __slots__ = ("session", "lock", "open", "stale")
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        # An AsyncSession must not be used concurrently; DAO calls gathered inside the
+        # block (or tasks spawned from it) take turns on it
+        self.lock = asyncio.Lock()
+        self.open = True
+        # Cache keys written in the block, invalidated only once it has committed
+        self.stale: set[tuple[_TTLCache, str]] = set()
+
+
+# Enclosing TransactionManager block, if any; DAO calls made inside one share its
+# connection and transaction instead of checking out their own
+_session_var: ContextVar[_Ambient | None] = ContextVar("dao_session", default=None)
+
+
+@asynccontextmanager
+async def _session_scope() -> AsyncIterator[AsyncSession]:
+    ambient = _session_var.get()
+    if ambient is not None:
+        async with ambient.lock:
+            # Tasks copy the context, so one may outlive the block that spawned it
+            if not ambient.open:
+                raise RuntimeError("DAO call made after its TransactionManager block exited")
+            yield ambient.session
+        return
+    async with get_sessionmaker()() as session:
+        yield session
+
+
+def _ambient_session() -> AsyncSession | None:
+    ambient = _session_var.get()
+    return ambient.session if ambient is not None else None
 
 
-def _is_sqlite() -> bool:
-    url = os.getenv("DATABASE_URL", "")
-    return url.startswith("sqlite+") or url.startswith("sqlite:")
+def _in_transaction() -> bool:
+    # Reads inside a transaction may see uncommitted rows, so they skip the caches
+    return _session_var.get() is not None
 
 
-def _json_param(value: Any) -> Any:
-    if value is None:
-        return None
-    # For SQLite we must serialize to string; Postgres JSONB accepts dicts
-    return json.dumps(value) if _is_sqlite() else value
+def _invalidate(cache: _TTLCache, key: str) -> None:
+    ambient = _session_var.get()
+    if ambient is not None:
+        # Invalidating before the block commits would let an outside reader re-cache
+        # the old committed row for a full TTL
+        ambient.stale.add((cache, key))
+    else:
+        cache.invalidate(key)
+
+
+async def _commit(session: AsyncSession) -> None:
+    # The enclosing TransactionManager commits once for every call it wraps
+    if session is not _ambient_session():
+        await session.commit()
+
+
+async def _rollback(session: AsyncSession) -> None:
+    if session is not _ambient_session():
+        await session.rollback()
+
+
+def _uuid() -> str:
+    """UUIDv7 as 32 hex chars: a millisecond timestamp prefix keeps primary-key inserts
+    near the right edge of the B-tree instead of scattering them like uuid4."""
+    ts_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")  # 74 of these 80 bits are used
+    value = (
+        (ts_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76  # version
+        | ((rand >> 62) & 0xFFF) << 64
+        | 0b10 << 62  # RFC 4122 variant
+        | (rand & ((1 << 62) - 1))
+    )
+    return uuid.UUID(int=value).hex
+
+
+# Statements are built once at import; the TextClause is immutable and safe to share.
+# JSON columns bind through a JSON type so the engine's json_serializer encodes them:
+# text for SQLite, the binary jsonb codec for asyncpg. None stays SQL NULL.
+_JSON_PARAM = JSON(none_as_null=True).with_variant(JSONB(none_as_null=True), "postgresql")
+_Q_INSERT_TASK = text(
+    """
+    insert into tasks (task_id, analysis_type, status, created_at, updated_at)
+    values (:task_id, :analysis_type, :status, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+    """
+)
+_Q_UPDATE_TASK_STATUS = text(
+    """
+    update tasks set status=:status, updated_at=CURRENT_TIMESTAMP
+    where task_id=:task_id
+    """
+)
+_Q_SELECT_TASK = text(
+    """
+    select task_id, analysis_type, status, created_at, updated_at
+    from tasks where task_id=:task_id
+    """
+)
+_Q_INSERT_PROCESS_STATE = text(
+    """
+    insert into processing_state (process_id, task_id, worker_id, state, started_at)
+    values (:process_id, :task_id, :worker_id, :state, CURRENT_TIMESTAMP)
+    """
+)
+_Q_UPDATE_PROCESS_STATE = text(
+    """
+    update processing_state set state=:state, finished_at=
+        case when :state in ('completed','failed') then
+            CURRENT_TIMESTAMP
+        else finished_at end
+    where process_id=:process_id
+    """
+)
+_Q_SELECT_PROCESS_STATE = text(
+    """
+    select process_id, task_id, worker_id, state, started_at, finished_at
+    from processing_state where process_id=:process_id
+    """
+)
+_Q_INSERT_QA_ATTEMPT = text(
+    """
+    insert into qa_attempts (
+        attempt_id,
+        task_id,
+        qa_stage,
+        validation_result,
+        failure_reasons,
+        corrective_prompt_used,
+        created_at
+    ) values (
+        :attempt_id,
+        :task_id,
+        :qa_stage,
+        :validation_result,
+        :failure_reasons,
+        :corrective_prompt_used,
+        CURRENT_TIMESTAMP
+    )
+    """
+).bindparams(
+    bindparam("validation_result", type_=_JSON_PARAM),
+    bindparam("failure_reasons", type_=_JSON_PARAM),
+)
+_Q_COUNT_QA_ATTEMPTS = text("select count(*) from qa_attempts where task_id=:task_id")
+_Q_INSERT_AUDIT_LOG = text(
+    """
+    insert into audit_logs (log_id, process_id, event_type, event_data, timestamp)
+    values (:log_id, :process_id, :event_type, :event_data, CURRENT_TIMESTAMP)
+    """
+).bindparams(bindparam("event_data", type_=_JSON_PARAM))
+_Q_SELECT_AUDIT_LOGS = text(
+    """
+    select log_id, process_id, event_type, event_data, timestamp
+    from audit_logs where process_id=:process_id order by timestamp asc
+    """
+)
 
 
 class TaskStateDAO:
     async def create_task(self, analysis_type: str, status: str) -> str:
         task_id = _uuid()
-        Session = get_sessionmaker()
-        async with Session() as session:
+        async with _session_scope() as session:
             await self._create_task(session, task_id, analysis_type, status)
         return task_id
 
     async def _create_task(
         self, session: AsyncSession, task_id: str, analysis_type: str, status: str
     ) -> None:
-        q = text(
-            """
-            insert into tasks (task_id, analysis_type, status, created_at, updated_at)
-            values (:task_id, :analysis_type, :status, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-            """
-        )
         try:
             await session.execute(
-                q,
+                _Q_INSERT_TASK,
                 {
                     "task_id": task_id,
                     "analysis_type": analysis_type,
                     "status": status,
                 },
             )
-            await session.commit()
-            _task_cache.invalidate(task_id)
+            await _commit(session)
+            _invalidate(_task_cache, task_id)
         except IntegrityError as e:
-            await session.rollback()
+            await _rollback(session)
             raise e
 
     async def update_task_status(self, task_id: str, status: str) -> None:
-        Session = get_sessionmaker()
-        async with Session() as session:
-            q = text(
-                """
-                update tasks set status=:status, updated_at=CURRENT_TIMESTAMP
-                where task_id=:task_id
-                """
+        async with _session_scope() as session:
+            res = await session.execute(
+                _Q_UPDATE_TASK_STATUS, {"task_id": task_id, "status": status}
             )
-            res = await session.execute(q, {"task_id": task_id, "status": status})
-            await session.commit()
+            await _commit(session)
             if res.rowcount == 0:
                 raise KeyError(f"task not found: {task_id}")
-            _task_cache.invalidate(task_id)
+            _invalidate(_task_cache, task_id)
 
     async def get_task_by_id(self, task_id: str) -> dict[str, Any] | None:
         cached = _task_cache.get(task_id)
         if cached is not None:
             return cached
-        Session = get_sessionmaker()
-        async with Session() as session:
-            q = text(
-                """
-                select task_id, analysis_type, status, created_at, updated_at
-                from tasks where task_id=:task_id
-                """
-            )
-            res = await session.execute(q, {"task_id": task_id})
+        async with _session_scope() as session:
+            res = await session.execute(_Q_SELECT_TASK, {"task_id": task_id})
             row = res.mappings().first()
             if row is None:
                 return None
             data = dict(row)
-            _task_cache.set(task_id, data)
+            if not _in_transaction():
+                _task_cache.set(task_id, data)
             return data
 
     async def create_tasks_bulk(self, items: list[tuple[str, str, str]]) -> list[str]:
@@ -130,22 +270,17 @@ class TaskStateDAO:
         items: list of (task_id, analysis_type, status)
         Returns task_ids in the same order.
         """
-        Session = get_sessionmaker()
-        async with Session() as session:
-            q = text(
-                """
-                insert into tasks (task_id, analysis_type, status, created_at, updated_at)
-                values (:task_id, :analysis_type, :status, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                """
-            )
+        if not items:
+            return []
+        async with _session_scope() as session:
             params = [{"task_id": t, "analysis_type": a, "status": s} for (t, a, s) in items]
             try:
-                await session.execute(q, params)  # executemany
-                await session.commit()
+                await session.execute(_Q_INSERT_TASK, params)  # executemany
+                await _commit(session)
                 for t, _a, _s in items:
-                    _task_cache.invalidate(t)
+                    _invalidate(_task_cache, t)
             except IntegrityError as e:
-                await session.rollback()
+                await _rollback(session)
                 raise e
         return [t for (t, _a, _s) in items]
 
@@ -153,17 +288,10 @@ class TaskStateDAO:
 class ProcessStateDAO:
     async def create_process_state(self, task_id: str, worker_id: str, state: str) -> str:
         process_id = _uuid()
-        Session = get_sessionmaker()
-        async with Session() as session:
-            q = text(
-                """
-                insert into processing_state (process_id, task_id, worker_id, state, started_at)
-                values (:process_id, :task_id, :worker_id, :state, CURRENT_TIMESTAMP)
-                """
-            )
+        async with _session_scope() as session:
             try:
                 await session.execute(
-                    q,
+                    _Q_INSERT_PROCESS_STATE,
                     {
                         "process_id": process_id,
                         "task_id": task_id,
@@ -171,39 +299,47 @@ class ProcessStateDAO:
                         "state": state,
                     },
                 )
-                await session.commit()
+                await _commit(session)
             except IntegrityError as e:
-                await session.rollback()
+                await _rollback(session)
                 raise e
         return process_id
 
+    async def create_process_states_bulk(self, items: list[tuple[str, str, str]]) -> list[str]:
+        """Bulk create process states.
+
+        items: list of (task_id, worker_id, state)
+        Returns process_ids in the same order.
+        """
+        if not items:
+            return []
+        process_ids: list[str] = []
+        async with _session_scope() as session:
+            params = []
+            for t, w, st in items:
+                process_id = _uuid()
+                process_ids.append(process_id)
+                params.append({"process_id": process_id, "task_id": t, "worker_id": w, "state": st})
+            try:
+                await session.execute(_Q_INSERT_PROCESS_STATE, params)  # executemany
+                await _commit(session)
+            except IntegrityError as e:
+                await _rollback(session)
+                raise e
+        return process_ids
+
     async def update_process_status(self, process_id: str, state: str) -> None:
-        Session = get_sessionmaker()
-        async with Session() as session:
-            q = text(
-                """
-                update processing_state set state=:state, finished_at=
-                    case when :state in ('completed','failed') then
-                        CURRENT_TIMESTAMP
-                    else finished_at end
-                where process_id=:process_id
-                """
+        async with _session_scope() as session:
+            res = await session.execute(
+                _Q_UPDATE_PROCESS_STATE, {"process_id": process_id, "state": state}
             )
-            res = await session.execute(q, {"process_id": process_id, "state": state})
-            await session.commit()
+            await _commit(session)
             if res.rowcount == 0:
                 raise KeyError(f"process not found: {process_id}")
 
     async def get_process_by_id(self, process_id: str) -> dict[str, Any] | None:
-        Session = get_sessionmaker()
-        async with Session() as session:
-            q = text(
-                """
-                select process_id, task_id, worker_id, state, started_at, finished_at
-                from processing_state where process_id=:process_id
-                """
-            )
-            res = await session.execute(q, {"process_id": process_id})
+        async with _session_scope() as session:
+            res = await session.execute(_Q_SELECT_PROCESS_STATE, {"process_id": process_id})
             row = res.mappings().first()
             return dict(row) if row else None
 
@@ -218,52 +354,28 @@ class QAAttemptDAO:
         corrective_prompt_used: str | None = None,
     ) -> str:
         attempt_id = _uuid()
-        Session = get_sessionmaker()
-        async with Session() as session:
-            q = text(
-                """
-                insert into qa_attempts (
-                    attempt_id,
-                    task_id,
-                    qa_stage,
-                    validation_result,
-                    failure_reasons,
-                    corrective_prompt_used,
-                    created_at
-                ) values (
-                    :attempt_id,
-                    :task_id,
-                    :qa_stage,
-                    :validation_result,
-                    :failure_reasons,
-                    :corrective_prompt_used,
-                    CURRENT_TIMESTAMP
-                )
-                """
-            )
+        async with _session_scope() as session:
             try:
                 await session.execute(
-                    q,
+                    _Q_INSERT_QA_ATTEMPT,
                     {
                         "attempt_id": attempt_id,
                         "task_id": task_id,
                         "qa_stage": qa_stage,
-                        "validation_result": _json_param(validation_result),
-                        "failure_reasons": _json_param(failure_reasons),
+                        "validation_result": validation_result,
+                        "failure_reasons": failure_reasons,
                         "corrective_prompt_used": corrective_prompt_used,
                     },
                 )
-                await session.commit()
+                await _commit(session)
             except IntegrityError as e:
-                await session.rollback()
+                await _rollback(session)
                 raise e
         return attempt_id
 
     async def get_attempt_count_for_task(self, task_id: str) -> int:
-        Session = get_sessionmaker()
-        async with Session() as session:
-            q = text("select count(*) from qa_attempts where task_id=:task_id")
-            res = await session.execute(q, {"task_id": task_id})
+        async with _session_scope() as session:
+            res = await session.execute(_Q_COUNT_QA_ATTEMPTS, {"task_id": task_id})
             return int(res.scalar_one())
 
     async def log_qa_attempts_bulk(
@@ -275,30 +387,10 @@ class QAAttemptDAO:
         Each item keys: task_id, qa_stage, validation_result,
         failure_reasons, corrective_prompt_used. Returns attempt_ids.
         """
-        Session = get_sessionmaker()
+        if not items:
+            return []
         attempt_ids: list[str] = []
-        async with Session() as session:
-            q = text(
-                """
-                insert into qa_attempts (
-                    attempt_id,
-                    task_id,
-                    qa_stage,
-                    validation_result,
-                    failure_reasons,
-                    corrective_prompt_used,
-                    created_at
-                ) values (
-                    :attempt_id,
-                    :task_id,
-                    :qa_stage,
-                    :validation_result,
-                    :failure_reasons,
-                    :corrective_prompt_used,
-                    CURRENT_TIMESTAMP
-                )
-                """
-            )
+        async with _session_scope() as session:
             params = []
             for it in items:
                 attempt_id = _uuid()
@@ -308,16 +400,16 @@ class QAAttemptDAO:
                         "attempt_id": attempt_id,
                         "task_id": it["task_id"],
                         "qa_stage": it["qa_stage"],
-                        "validation_result": _json_param(it.get("validation_result")),
-                        "failure_reasons": _json_param(it.get("failure_reasons")),
+                        "validation_result": it.get("validation_result"),
+                        "failure_reasons": it.get("failure_reasons"),
                         "corrective_prompt_used": it.get("corrective_prompt_used"),
                     }
                 )
             try:
-                await session.execute(q, params)
-                await session.commit()
+                await session.execute(_Q_INSERT_QA_ATTEMPT, params)
+                await _commit(session)
             except IntegrityError as e:
-                await session.rollback()
+                await _rollback(session)
                 raise e
         return attempt_ids
 
@@ -330,28 +422,21 @@ class AuditLogDAO:
         event_data: dict[str, Any] | None = None,
     ) -> str:
         log_id = _uuid()
-        Session = get_sessionmaker()
-        async with Session() as session:
-            q = text(
-                """
-                insert into audit_logs (log_id, process_id, event_type, event_data, timestamp)
-                values (:log_id, :process_id, :event_type, :event_data, CURRENT_TIMESTAMP)
-                """
-            )
+        async with _session_scope() as session:
             try:
                 await session.execute(
-                    q,
+                    _Q_INSERT_AUDIT_LOG,
                     {
                         "log_id": log_id,
                         "process_id": process_id,
                         "event_type": event_type,
-                        "event_data": _json_param(event_data),
+                        "event_data": event_data,
                     },
                 )
-                await session.commit()
-                _audit_cache.invalidate(process_id)
+                await _commit(session)
+                _invalidate(_audit_cache, process_id)
             except IntegrityError as e:
-                await session.rollback()
+                await _rollback(session)
                 raise e
         return log_id
 
@@ -359,17 +444,11 @@ class AuditLogDAO:
         cached = _audit_cache.get(process_id)
         if cached is not None:
             return cached
-        Session = get_sessionmaker()
-        async with Session() as session:
-            q = text(
-                """
-                select log_id, process_id, event_type, event_data, timestamp
-                from audit_logs where process_id=:process_id order by timestamp asc
-                """
-            )
-            res = await session.execute(q, {"process_id": process_id})
+        async with _session_scope() as session:
+            res = await session.execute(_Q_SELECT_AUDIT_LOGS, {"process_id": process_id})
             rows = [dict(r) for r in res.mappings().all()]
-            _audit_cache.set(process_id, rows)
+            if not _in_transaction():
+                _audit_cache.set(process_id, rows)
             return rows
 
     async def create_audit_logs_bulk(
@@ -377,15 +456,10 @@ class AuditLogDAO:
         items: list[dict[str, Any]],
     ) -> list[str]:
         """Bulk insert audit logs. Each item has: process_id, event_type, event_data."""
-        Session = get_sessionmaker()
+        if not items:
+            return []
         log_ids: list[str] = []
-        async with Session() as session:
-            q = text(
-                """
-                insert into audit_logs (log_id, process_id, event_type, event_data, timestamp)
-                values (:log_id, :process_id, :event_type, :event_data, CURRENT_TIMESTAMP)
-                """
-            )
+        async with _session_scope() as session:
             params = []
             for it in items:
                 log_id = _uuid()
@@ -395,22 +469,28 @@ class AuditLogDAO:
                         "log_id": log_id,
                         "process_id": it["process_id"],
                         "event_type": it["event_type"],
-                        "event_data": _json_param(it.get("event_data")),
+                        "event_data": it.get("event_data"),
                     }
                 )
             try:
-                await session.execute(q, params)
-                await session.commit()
+                await session.execute(_Q_INSERT_AUDIT_LOG, params)
+                await _commit(session)
                 for it in items:
-                    _audit_cache.invalidate(it["process_id"])
+                    _invalidate(_audit_cache, it["process_id"])
             except IntegrityError as e:
-                await session.rollback()
+                await _rollback(session)
                 raise e
         return log_ids
 
 
 class TransactionManager:
-    """Helper to manage explicit transactions across multiple DAO calls."""
+    """Helper to manage explicit transactions across multiple DAO calls.
+
+    DAO methods called inside the block reuse its session, so they share one pooled
+    connection and commit (or roll back) together when the block exits. Concurrent
+    calls inside the block (e.g. via asyncio.gather) run one at a time; calls from a
+    task that outlives the block raise RuntimeError.
+    """
 
     def __init__(self) -> None:
         self._Session = get_sessionmaker()
@@ -418,11 +498,19 @@ class TransactionManager:
     async def __aenter__(self) -> AsyncSession:
         self._session = self._Session()  # type: ignore[attr-defined]
         await self._session.__aenter__()
+        self._ambient = _Ambient(self._session)
+        self._token = _session_var.set(self._ambient)
         return self._session
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
-        if exc is None:
-            await self._session.commit()
-        else:
-            await self._session.rollback()
+        _session_var.reset(self._token)
+        # Wait out any DAO call still running on the session, then refuse new ones
+        async with self._ambient.lock:
+            self._ambient.open = False
+            if exc is None:
+                await self._session.commit()
+                for cache, key in self._ambient.stale:
+                    cache.invalidate(key)
+            else:
+                await self._session.rollback()
         await self._session.__aexit__(exc_type, exc, tb)
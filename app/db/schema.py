@@ -32,10 +32,12 @@ tasks = Table(
     metadata,
     Column("task_id", String(64), primary_key=True),
     Column("analysis_type", String(32), nullable=False),
-    Column("status", String(32), nullable=False, index=True),
+    Column("status", String(32), nullable=False),
     Column("created_at", TIMESTAMP(timezone=True), nullable=False),
     Column("updated_at", TIMESTAMP(timezone=True), nullable=False),
     CheckConstraint("length(task_id) > 0", name="task_id_non_empty"),
+    # Leading status column still serves plain status lookups; updated_at orders polls
+    Index("ix_tasks_status_updated", "status", "updated_at"),
 )
 
 processing_state = Table(
@@ -83,11 +85,12 @@ audit_logs = Table(
         String(64),
         ForeignKey("processing_state.process_id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     ),
     Column("event_type", String(64), nullable=False),
     Column("event_data", JSON().with_variant(JSONB, "postgresql"), nullable=True),
     Column("timestamp", TIMESTAMP(timezone=True), nullable=False),
+    # Serves get_audit_logs_by_process (filter + order by timestamp) from the index
+    Index("ix_audit_logs_process_ts", "process_id", "timestamp"),
 )
 
 
@@ -3,20 +3,32 @@ from __future__ import annotations
 import asyncio
 import gzip
 import hashlib
-import json
 import os
 import shutil
 import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
+import orjson
 from pydantic import BaseModel, Field
 
 
 class CacheConfig(BaseModel):
     cache_dir: str = Field(description="Directory for cached images")
     ttl_seconds: int = Field(default=24 * 3600, ge=1, description="Time-to-live for cache entries")
-    compression: bool = Field(default=False, description="Whether to gzip compress cached images")
+    compression: bool = Field(
+        default=False,
+        description="Whether to gzip compress cached images (JPEG/PNG/GIF are stored as-is)",
+    )
+    compression_level: int = Field(
+        default=1,
+        ge=1,
+        le=9,
+        description="gzip level; JPEG payloads barely shrink, so favour speed",
+    )
     max_cache_bytes: int | None = Field(
         default=None,
         ge=1,
@@ -31,6 +43,55 @@ class CacheEntry(BaseModel):
     ttl_seconds: int = Field(ge=1, description="TTL used when cached")
     compressed: bool = Field(description="True if data_path is gzip compressed")
     size_bytes: int = Field(ge=0, description="Size of the cached payload on disk")
+    etag: str | None = Field(default=None, description="Origin ETag, for conditional refetch")
+    last_modified: str | None = Field(
+        default=None, description="Origin Last-Modified header, for conditional refetch"
+    )
+
+
+# Metas written before the optional validator fields existed still load
+_CACHE_ENTRY_FIELDS = frozenset(
+    name for name, field in CacheEntry.model_fields.items() if field.is_required()
+)
+
+# Read/write size for the gzip path; the defaults move 8-64 KiB per call, which makes
+# deflate of a multi-MiB image spend a noticeable share of its time on call overhead
+_GZIP_BUFSIZE = 1 << 20
+
+
+def _kernel_copy(src: str, dst: str) -> None:
+    """Copy src to dst without bouncing the bytes through userspace.
+
+    copy_file_range lets the kernel (or filesystem, via reflinks) do the copy. Where it
+    is unavailable or refused (non-Linux, cross-device), shutil.copyfile reopens dst and
+    uses its own sendfile/read-write path.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as f_in, open(dst, "wb") as f_out:
+                fd_in, fd_out = f_in.fileno(), f_out.fileno()
+                remaining = os.fstat(fd_in).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fd_in, fd_out, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
+
+# Leading bytes of formats whose payload is already entropy-coded; deflating them burns
+# CPU for next to no size saving
+_PRECOMPRESSED_MAGIC = (b"\xff\xd8\xff", b"\x89PNG\r\n\x1a\n", b"GIF87a", b"GIF89a")
+
+
+def _is_precompressed(path: str) -> bool:
+    with open(path, "rb") as f:
+        head = f.read(8)
+    return head.startswith(_PRECOMPRESSED_MAGIC)
 
 
 @dataclass
@@ -39,14 +100,54 @@ class _Paths:
     meta: Path
 
 
+@dataclass
+class _Scan:
+    """One pass over the cache directory, grouped by file kind and keyed by cache key."""
+
+    metas: dict[str, Path]
+    entries: dict[str, CacheEntry]  # parsed metas; invalid ones are absent
+    data: dict[Path, tuple[str, int]]  # data file -> (key, size on disk)
+    tmps: list[Path]
+
+
+def _load_meta(meta_path: Path) -> CacheEntry:
+    with open(meta_path, "rb") as f:
+        raw = f.read()
+    data = orjson.loads(raw)
+    # Trusted provenance: meta files are only written by _write_meta from the
+    # payload put() builds, so skip re-validation. Keep rejecting truncated or
+    # foreign files (callers treat the error as invalid meta).
+    if not isinstance(data, dict) or not _CACHE_ENTRY_FIELDS <= data.keys():
+        raise ValueError(f"incomplete cache meta: {meta_path}")
+    return CacheEntry.model_construct(**data)
+
+
+# Small dedicated pool for the heavy cache I/O (copies, gzip, unlinks, directory scans)
+# so bursts of it do not crowd the default executor. Shared by every ImageCache so
+# instances never leave idle threads behind. Small reads on the get()/put() hot path
+# stay on the default executor and never queue behind this pool
+_IO_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="imgcache")
+
+
 class ImageCache:
+    _META_MEMO_MAX = 1024
+    _HOT_MAX = 4096
+
     def __init__(self, cfg: CacheConfig) -> None:
         self.cfg = cfg
         Path(self.cfg.cache_dir).mkdir(parents=True, exist_ok=True)
+        self._io_pool = _IO_POOL
+        # meta path -> (st_mtime_ns, st_size, entry); a matching stat skips the file read
+        self._meta_memo: OrderedDict[str, tuple[int, int, CacheEntry]] = OrderedDict()
+        # cache key -> entry served by get() with no filesystem access; dropped by this
+        # instance's put and unlinks (files removed behind its back are not noticed)
+        self._hot: OrderedDict[str, CacheEntry] = OrderedDict()
 
     @staticmethod
     def _key(url: str) -> str:
-        return hashlib.sha256(url.encode("utf-8")).hexdigest()[:40]
+        # Identity key, not a security boundary; the digest stays SHA-256 so existing
+        # cache files keep resolving to the same names
+        return hashlib.sha256(url.encode("utf-8"), usedforsecurity=False).hexdigest()[:40]
 
     def _paths_for(self, key: str, compressed: bool) -> _Paths:
         base = Path(self.cfg.cache_dir) / key
@@ -54,206 +155,365 @@ class ImageCache:
         meta = base.with_suffix(".json")
         return _Paths(data=data, meta=meta)
 
-    async def get(self, url: str) -> CacheEntry | None:
+    async def get(self, url: str, *, allow_expired: bool = False) -> CacheEntry | None:
+        """Return the live entry for url, or None.
+
+        allow_expired also returns entries past their TTL (whose data is still on disk),
+        so a caller can revalidate them with the origin and then refresh().
+        """
         key = self._key(url)
-        # try compressed then uncompressed
-        for compressed in (self.cfg.compression, not self.cfg.compression):
-            paths = self._paths_for(key, compressed)
-            if not paths.data.exists() or not paths.meta.exists():
-                continue
-            entry = await self._read_meta(paths)
-            if entry is None:
-                continue
-            if self._is_expired(entry):
-                # Do not remove here; allow cleanup_expired() to handle deletion
-                continue
+        hot = self._hot.get(key)
+        if hot is not None:
+            if allow_expired or not self._is_expired(hot):
+                self._hot.move_to_end(key)
+                return hot
+            del self._hot[key]
+        # Meta is <key>.json either way and records whether the payload was compressed,
+        # so one stat decides a miss and the data path is only probed on a hit
+        entry = await self._read_meta(self._paths_for(key, self.cfg.compression))
+        if entry is None:
+            return None
+        expired = self._is_expired(entry)
+        if expired and not allow_expired:
+            # Do not remove expired entries here; allow cleanup_expired() to handle deletion
+            return None
+        if not os.path.exists(self._paths_for(key, entry.compressed).data):
+            return None
+        if expired:
             return entry
-        return None
+        self._hot[key] = entry
+        if len(self._hot) > self._HOT_MAX:
+            self._hot.popitem(last=False)
+        return entry
 
-    async def put(self, url: str, src_path: str) -> CacheEntry:
+    async def put(
+        self,
+        url: str,
+        src_path: str,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> CacheEntry:
         key = self._key(url)
+        self._hot.pop(key, None)
         compressed = self.cfg.compression
+        if compressed:
+            loop = asyncio.get_running_loop()
+            compressed = not await loop.run_in_executor(None, _is_precompressed, src_path)
         paths = self._paths_for(key, compressed)
 
         # ensure directory
         Path(self.cfg.cache_dir).mkdir(parents=True, exist_ok=True)
 
-        # write data
+        # write data; the copy reports its size so put() does not stat again
         if compressed:
-            await self._gzip_copy(src_path, str(paths.data))
+            size = await self._gzip_copy(src_path, str(paths.data))
         else:
-            await self._atomic_copy(src_path, str(paths.data))
-
-        size = paths.data.stat().st_size if paths.data.exists() else 0
-        entry = CacheEntry(
-            key=key,
-            data_path=str(paths.data),
-            created_at=time.time(),
-            ttl_seconds=self.cfg.ttl_seconds,
-            compressed=compressed,
-            size_bytes=size,
-        )
-        await self._write_meta(paths, entry)
-        return entry
+            size = await self._atomic_copy(src_path, str(paths.data))
+
+        # Every field is produced here from validated config and the copy itself, so the
+        # entry skips re-validation and the same dict is written as meta
+        payload = {
+            "key": key,
+            "data_path": str(paths.data),
+            "created_at": time.time(),
+            "ttl_seconds": self.cfg.ttl_seconds,
+            "compressed": compressed,
+            "size_bytes": size,
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        await self._write_meta(paths, payload)
+        # A key whose storage mode flipped (config change, or a payload now detected as
+        # precompressed) still has its data under the other suffix; the meta no longer
+        # points there, so nothing else would remove it
+        await self._unlink_many([self._paths_for(key, not compressed).data])
+        return CacheEntry.model_construct(**payload)
+
+    async def refresh(
+        self,
+        url: str,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> CacheEntry | None:
+        """Restart an entry's TTL without touching its data, e.g. after an HTTP 304.
+
+        New validators replace the stored ones when given. Returns None if the entry
+        or its data is gone, in which case the caller should download and put() again.
+        """
+        entry = await self.get(url, allow_expired=True)
+        if entry is None:
+            return None
+        payload = {
+            **entry.model_dump(),
+            "created_at": time.time(),
+            "ttl_seconds": self.cfg.ttl_seconds,
+            "etag": etag or entry.etag,
+            "last_modified": last_modified or entry.last_modified,
+        }
+        self._hot.pop(entry.key, None)
+        await self._write_meta(self._paths_for(entry.key, entry.compressed), payload)
+        return CacheEntry.model_construct(**payload)
 
     async def cleanup_expired(self) -> int:
-        removed = 0
-        base = Path(self.cfg.cache_dir)
-        for meta_path in base.glob("*.json"):
-            try:
-                entry = await self._read_meta(_Paths(data=Path(""), meta=meta_path))
-            except Exception:
-                continue
-            if entry is None:
-                continue
-            paths = self._paths_for(entry.key, entry.compressed)
-            if self._is_expired(entry):
-                await self._remove(paths)
-                removed += 1
-        return removed
+        # No mtime pre-filter: expiry comes from each entry's own created_at/ttl_seconds,
+        # which a meta file's mtime does not bound
+        return await self._sweep(self._plan_expired)
 
     async def enforce_quota(self) -> int:
         """Purge oldest entries until total size <= max_cache_bytes. Returns files removed count."""
         if not self.cfg.max_cache_bytes:
             return 0
-        base = Path(self.cfg.cache_dir)
-        entries: list[CacheEntry] = []
-        total = 0
-        for meta_path in base.glob("*.json"):
-            ce = await self._read_meta(_Paths(data=Path(""), meta=meta_path))
-            if not ce:
-                continue
-            paths = self._paths_for(ce.key, ce.compressed)
-            if not paths.data.exists():
-                continue
-            entries.append(ce)
-            total += Path(paths.data).stat().st_size
+        return await self._sweep(self._plan_quota)
 
-        if total <= self.cfg.max_cache_bytes:
-            return 0
+    async def cleanup_orphans(self) -> int:
+        """Remove orphan data/meta and temp files. Returns files removed count."""
+        return await self._sweep(self._plan_orphans)
 
-        # Sort by created_at ascending (oldest first)
-        entries.sort(key=lambda e: e.created_at)
-        removed = 0
-        idx = 0
-        while total > self.cfg.max_cache_bytes and idx < len(entries):
-            ce = entries[idx]
-            paths = self._paths_for(ce.key, ce.compressed)
-            size = Path(paths.data).stat().st_size if paths.data.exists() else 0
-            await self._remove(paths)
-            total -= size
-            removed += 1
-            idx += 1
+    async def optimize(self) -> dict:
+        """Run housekeeping: expired cleanup, orphan cleanup, and quota enforcement.
+
+        All three passes plan against one directory scan and delete in one batch.
+        """
+        scan = await self._scan_all()
+        doomed: list[Path] = []
+        expired = self._plan_expired(scan, doomed)
+        orphans = self._plan_orphans(scan, doomed)
+        purged = self._plan_quota(scan, doomed)
+        await self._unlink_many(doomed)
+        return {"expired": expired, "orphans": orphans, "purged": purged}
+
+    async def _sweep(self, plan: Callable[[_Scan, list[Path]], int]) -> int:
+        scan = await self._scan_all()
+        doomed: list[Path] = []
+        removed = plan(scan, doomed)
+        await self._unlink_many(doomed)
         return removed
 
-    async def cleanup_orphans(self) -> int:
-        """Remove orphan data/meta and temp files. Returns files removed count."""
-        base = Path(self.cfg.cache_dir)
+    def _drop(self, scan: _Scan, key: str, doomed: list[Path]) -> None:
+        """Schedule an entry's meta and data for deletion and forget it in the scan."""
+        entry = scan.entries.pop(key, None)
+        meta = scan.metas.pop(key, None)
+        if meta is not None:
+            doomed.append(meta)
+        if entry is not None:
+            data = self._paths_for(key, entry.compressed).data
+            scan.data.pop(data, None)
+            doomed.append(data)
+
+    def _plan_expired(self, scan: _Scan, doomed: list[Path]) -> int:
+        expired = [key for key, entry in scan.entries.items() if self._is_expired(entry)]
+        for key in expired:
+            self._drop(scan, key, doomed)
+        return len(expired)
+
+    def _plan_orphans(self, scan: _Scan, doomed: list[Path]) -> int:
         removed = 0
-        keys_with_meta: set[str] = set()
-        meta_map: dict[str, Path] = {}
-        for meta_path in base.glob("*.json"):
-            try:
-                ce = await self._read_meta(_Paths(data=Path(""), meta=meta_path))
-            except Exception:
-                ce = None
-            if ce is None:
-                # invalid meta, remove
-                meta_path.unlink(missing_ok=True)
+        # invalid meta
+        for key in [k for k in scan.metas if k not in scan.entries]:
+            doomed.append(scan.metas.pop(key))
+            removed += 1
+        # temp files
+        doomed.extend(scan.tmps)
+        removed += len(scan.tmps)
+        scan.tmps = []
+        # data without meta
+        for data_path, (key, _size) in list(scan.data.items()):
+            if key not in scan.metas:
+                doomed.append(data_path)
+                del scan.data[data_path]
                 removed += 1
-                continue
-            keys_with_meta.add(ce.key)
-            meta_map[ce.key] = meta_path
-
-        # remove temp files
-        for tmp in base.glob("*.tmp"):
-            tmp.unlink(missing_ok=True)
+        # meta without data; compressed may vary, so either suffix counts
+        data_keys = {key for key, _size in scan.data.values()}
+        for key in [k for k in scan.metas if k not in data_keys]:
+            doomed.append(scan.metas.pop(key))
+            scan.entries.pop(key, None)
             removed += 1
+        return removed
 
-        # remove data without meta and meta without data
-        for data_path in list(base.glob("*.jpg")) + list(base.glob("*.jpg.gz")):
-            key = (
-                data_path.stem.replace(".jpg", "") if data_path.suffix == ".jpg" else data_path.stem
-            )
-            # Construct expected meta
-            meta_path = base / f"{key}.json"
-            if not meta_path.exists():
-                data_path.unlink(missing_ok=True)
-                removed += 1
+    def _plan_quota(self, scan: _Scan, doomed: list[Path]) -> int:
+        limit = self.cfg.max_cache_bytes
+        if not limit:
+            return 0
+        sized: list[tuple[float, str, int]] = []
+        total = 0
+        for key, entry in scan.entries.items():
+            hit = scan.data.get(self._paths_for(key, entry.compressed).data)
+            if hit is None:
+                continue
+            sized.append((entry.created_at, key, hit[1]))
+            total += hit[1]
+        if total <= limit:
+            return 0
 
-        # also remove meta whose data missing (already covered in loop)
-        for key, meta_path in meta_map.items():
-            # compressed may vary; check both
-            data1 = base / f"{key}.jpg"
-            data2 = base / f"{key}.jpg.gz"
-            if not data1.exists() and not data2.exists():
-                meta_path.unlink(missing_ok=True)
-                removed += 1
+        # Oldest first
+        sized.sort()
+        removed = 0
+        for _created_at, key, size in sized:
+            if total <= limit:
+                break
+            self._drop(scan, key, doomed)
+            total -= size
+            removed += 1
         return removed
 
-    async def optimize(self) -> dict:
-        """Run housekeeping: expired cleanup, orphan cleanup, and quota enforcement."""
-        expired = await self.cleanup_expired()
-        orphans = await self.cleanup_orphans()
-        purged = await self.enforce_quota()
-        return {"expired": expired, "orphans": orphans, "purged": purged}
-
     def _is_expired(self, entry: CacheEntry) -> bool:
         return (entry.created_at + entry.ttl_seconds) < time.time()
 
-    async def _atomic_copy(self, src: str, dst: str) -> None:
+    async def _atomic_copy(self, src: str, dst: str) -> int:
+        """Copy src into place at dst and return the size written."""
         loop = asyncio.get_running_loop()
         tmp = f"{dst}.tmp"
 
-        def _copy():
+        def _copy() -> int:
             Path(tmp).unlink(missing_ok=True)
-            shutil.copyfile(src, tmp)
+            _kernel_copy(src, tmp)
+            size = os.stat(tmp).st_size
             os.replace(tmp, dst)
+            return size
 
-        await loop.run_in_executor(None, _copy)
+        return await loop.run_in_executor(self._io_pool, _copy)
 
-    async def _gzip_copy(self, src: str, dst: str) -> None:
+    async def _gzip_copy(self, src: str, dst: str) -> int:
+        """Gzip src into place at dst and return the compressed size."""
         loop = asyncio.get_running_loop()
         tmp = f"{dst}.tmp"
+        level = self.cfg.compression_level
 
-        def _copy_gz():
+        def _copy_gz() -> int:
             Path(tmp).unlink(missing_ok=True)
-            with open(src, "rb") as f_in, gzip.open(tmp, "wb", compresslevel=6) as f_out:
-                shutil.copyfileobj(f_in, f_out)
+            with (
+                open(src, "rb", buffering=_GZIP_BUFSIZE) as f_in,
+                open(tmp, "wb", buffering=_GZIP_BUFSIZE) as raw,
+                gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=level) as f_out,
+            ):
+                shutil.copyfileobj(f_in, f_out, _GZIP_BUFSIZE)
+            size = os.stat(tmp).st_size
             os.replace(tmp, dst)
+            return size
 
-        await loop.run_in_executor(None, _copy_gz)
+        return await loop.run_in_executor(self._io_pool, _copy_gz)
 
-    async def _write_meta(self, paths: _Paths, entry: CacheEntry) -> None:
+    async def _write_meta(self, paths: _Paths, payload: dict) -> None:
         loop = asyncio.get_running_loop()
         tmp = f"{paths.meta}.tmp"
-        payload = entry.model_dump()
 
         def _write():
             Path(tmp).unlink(missing_ok=True)
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(payload, f)
+            with open(tmp, "wb") as f:
+                f.write(orjson.dumps(payload))
             os.replace(tmp, paths.meta)
 
-        await loop.run_in_executor(None, _write)
+        self._meta_memo.pop(str(paths.meta), None)
+        await loop.run_in_executor(self._io_pool, _write)
+
+    async def _scan_all(self) -> _Scan:
+        """Walk the cache dir once; metas the memo cannot answer are read in one batch."""
+        loop = asyncio.get_running_loop()
+        cache_dir = self.cfg.cache_dir
+
+        def _walk():
+            metas: dict[str, tuple[Path, os.stat_result]] = {}
+            data: dict[Path, tuple[str, int]] = {}
+            tmps: list[Path] = []
+            with os.scandir(cache_dir) as it:
+                for e in it:
+                    name = e.name
+                    try:
+                        if name.endswith(".tmp"):
+                            tmps.append(Path(e.path))
+                        elif name.endswith(".json"):
+                            metas[name[: -len(".json")]] = (Path(e.path), e.stat())
+                        elif name.endswith(".jpg.gz"):
+                            data[Path(e.path)] = (name[: -len(".jpg.gz")], e.stat().st_size)
+                        elif name.endswith(".jpg"):
+                            data[Path(e.path)] = (name[: -len(".jpg")], e.stat().st_size)
+                    except FileNotFoundError:
+                        continue
+            return metas, data, tmps
+
+        metas, data, tmps = await loop.run_in_executor(self._io_pool, _walk)
+
+        entries: dict[str, CacheEntry] = {}
+        misses: list[tuple[str, Path, os.stat_result]] = []
+        for key, (meta_path, st) in metas.items():
+            hit = self._memo_get(str(meta_path), st)
+            if hit is not None:
+                entries[key] = hit
+            else:
+                misses.append((key, meta_path, st))
+
+        def _read_all() -> dict[str, CacheEntry]:
+            loaded: dict[str, CacheEntry] = {}
+            for key, meta_path, _st in misses:
+                try:
+                    loaded[key] = _load_meta(meta_path)
+                except Exception:
+                    continue  # invalid meta; left for the orphan pass
+            return loaded
+
+        if misses:
+            loaded = await loop.run_in_executor(self._io_pool, _read_all)
+            for key, meta_path, st in misses:
+                if key in loaded:
+                    entries[key] = loaded[key]
+                    self._memo_put(str(meta_path), st, loaded[key])
+
+        return _Scan(
+            metas={key: meta_path for key, (meta_path, _st) in metas.items()},
+            entries=entries,
+            data=data,
+            tmps=tmps,
+        )
+
+    def _memo_get(self, meta_key: str, st: os.stat_result) -> CacheEntry | None:
+        memo = self._meta_memo.get(meta_key)
+        if memo is None or memo[0] != st.st_mtime_ns or memo[1] != st.st_size:
+            return None
+        self._meta_memo.move_to_end(meta_key)
+        return memo[2]
+
+    def _memo_put(self, meta_key: str, st: os.stat_result, entry: CacheEntry) -> None:
+        self._meta_memo[meta_key] = (st.st_mtime_ns, st.st_size, entry)
+        self._meta_memo.move_to_end(meta_key)
+        if len(self._meta_memo) > self._META_MEMO_MAX:
+            self._meta_memo.popitem(last=False)
 
     async def _read_meta(self, paths: _Paths) -> CacheEntry | None:
+        meta_key = str(paths.meta)
+        try:
+            st = os.stat(meta_key)
+        except FileNotFoundError:
+            self._meta_memo.pop(meta_key, None)
+            return None
+        hit = self._memo_get(meta_key, st)
+        if hit is not None:
+            return hit
+
         loop = asyncio.get_running_loop()
 
         def _read() -> CacheEntry | None:
-            if not paths.meta.exists():
+            try:
+                return _load_meta(paths.meta)
+            except FileNotFoundError:
                 return None
-            with open(paths.meta, encoding="utf-8") as f:
-                data = json.load(f)
-                return CacheEntry(**data)
 
-        return await loop.run_in_executor(None, _read)
+        entry = await loop.run_in_executor(None, _read)
+        if entry is not None:
+            self._memo_put(meta_key, st, entry)
+        return entry
 
-    async def _remove(self, paths: _Paths) -> None:
+    async def _unlink_many(self, targets: list[Path]) -> None:
+        if not targets:
+            return
         loop = asyncio.get_running_loop()
 
         def _rm():
-            Path(paths.data).unlink(missing_ok=True)
-            Path(paths.meta).unlink(missing_ok=True)
+            for path in targets:
+                path.unlink(missing_ok=True)
 
-        await loop.run_in_executor(None, _rm)
+        for path in targets:
+            self._meta_memo.pop(str(path), None)
+            self._hot.pop(path.name.split(".", 1)[0], None)
+        await loop.run_in_executor(self._io_pool, _rm)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
+from dataclasses import dataclass
 
 import httpx
 from pydantic import BaseModel, Field, HttpUrl
@@ -20,63 +22,257 @@ except Exception:  # pragma: no cover
     wait_exponential_jitter = None  # type: ignore
 
 
+_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_all(fd: int, data: bytes | bytearray) -> None:
+    # Slicing a memoryview retries short writes without copying
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+# Cap per writev call; POSIX guarantees at least 16 and Linux/macOS allow 1024
+_IOV_MAX = 1024
+
+
+def _writev_all(fd: int, parts: list[bytes]) -> None:
+    """Write parts in order with gathered writes, resuming after short writes."""
+    if not hasattr(os, "writev"):  # pragma: no cover - Windows
+        for part in parts:
+            _write_all(fd, part)
+        return
+    views = [memoryview(p) for p in parts]
+    i = 0
+    while i < len(views):
+        written = os.writev(fd, views[i : i + _IOV_MAX])
+        while i < len(views) and written >= len(views[i]):
+            written -= len(views[i])
+            i += 1
+        if written:
+            views[i] = views[i][written:]
+
+
+async def _await_thread(fut: asyncio.Future):
+    # Cancelling an executor future does not stop its thread; if the caller is cancelled
+    # (e.g. a losing hedged download), let the write finish before its fd gets closed
+    try:
+        return await asyncio.shield(fut)
+    except asyncio.CancelledError:
+        await asyncio.wait({fut})
+        raise
+
+
+async def _open_dest(path: str) -> int:
+    """Open path for writing in a thread without leaking the fd if the caller is cancelled."""
+    fut = asyncio.get_running_loop().run_in_executor(None, os.open, path, _OPEN_FLAGS, 0o666)
+    try:
+        return await asyncio.shield(fut)
+    except asyncio.CancelledError:
+        # The thread opens the file regardless; close the fd nobody will receive
+        await asyncio.wait({fut})
+        if not fut.cancelled() and fut.exception() is None:
+            os.close(fut.result())
+        raise
+
+
 class DownloadConfig(BaseModel):
     timeout_seconds: float = Field(default=60.0, description="HTTP timeout")
     max_retries: int = Field(default=3, ge=0, description="Max retries per URL")
     chunk_size: int = Field(default=1024 * 128, ge=1024, description="Stream chunk size")
+    flush_threshold: int = Field(
+        default=1024 * 1024,
+        ge=1024,
+        description="Buffer streamed bytes up to this size before each file write",
+    )
+    hedge_delay_seconds: float | None = Field(
+        default=0.5,
+        ge=0,
+        description=(
+            "Start the fallback URL alongside the primary if the primary has sent no"
+            " response headers after this long (or fails); None waits for the"
+            " primary's retries first"
+        ),
+    )
     user_agent: str | None = Field(default=None, description="Optional custom UA header")
 
 
 class DownloadRequest(BaseModel):
     primary_url: HttpUrl = Field(description="Primary image URL")
     fallback_url: HttpUrl | None = Field(default=None, description="Optional fallback image URL")
+    etag: str | None = Field(
+        default=None, description="ETag of an existing copy; sent as If-None-Match"
+    )
+    last_modified: str | None = Field(
+        default=None, description="Last-Modified of an existing copy; sent as If-Modified-Since"
+    )
 
 
 class DownloadResult(BaseModel):
     path: str = Field(description="Destination file path")
     bytes_written: int = Field(ge=0, description="Total bytes written")
     from_fallback: bool = Field(description="Whether fallback URL was used")
+    not_modified: bool = Field(
+        default=False,
+        description="Server answered 304; the existing copy is current and path was not written",
+    )
+    etag: str | None = Field(default=None, description="ETag returned by the server")
+    last_modified: str | None = Field(
+        default=None, description="Last-Modified returned by the server"
+    )
+
+
+@dataclass
+class _Fetch:
+    written: int
+    not_modified: bool
+    etag: str | None
+    last_modified: str | None
+
+    def result(self, path: str, from_fallback: bool) -> DownloadResult:
+        return DownloadResult(
+            path=path,
+            bytes_written=self.written,
+            from_fallback=from_fallback,
+            not_modified=self.not_modified,
+            etag=self.etag,
+            last_modified=self.last_modified,
+        )
 
 
 class ImageDownloader:
-    def __init__(self, cfg: DownloadConfig, *, logger: logging.Logger | None = None) -> None:
+    """Downloads images with retries and an optional fallback URL.
+
+    Pass a shared `http_client` (see app.infra.http.get_shared_client) to reuse one
+    connection pool across downloads; otherwise each call opens and closes its own.
+    """
+
+    def __init__(
+        self,
+        cfg: DownloadConfig,
+        *,
+        http_client: httpx.AsyncClient | None = None,
+        logger: logging.Logger | None = None,
+    ) -> None:
         self.cfg = cfg
         self.log = logger or logging.getLogger(__name__)
+        self._http_client = http_client
+        self._headers = {"Accept": "image/*"}
+        if cfg.user_agent:
+            self._headers["User-Agent"] = cfg.user_agent
 
     async def download_to_path(self, req: DownloadRequest, dest_path: str) -> DownloadResult:
-        headers = {"Accept": "image/*"}
-        if self.cfg.user_agent:
-            headers["User-Agent"] = self.cfg.user_agent
-
-        client = httpx.AsyncClient(timeout=self.cfg.timeout_seconds, headers=headers)
+        owns_client = self._http_client is None
+        client = self._http_client or httpx.AsyncClient(
+            timeout=self.cfg.timeout_seconds, headers=self._headers
+        )
+        headers = self._headers
+        if req.etag or req.last_modified:
+            headers = dict(headers)
+            if req.etag:
+                headers["If-None-Match"] = req.etag
+            if req.last_modified:
+                headers["If-Modified-Since"] = req.last_modified
         try:
+            if req.fallback_url is not None and self.cfg.hedge_delay_seconds is not None:
+                result = await self._hedged(client, req, dest_path, headers)
+                if result is not None:
+                    return result
+                raise RuntimeError("image download failed for both primary and fallback")
+
             # try primary first with retries
-            ok, written = await self._try_url(client, str(req.primary_url), dest_path)
-            if ok:
-                return DownloadResult(path=dest_path, bytes_written=written, from_fallback=False)
+            fetch = await self._try_url(client, str(req.primary_url), dest_path, headers)
+            if fetch is not None:
+                return fetch.result(dest_path, from_fallback=False)
             # fallback if provided
             if req.fallback_url is not None:
-                ok_fb, written_fb = await self._try_url(client, str(req.fallback_url), dest_path)
-                if ok_fb:
-                    return DownloadResult(
-                        path=dest_path,
-                        bytes_written=written_fb,
-                        from_fallback=True,
-                    )
+                fetch = await self._try_url(client, str(req.fallback_url), dest_path, headers)
+                if fetch is not None:
+                    return fetch.result(dest_path, from_fallback=True)
 
             raise RuntimeError("image download failed for both primary and fallback")
         finally:
-            try:
-                await client.aclose()
-            except Exception:  # pragma: no cover
-                pass
+            if owns_client:
+                try:
+                    await client.aclose()
+                except Exception:  # pragma: no cover
+                    pass
+
+    async def _hedged(
+        self,
+        client: httpx.AsyncClient,
+        req: DownloadRequest,
+        dest_path: str,
+        headers: dict[str, str],
+    ) -> DownloadResult | None:
+        """Race primary against fallback once the primary is slow to answer or has failed.
+
+        The delay bounds the primary's time to response headers, not its body transfer,
+        so a large image that is streaming is never fetched twice. Each URL writes its
+        own temp file; the first success is moved onto dest_path and the other download
+        is cancelled.
+        """
+        parts = {False: f"{dest_path}.primary.part", True: f"{dest_path}.fallback.part"}
+        answered = asyncio.Event()
+        primary = asyncio.create_task(
+            self._try_url(client, str(req.primary_url), parts[False], headers, answered)
+        )
+        tasks = {primary: False}
+        answer_wait = asyncio.create_task(answered.wait())
+        try:
+            done, _ = await asyncio.wait(
+                {primary, answer_wait},
+                timeout=self.cfg.hedge_delay_seconds,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if answer_wait in done and primary not in done:
+                # Headers arrived in time: only a failed primary brings in the fallback
+                done, _ = await asyncio.wait({primary})
+            done.discard(answer_wait)
+            pending = set(tasks) - done
+            while True:
+                for task in done:
+                    from_fallback = tasks[task]
+                    if task.exception() is not None:
+                        self.log.warning(
+                            "%s download raised: %s",
+                            "fallback" if from_fallback else "primary",
+                            task.exception(),
+                        )
+                        continue
+                    fetch = task.result()
+                    if fetch is not None:
+                        if not fetch.not_modified:
+                            os.replace(parts[from_fallback], dest_path)
+                        return fetch.result(dest_path, from_fallback)
+                if len(tasks) == 1:  # primary slow or failed: hedge with the fallback
+                    fallback = asyncio.create_task(
+                        self._try_url(client, str(req.fallback_url), parts[True], headers)
+                    )
+                    tasks[fallback] = True
+                    pending.add(fallback)
+                if not pending:
+                    return None
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            answer_wait.cancel()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(answer_wait, *tasks, return_exceptions=True)
+            for part in parts.values():
+                try:
+                    os.unlink(part)
+                except FileNotFoundError:
+                    pass
 
     async def _try_url(
         self,
         client: httpx.AsyncClient,
         url: str,
         dest_path: str,
-    ) -> tuple[bool, int]:
+        headers: dict[str, str],
+        answered: asyncio.Event | None = None,
+    ) -> _Fetch | None:
         # Tenacity path
         if AsyncRetrying is not None and self.cfg.max_retries > 0:
             async for attempt in AsyncRetrying(
@@ -86,56 +282,71 @@ class ImageDownloader:
                 retry=retry_if_exception_type((httpx.ConnectError, httpx.ReadTimeout)),
             ):
                 with attempt:
-                    ok, written = await self._download_once(client, url, dest_path)
-                    if ok:
-                        return True, written
-            return False, 0
+                    fetch = await self._download_once(client, url, dest_path, headers, answered)
+                    if fetch is not None:
+                        return fetch
+            return None
 
         # Fallback retry
         attempts = max(1, self.cfg.max_retries or 1)
         for i in range(attempts):
             try:
-                ok, written = await self._download_once(client, url, dest_path)
-                if ok:
-                    return True, written
+                fetch = await self._download_once(client, url, dest_path, headers, answered)
+                if fetch is not None:
+                    return fetch
             except (httpx.ConnectError, httpx.ReadTimeout) as ex:  # pragma: no cover
                 self.log.warning("network error on %s attempt %d/%d: %s", url, i + 1, attempts, ex)
             await asyncio.sleep(min(2**i * 0.2, 2.0))
-        return False, 0
+        return None
 
     async def _download_once(
         self,
         client: httpx.AsyncClient,
         url: str,
         dest_path: str,
-    ) -> tuple[bool, int]:
+        headers: dict[str, str],
+        answered: asyncio.Event | None = None,
+    ) -> _Fetch | None:
+        """Fetch url into dest_path once; `answered` is set when response headers arrive."""
         self.log.info("downloading %s -> %s", url, dest_path)
         bytes_written = 0
         # Stream and write using thread to avoid sync I/O in event loop
-        async with client.stream("GET", url) as resp:
+        # Headers and timeout go per request so a shared client keeps its own defaults
+        async with client.stream(
+            "GET", url, headers=headers, timeout=self.cfg.timeout_seconds
+        ) as resp:
+            if answered is not None:
+                answered.set()
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            if resp.status_code == 304:
+                # Conditional request matched: leave dest_path alone, nothing to write
+                return _Fetch(0, True, etag, last_modified)
             if resp.status_code >= 400:
                 self.log.warning("non-200 status %s for %s", resp.status_code, url)
-                return False, 0
+                return None
 
-            # Open file synchronously in a thread
             loop = asyncio.get_running_loop()
+            # One descriptor for the whole body; O_TRUNC empties any previous attempt
+            fd = await _open_dest(dest_path)
+            # Network reads often come back shorter than chunk_size; hold on to them and
+            # hand up to flush_threshold bytes to one gathered write, without copying
+            parts: list[bytes] = []
+            pending = 0
+            try:
+                async for chunk in resp.aiter_bytes(self.cfg.chunk_size):
+                    if not chunk:
+                        continue
+                    parts.append(chunk)
+                    pending += len(chunk)
+                    bytes_written += len(chunk)
+                    if pending >= self.cfg.flush_threshold:
+                        await _await_thread(loop.run_in_executor(None, _writev_all, fd, parts))
+                        parts = []
+                        pending = 0
+                if parts:
+                    await _await_thread(loop.run_in_executor(None, _writev_all, fd, parts))
+            finally:
+                os.close(fd)
 
-            def _write_chunk(chunk: bytes) -> None:
-                with open(dest_path, "ab") as f:
-                    f.write(chunk)
-
-            # ensure file is empty before writing
-            await loop.run_in_executor(None, self._truncate_file, dest_path)
-
-            async for chunk in resp.aiter_bytes(self.cfg.chunk_size):
-                if not chunk:
-                    continue
-                await loop.run_in_executor(None, _write_chunk, chunk)
-                bytes_written += len(chunk)
-
-        return True, bytes_written
-
-    @staticmethod
-    def _truncate_file(path: str) -> None:
-        with open(path, "wb") as f:
-            f.truncate(0)
+        return _Fetch(bytes_written, False, etag, last_modified)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import math
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -51,6 +52,14 @@ class ImagePreprocessor:
 
         def _work() -> PreprocessResult:
             with Image.open(src_path) as im:
+                # JPEG only (a no-op for other formats): let libjpeg decode at the
+                # coarsest 1/2, 1/4 or 1/8 DCT scale still at least as large as the
+                # resize target, so big sources skip most of the full-size decode.
+                # EXIF rotation swaps the axes but not the scale factor.
+                w, h = im.size
+                if max(w, h) > self.cfg.max_dimension:
+                    ratio = self.cfg.max_dimension / max(w, h)
+                    im.draft(None, (math.ceil(w * ratio), math.ceil(h * ratio)))
                 img = im
                 if self.cfg.auto_orient:
                     img = ImageOps.exif_transpose(img)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import struct
 from dataclasses import dataclass
-from pathlib import Path
+from typing import BinaryIO
 
 from PIL import Image
 from pydantic import BaseModel, Field
@@ -37,17 +39,72 @@ class _ImageInfo:
     height: int
 
 
+# JPEG start-of-frame markers (SOF0-SOF15 minus DHT, JPG and DAC), which carry the size
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _sniff_jpeg(f: BinaryIO) -> _ImageInfo | None:
+    f.seek(2)
+    while True:
+        hdr = f.read(4)
+        if len(hdr) < 4 or hdr[0] != 0xFF:
+            return None
+        marker = hdr[1]
+        if marker == 0xFF:  # fill byte before the real marker
+            f.seek(-3, os.SEEK_CUR)
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            body = f.read(5)
+            if len(body) < 5:
+                return None
+            height, width = struct.unpack(">HH", body[1:5])
+            if not height or not width:
+                return None  # size deferred to a DNL segment; let PIL handle it
+            return _ImageInfo(format="JPEG", width=width, height=height)
+        (length,) = struct.unpack(">H", hdr[2:4])
+        if length < 2:
+            return None
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+def _sniff(path: str) -> _ImageInfo | None:
+    """Read format and size from the file header alone; None defers to PIL."""
+    with open(path, "rb") as f:
+        head = f.read(32)
+        if head.startswith(b"\x89PNG\r\n\x1a\n") and head[12:16] == b"IHDR":
+            width, height = struct.unpack(">II", head[16:24])
+            return _ImageInfo(format="PNG", width=width, height=height)
+        if len(head) >= 30 and head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+            chunk = head[12:16]
+            if chunk == b"VP8X":
+                width = int.from_bytes(head[24:27], "little") + 1
+                height = int.from_bytes(head[27:30], "little") + 1
+            elif chunk == b"VP8L" and head[20] == 0x2F:
+                bits = int.from_bytes(head[21:25], "little")
+                width = (bits & 0x3FFF) + 1
+                height = ((bits >> 14) & 0x3FFF) + 1
+            elif chunk == b"VP8 " and head[23:26] == b"\x9d\x01\x2a":
+                width = int.from_bytes(head[26:28], "little") & 0x3FFF
+                height = int.from_bytes(head[28:30], "little") & 0x3FFF
+            else:
+                return None
+            return _ImageInfo(format="WEBP", width=width, height=height)
+        if head.startswith(b"\xff\xd8\xff"):
+            return _sniff_jpeg(f)
+    return None
+
+
 class ImageValidator:
     def __init__(self, cfg: ValidationConfig) -> None:
         self.cfg = cfg
 
     async def validate_path(self, path: str) -> ValidationResult:
-        p = Path(path)
-        if not p.exists():
+        try:
+            size = os.stat(path).st_size
+        except FileNotFoundError:
             return ValidationResult(ok=False, reason="file not found")
 
         # size
-        size = p.stat().st_size
         if size > self.cfg.max_bytes:
             return ValidationResult(
                 ok=False,
@@ -92,6 +149,11 @@ class ImageValidator:
         loop = asyncio.get_running_loop()
 
         def _open() -> _ImageInfo:
+            # JPEG/PNG/WebP sizes sit in the first few header bytes; PIL only handles
+            # whatever the sniffer does not recognise
+            info = _sniff(path)
+            if info is not None:
+                return info
             with Image.open(path) as im:
                 fmt = (im.format or "").upper()
                 w, h = im.size
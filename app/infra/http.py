@@ -6,9 +6,32 @@ from collections.abc import AsyncIterator
 import httpx
 
 DEFAULT_TIMEOUT = httpx.Timeout(30.0)
+SHARED_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+_shared_client: httpx.AsyncClient | None = None
 
 
 @contextlib.asynccontextmanager
 async def get_async_client() -> AsyncIterator[httpx.AsyncClient]:
     async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
         yield client
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Process-wide HTTP/2 client; keep-alive connections are reused across callers.
+
+    Created lazily on first use; close it with aclose_shared_client() at shutdown.
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT, http2=True, limits=SHARED_LIMITS
+        )
+    return _shared_client
+
+
+async def aclose_shared_client() -> None:
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
@@ -1,18 +1,24 @@
-from contextlib import asynccontextmanager
+import asyncio
+import logging
+from contextlib import AsyncExitStack, asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
 from pydantic import BaseModel, Field
 
 from app import models
+from app.agents import corrective_trigger
 from app.config import apply_ollama_optimizations
 from app.config_hot_reload import start_config_watcher_task
 from app.config_loader import ConfigRegistry
+from app.infra.http import aclose_shared_client, get_shared_client
 from app.logging_config import init_logging
 from app.metrics import metrics_endpoint, metrics_middleware
 from app.models import preload_qwen_models
 from app.routes.config import router as config_router
 
+log = logging.getLogger(__name__)
+
 
 class HealthStatus(BaseModel):
     """Service health status response."""
@@ -22,6 +28,89 @@ class HealthStatus(BaseModel):
     version: str = Field(description="Service version string")
 
 
+def _preload_succeeded(task: asyncio.Task | None) -> bool:
+    # No task means the lifespan did not run (e.g. bare ASGI transport); defer to Ollama
+    if task is None:
+        return True
+    return task.done() and not task.cancelled() and task.exception() is None
+
+
+# Delay before the first preload retry, doubling up to the cap
+_PRELOAD_RETRY_INITIAL_S = 5.0
+_PRELOAD_RETRY_MAX_S = 300.0
+
+
+async def _preload_until_done() -> None:
+    """Run the model preload, retrying with capped exponential backoff until it succeeds."""
+    delay = _PRELOAD_RETRY_INITIAL_S
+    while True:
+        try:
+            await preload_qwen_models()
+            return
+        except Exception as exc:
+            # A failed attempt (e.g. Ollama still starting) must not leave /ready false forever
+            log.error("model preload failed, retrying in %.0fs: %s", delay, exc)
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, _PRELOAD_RETRY_MAX_S)
+
+
+@asynccontextmanager
+async def _model_preload(app: FastAPI):
+    # Preload required models in the background per [MODEL-CONFIG]; pulling large
+    # weights can take minutes, so /live and /metrics serve meanwhile and /ready
+    # reports false until the preload has finished
+    preload_task = asyncio.create_task(_preload_until_done())
+    app.state.preload_task = preload_task
+    try:
+        yield
+    finally:
+        preload_task.cancel()
+        await asyncio.gather(preload_task, return_exceptions=True)
+
+
+@asynccontextmanager
+async def _http_pool(app: FastAPI):
+    # One HTTP/2 connection pool for outbound calls (e.g. ImageDownloader's http_client)
+    app.state.http = get_shared_client()
+    try:
+        yield
+    finally:
+        await aclose_shared_client()
+
+
+@asynccontextmanager
+async def _config_watcher(app: FastAPI):
+    # Start config hot-reload watcher per Task 2.4; its first step is the initial load,
+    # which runs alongside the model preload
+    app.state.config_registry = ConfigRegistry()
+    configs_dir = Path(__file__).resolve().parents[1] / "configs"
+    watcher_task, stop_event = start_config_watcher_task(configs_dir, app.state.config_registry)
+    app.state._config_watcher_task = watcher_task
+    app.state._config_watcher_stop = stop_event
+    try:
+        yield
+    finally:
+        # Stop watcher gracefully
+        stop_event.set()
+        watcher_task.cancel()
+        # CancelledError is not an Exception; swallowing only Exception let it escape
+        # here and skip the remaining cleanup
+        await asyncio.gather(watcher_task, return_exceptions=True)
+
+
+@asynccontextmanager
+async def _corrective_trigger_clients(app: FastAPI):
+    # Trigger Redis clients are created lazily per URL; close whatever was opened
+    try:
+        yield
+    finally:
+        await corrective_trigger.close()
+
+
+# Startup steps in order; new ones (e.g. Redis pool warmup) slot in here
+_LIFESPAN_STEPS = (_model_preload, _http_pool, _config_watcher, _corrective_trigger_clients)
+
+
 def create_app() -> FastAPI:
     # Initialize logging first
     init_logging()
@@ -31,25 +120,13 @@ def create_app() -> FastAPI:
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
-        # Preload required models asynchronously at startup per [MODEL-CONFIG]
-        await preload_qwen_models()
-
-        # Start config hot-reload watcher per Task 2.4
-        app.state.config_registry = ConfigRegistry()
-        configs_dir = Path(__file__).resolve().parents[1] / "configs"
-        watcher_task, stop_event = start_config_watcher_task(configs_dir, app.state.config_registry)
-        app.state._config_watcher_task = watcher_task
-        app.state._config_watcher_stop = stop_event
-        try:
+        # Each startup step runs as its own background task or resource and none awaits
+        # another, so readiness tracks the slowest step instead of their sum. The exit
+        # stack unwinds them in reverse: trigger clients, watcher, HTTP pool, then preload
+        async with AsyncExitStack() as stack:
+            for step in _LIFESPAN_STEPS:
+                await stack.enter_async_context(step(app))
             yield
-        finally:
-            # Stop watcher gracefully
-            stop_event.set()
-            watcher_task.cancel()
-            try:
-                await watcher_task
-            except Exception:
-                pass
 
     app = FastAPI(title="GF-25 v3 Service", version="0.1.0", lifespan=lifespan)
 
@@ -80,7 +157,8 @@ def create_app() -> FastAPI:
     # Readiness probe: checks Ollama availability quickly
     @app.get("/ready", tags=["health"], include_in_schema=False)
     async def ready() -> dict[str, str]:
-        is_ready = await models.check_ollama_ready()
+        preload_task = getattr(app.state, "preload_task", None)
+        is_ready = _preload_succeeded(preload_task) and await models.check_ollama_ready()
         return {"ready": "true" if is_ready else "false"}
 
     return app
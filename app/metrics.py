@@ -1,3 +1,4 @@
+import os
 from collections.abc import Awaitable, Callable
 from time import perf_counter
 
@@ -10,24 +11,35 @@ REQUEST_COUNT = Counter(
     "Total HTTP requests",
     labelnames=("method", "path", "status"),
 )
+# Inference-fronting requests run from sub-second to minutes (qwen2.5vl:32b); the tail
+# buckets keep p95/p99 readable up to two minutes
+_LATENCY_TAIL = (1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 45.0, 60.0, 90.0, 120.0)
+
+# Health/readiness probes and scrapes answer in milliseconds and would otherwise pile into
+# the first bucket of the request histogram, so they get their own
+PROBE_PATHS = frozenset({"/health", "/live", "/ready", "/metrics"})
+
+
+def build_request_latency_buckets(fine_grained: bool = False) -> tuple[float, ...]:
+    """Request latency buckets; fine_grained adds resolution below 250ms."""
+    head = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5) if fine_grained else (0.05, 0.1, 0.25, 0.5)
+    return head + _LATENCY_TAIL
+
+
 REQUEST_LATENCY = Histogram(
     "http_request_duration_seconds",
     "HTTP request latency in seconds",
     labelnames=("method", "path"),
-    buckets=(
-        0.001,
-        0.005,
-        0.01,
-        0.05,
-        0.1,
-        0.25,
-        0.5,
-        1.0,
-        2.5,
-        5.0,
-        10.0,
+    buckets=build_request_latency_buckets(
+        os.getenv("FINE_GRAINED_BUCKETS", "false").lower() in ("1", "true", "yes")
     ),
 )
+PROBE_LATENCY = Histogram(
+    "http_probe_duration_seconds",
+    "Latency in seconds of health, readiness and metrics endpoints",
+    labelnames=("method", "path"),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
 IN_PROGRESS = Gauge("http_requests_in_progress", "In-progress HTTP requests")
 
 
@@ -36,21 +48,40 @@ async def metrics_endpoint() -> Response:
     return Response(content=data, media_type=CONTENT_TYPE_LATEST)
 
 
+# Label for requests no route matched (404s, probes for random URLs); raw paths would
+# mint a new time series per distinct URL
+UNMATCHED_PATH = "__unmatched__"
+
+# (method, route template) -> (latency child, status -> count child). Bounded by the
+# app's routes, so resolved .labels() children are kept for the process lifetime.
+_LABEL_CACHE: dict[tuple[str, str], tuple[Histogram, dict[str, Counter]]] = {}
+
+
+def _children(method: str, path: str) -> tuple[Histogram, dict[str, Counter]]:
+    children = _LABEL_CACHE.get((method, path))
+    if children is None:
+        histogram = PROBE_LATENCY if path in PROBE_PATHS else REQUEST_LATENCY
+        children = _LABEL_CACHE[(method, path)] = (histogram.labels(method, path), {})
+    return children
+
+
 async def metrics_middleware(request: Request, call_next: Callable[[Request], Awaitable[Response]]):
     start = perf_counter()
     IN_PROGRESS.inc()
+    status_code = 500  # reported when call_next raises
     try:
         response = await call_next(request)
+        status_code = response.status_code
         return response
     finally:
         duration = perf_counter() - start
-        REQUEST_LATENCY.labels(request.method, request.url.path).observe(duration)
-        status = getattr(request.state, "_status_code", None)
-        # If middleware runs before response creation, fallback to response status if available
-        if status is None:
-            # best effort: status_code may not be set if exception
-            status_code = getattr(response, "status_code", 500)
-        else:
-            status_code = status
-        REQUEST_COUNT.labels(request.method, request.url.path, str(status_code)).inc()
+        # Routing has run by now, so scope["route"] holds the matched template
+        path = getattr(request.scope.get("route"), "path", UNMATCHED_PATH)
+        latency, counts = _children(request.method, path)
+        latency.observe(duration)
+        status = str(status_code)
+        count = counts.get(status)
+        if count is None:
+            count = counts[status] = REQUEST_COUNT.labels(request.method, path, status)
+        count.inc()
         IN_PROGRESS.dec()
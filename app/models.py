@@ -3,6 +3,7 @@ import asyncio
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential_jitter
 
+from app.infra.http import get_shared_client
 from app.model_config import ANALYSIS_MODEL, QA_MODEL
 
 
@@ -22,31 +23,55 @@ async def _pull_model(client: httpx.AsyncClient, base_url: str, model: str) -> N
     resp.raise_for_status()
 
 
-async def _ensure_model(client: httpx.AsyncClient, base_url: str, model: str) -> None:
+@retry(wait=wait_exponential_jitter(initial=0.5, max=2.0), stop=stop_after_attempt(3))
+async def _preload_into_memory(
+    client: httpx.AsyncClient, base_url: str, model: str, keep_alive: str
+) -> None:
+    # An empty prompt makes Ollama load the weights and return without generating;
+    # keep_alive holds them in memory so the first real request skips the load
+    resp = await client.post(
+        f"{base_url}/api/generate",
+        json={"model": model, "prompt": "", "keep_alive": keep_alive},
+        timeout=300.0,
+    )
+    resp.raise_for_status()
+
+
+async def _ensure_model(
+    client: httpx.AsyncClient, base_url: str, model: str, keep_alive: str
+) -> None:
     tags = await _get_tags(client, base_url)
     if model not in tags:
         await _pull_model(client, base_url, model)
+    await _preload_into_memory(client, base_url, model, keep_alive)
 
 
 async def preload_qwen_models(
     base_url: str = "http://localhost:11434",
     concurrency: int = 8,
     transport: httpx.AsyncBaseTransport | None = None,
+    keep_alive: str = "30m",
 ) -> None:
     """Preload Qwen2.5VL models on a local Ollama server.
 
+    Pulls missing models, then loads each into memory for `keep_alive`.
     Uses up to `concurrency` tasks concurrently (default 8 per [CORE-STD]).
     """
     targets: list[str] = [ANALYSIS_MODEL.model, QA_MODEL.model]
 
     semaphore = asyncio.Semaphore(concurrency)
 
-    async def worker(model: str) -> None:
+    async def worker(client: httpx.AsyncClient, model: str) -> None:
         async with semaphore:
-            async with httpx.AsyncClient(timeout=60.0, transport=transport) as client:
-                await _ensure_model(client, base_url, model)
+            await _ensure_model(client, base_url, model, keep_alive)
 
-    await asyncio.gather(*(worker(m) for m in targets))
+    # One pool for every tags/pull call so workers share keep-alive connections
+    async with httpx.AsyncClient(
+        timeout=60.0,
+        transport=transport,
+        limits=httpx.Limits(max_keepalive_connections=16, keepalive_expiry=15.0),
+    ) as client:
+        await asyncio.gather(*(worker(client, m) for m in targets))
 
 
 async def check_ollama_ready(
@@ -56,9 +81,14 @@ async def check_ollama_ready(
 ) -> bool:
     """Return True if Ollama responds to /api/tags within timeout.
 
-    Any non-2xx or exception is considered not ready.
+    Any non-2xx or exception is considered not ready. Without a custom transport
+    the probe goes through the process-wide shared client, so frequent readiness
+    polls reuse a pooled connection.
     """
     try:
+        if transport is None:
+            resp = await get_shared_client().get(f"{base_url}/api/tags", timeout=timeout)
+            return 200 <= resp.status_code < 300
         async with httpx.AsyncClient(timeout=timeout, transport=transport) as client:
             resp = await client.get(f"{base_url}/api/tags")
             return 200 <= resp.status_code < 300
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import re
 from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from app.config_loader import ConfigRegistry
@@ -22,16 +24,31 @@ class PreparedRun:
     config_version: str
 
 
+@lru_cache(maxsize=256)
+def _split_template(template: str, keys: tuple[str, ...]) -> tuple[str, ...]:
+    """Split template into [text, key, text, key, ..., text] around placeholder keys.
+
+    Templates come from a bounded set of configs, so splits are cached per key set.
+    """
+    # Longest first so a key that prefixes another cannot shadow it
+    alternation = "|".join(map(re.escape, sorted(keys, key=len, reverse=True)))
+    return tuple(re.split(f"({alternation})", template))
+
+
 def render_prompt(template: str, placeholders: Mapping[str, str]) -> str:
     """Render a prompt template with simple key replacement.
 
-    We intentionally keep templating minimal (string replace) to avoid
-    introducing a runtime dependency; tests validate prompt presence.
+    We intentionally keep templating minimal (no template engine) to avoid
+    introducing a runtime dependency; tests validate prompt presence. Keys are
+    substituted in one pass, so large values (the base64 image) are copied once
+    and never rescanned for other keys.
     """
-    rendered = template
-    for key, value in placeholders.items():
-        rendered = rendered.replace(key, value)
-    return rendered
+    keys = tuple(key for key in placeholders if key)
+    if not keys:
+        return template
+    pieces = list(_split_template(template, keys))
+    pieces[1::2] = [placeholders[key] for key in pieces[1::2]]
+    return "".join(pieces)
 
 
 def model_params_from_config(cfg: AnalysisConfig) -> dict[str, Any]:
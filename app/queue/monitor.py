@@ -27,6 +27,26 @@ class Alert(BaseModel):
 AlertCallback = Callable[[Alert], None]
 
 
+def _build_queue_names() -> tuple[str, ...]:
+    names: list[str] = []
+    # Analysis
+    for t in AnalysisType:
+        names.append(analysis_queue_name(t))
+    # Corrective (3 x 21)
+    for stage in (QAStage.STRUCTURAL, QAStage.CONTENT_QUALITY, QAStage.DOMAIN_EXPERT):
+        for t in AnalysisType:
+            names.append(corrective_queue_name(stage, t))
+    # Management (3)
+    names.append(management_manual_review_queue())
+    names.append(management_priority_processing_queue())
+    names.append(management_batch_completion_queue())
+    return tuple(names)
+
+
+# The enums are fixed at import, so every monitor tick samples the same 87 queues
+_ALL_QUEUE_NAMES = _build_queue_names()
+
+
 class QueueMonitor:
     def __init__(self, on_alert: AlertCallback | None = None) -> None:
         self._analysis_reg = QueueRegistry()
@@ -34,26 +54,17 @@ class QueueMonitor:
         self._on_alert = on_alert
 
     def all_queue_names(self) -> list[str]:
-        names: list[str] = []
-        # Analysis
-        for t in AnalysisType:
-            names.append(analysis_queue_name(t))
-        # Corrective (3 x 21)
-        for stage in (QAStage.STRUCTURAL, QAStage.CONTENT_QUALITY, QAStage.DOMAIN_EXPERT):
-            for t in AnalysisType:
-                names.append(corrective_queue_name(stage, t))
-        # Management (3)
-        names.append(management_manual_review_queue())
-        names.append(management_priority_processing_queue())
-        names.append(management_batch_completion_queue())
-        return names
+        return list(_ALL_QUEUE_NAMES)
 
     async def sample_lengths(self) -> dict[str, int]:
         client = await get_client()
-        lengths: dict[str, int] = {}
-        for q in self.all_queue_names():
-            lengths[q] = await client.llen(q)
-        return lengths
+        names = _ALL_QUEUE_NAMES
+        # One round trip for every LLEN; reads need no MULTI/EXEC
+        async with client.pipeline(transaction=False) as pipe:
+            for q in names:
+                pipe.llen(q)
+            results = await pipe.execute()
+        return dict(zip(names, results, strict=True))
 
     async def check_alerts(self, thresholds: dict[str, tuple[int, str]]) -> list[Alert]:
         """
@@ -2,17 +2,61 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from dataclasses import dataclass
+from enum import Enum
+from typing import TypeVar
 
+import orjson
 from pydantic import BaseModel, Field
 
 from app.config_schema import AnalysisType
 from app.queue.redis_client import get_client
 
+_M = TypeVar("_M", bound=BaseModel)
+_ENUM_FIELDS: dict[type[BaseModel], tuple[tuple[str, type[Enum]], ...]] = {}
+
+
+def _encode(item: BaseModel) -> bytes | str:
+    """Serialize a queue item without Pydantic's serializer walk."""
+    try:
+        # Queue item fields are JSON-native or str enums, which orjson handles
+        return orjson.dumps(item.__dict__, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # Free-form payload values orjson cannot encode (sets, Decimal, bytes, nested
+        # models) take Pydantic's serializer, which yields the same wire format
+        return item.model_dump_json()
+
+
+def _decode(model: type[_M], raw: bytes | str) -> _M:
+    """Rebuild a queue item without validation; producers are this module's enqueues.
+
+    Untrusted input should keep using model.model_validate_json.
+    """
+    data = orjson.loads(raw)
+    enum_fields = _ENUM_FIELDS.get(model)
+    if enum_fields is None:
+        enum_fields = tuple(
+            (name, f.annotation)
+            for name, f in model.model_fields.items()
+            if isinstance(f.annotation, type) and issubclass(f.annotation, Enum)
+        )
+        _ENUM_FIELDS[model] = enum_fields
+    # model_construct skips coercion, so restore enum members the validator would produce
+    for name, enum_cls in enum_fields:
+        if name in data:
+            data[name] = enum_cls(data[name])
+    return model.model_construct(**data)
+
 
 def analysis_queue_name(analysis_type: AnalysisType) -> str:
     return f"analysis:{analysis_type.value}"
 
 
+# The enums are fixed at import, so queue names are formatted once here; the functions
+# stay for callers outside the hot path
+_ALL_ANALYSIS_TYPES: tuple[AnalysisType, ...] = tuple(AnalysisType)
+_ANALYSIS_QUEUE_NAMES: tuple[str, ...] = tuple(analysis_queue_name(t) for t in AnalysisType)
+
+
 class QueueItem(BaseModel):
     """Base queue item schema (extend later for corrective/management)."""
 
@@ -24,16 +68,18 @@ class QueueItem(BaseModel):
 class QueueRegistry:
     """Registry for analysis queues."""
 
-    analysis_types: Iterable[AnalysisType] = tuple(AnalysisType)
+    analysis_types: Iterable[AnalysisType] = _ALL_ANALYSIS_TYPES
 
     def all_analysis_queue_names(self) -> list[str]:
+        if self.analysis_types is _ALL_ANALYSIS_TYPES:
+            return list(_ANALYSIS_QUEUE_NAMES)
         return [analysis_queue_name(t) for t in self.analysis_types]
 
     async def enqueue(self, queue: str, item: QueueItem) -> int:
         """Push an item to a queue (tail). Returns new length."""
         client = await get_client()
         # Use RPUSH to enqueue at tail
-        return await client.rpush(queue, item.model_dump_json())
+        return await client.rpush(queue, _encode(item))
 
     async def dequeue(self, queue: str, timeout: int = 0) -> QueueItem | None:
         """Pop an item from a queue (blocking when timeout>0)."""
@@ -48,7 +94,7 @@ class QueueRegistry:
             raw = await client.lpop(queue)
             if raw is None:
                 return None
-        return QueueItem.model_validate_json(raw)
+        return _decode(QueueItem, raw)
 
     async def length(self, queue: str) -> int:
         client = await get_client()
@@ -63,6 +109,11 @@ def corrective_queue_name(stage: QAStage, analysis_type: AnalysisType) -> str:
     return f"corrective:{stage.value}:{analysis_type.value}"
 
 
+_CORRECTIVE_QUEUE_NAMES: dict[tuple[QAStage, AnalysisType], str] = {
+    (s, t): corrective_queue_name(s, t) for s in QAStage for t in AnalysisType
+}
+
+
 def management_manual_review_queue() -> str:
     return "mgmt:manual_review"
 
@@ -92,9 +143,39 @@ class ManagementQueueItem(BaseModel):
     meta: dict = Field(default_factory=dict, description="Additional metadata")
 
 
+async def _rpush_grouped(groups: dict[str, list[bytes | str]]) -> dict[str, int]:
+    if not groups:
+        return {}
+    client = await get_client()
+    # Non-transactional: each RPUSH is atomic on its own, we only want one round trip
+    async with client.pipeline(transaction=False) as pipe:
+        for qname, payloads in groups.items():
+            pipe.rpush(qname, *payloads)
+        lengths = await pipe.execute()
+    return dict(zip(groups, lengths, strict=True))
+
+
+async def _mpop(keys: list[str], timeout: int, count: int) -> tuple[str, list[bytes | str]] | None:
+    """Pop up to count items from the first non-empty list in keys (Redis >= 7.0)."""
+    if not keys:
+        return None
+    client = await get_client()
+    # LEFT keeps the FIFO order RPUSH producers expect, as the non-blocking LPOP does
+    if timeout > 0:
+        res = await client.blmpop(timeout, len(keys), *keys, direction="LEFT", count=count)
+    else:
+        res = await client.lmpop(len(keys), *keys, direction="LEFT", count=count)
+    if not res:
+        return None
+    qname, raws = res
+    if isinstance(qname, bytes):
+        qname = qname.decode()
+    return qname, raws
+
+
 @dataclass
 class CorrectiveAndManagementRegistry:
-    analysis_types: Iterable[AnalysisType] = tuple(AnalysisType)
+    analysis_types: Iterable[AnalysisType] = _ALL_ANALYSIS_TYPES
 
     # Corrective
     async def enqueue_corrective(
@@ -104,9 +185,22 @@ class CorrectiveAndManagementRegistry:
         item: CorrectiveQueueItem,
     ) -> int:
         client = await get_client()
-        qname = corrective_queue_name(stage, analysis_type)
-        payload = item.model_dump_json()
-        return await client.rpush(qname, payload)
+        qname = _CORRECTIVE_QUEUE_NAMES[stage, analysis_type]
+        return await client.rpush(qname, _encode(item))
+
+    async def enqueue_corrective_many(
+        self,
+        items: Iterable[tuple[QAStage, AnalysisType, CorrectiveQueueItem]],
+    ) -> dict[str, int]:
+        """Push many corrective items; one variadic RPUSH per queue in a single round trip.
+
+        Returns the new length of each queue that received items.
+        """
+        groups: dict[str, list[bytes | str]] = {}
+        for stage, analysis_type, item in items:
+            qname = _CORRECTIVE_QUEUE_NAMES[stage, analysis_type]
+            groups.setdefault(qname, []).append(_encode(item))
+        return await _rpush_grouped(groups)
 
     async def dequeue_corrective(
         self,
@@ -115,7 +209,7 @@ class CorrectiveAndManagementRegistry:
         timeout: int = 0,
     ) -> CorrectiveQueueItem | None:
         client = await get_client()
-        q = corrective_queue_name(stage, analysis_type)
+        q = _CORRECTIVE_QUEUE_NAMES[stage, analysis_type]
         if timeout > 0:
             res = await client.brpop(q, timeout=timeout)
             if res is None:
@@ -125,16 +219,72 @@ class CorrectiveAndManagementRegistry:
             raw = await client.lpop(q)
             if raw is None:
                 return None
-        return CorrectiveQueueItem.model_validate_json(raw)
+        return _decode(CorrectiveQueueItem, raw)
+
+    async def dequeue_any_corrective(
+        self,
+        stage: QAStage,
+        analysis_types: Iterable[AnalysisType] | None = None,
+        timeout: int = 0,
+        count: int = 1,
+    ) -> tuple[AnalysisType, list[CorrectiveQueueItem]] | None:
+        """Pop from whichever of the stage's queues has work, in one round trip.
+
+        Queues are tried in analysis_types order (default: self.analysis_types); blocks
+        up to timeout seconds when timeout > 0. Returns the source type and its items.
+        """
+        by_queue = {
+            _CORRECTIVE_QUEUE_NAMES[stage, t]: t
+            for t in (self.analysis_types if analysis_types is None else analysis_types)
+        }
+        res = await _mpop(list(by_queue), timeout, count)
+        if res is None:
+            return None
+        qname, raws = res
+        return by_queue[qname], [_decode(CorrectiveQueueItem, raw) for raw in raws]
 
     async def length_corrective(self, stage: QAStage, analysis_type: AnalysisType) -> int:
         client = await get_client()
-        return await client.llen(corrective_queue_name(stage, analysis_type))
+        return await client.llen(_CORRECTIVE_QUEUE_NAMES[stage, analysis_type])
 
     # Management
+    async def enqueue_management_many(
+        self, items: Iterable[tuple[str, ManagementQueueItem]]
+    ) -> dict[str, int]:
+        """Push many (queue name, item) pairs, e.g. management_manual_review_queue().
+
+        Same batching as enqueue_corrective_many; returns new lengths per queue.
+        """
+        groups: dict[str, list[bytes | str]] = {}
+        for qname, item in items:
+            groups.setdefault(qname, []).append(_encode(item))
+        return await _rpush_grouped(groups)
+
+    async def dequeue_any_management(
+        self,
+        queues: Iterable[str] | None = None,
+        timeout: int = 0,
+        count: int = 1,
+    ) -> tuple[str, list[ManagementQueueItem]] | None:
+        """Pop from the first non-empty management queue, in one round trip.
+
+        Queues default to manual review, priority processing, then batch completion.
+        """
+        if queues is None:
+            queues = (
+                management_manual_review_queue(),
+                management_priority_processing_queue(),
+                management_batch_completion_queue(),
+            )
+        res = await _mpop(list(queues), timeout, count)
+        if res is None:
+            return None
+        qname, raws = res
+        return qname, [_decode(ManagementQueueItem, raw) for raw in raws]
+
     async def enqueue_manual_review(self, item: ManagementQueueItem) -> int:
         client = await get_client()
-        return await client.rpush(management_manual_review_queue(), item.model_dump_json())
+        return await client.rpush(management_manual_review_queue(), _encode(item))
 
     async def dequeue_manual_review(self, timeout: int = 0) -> ManagementQueueItem | None:
         client = await get_client()
@@ -148,7 +298,7 @@ class CorrectiveAndManagementRegistry:
             raw = await client.lpop(q)
             if raw is None:
                 return None
-        return ManagementQueueItem.model_validate_json(raw)
+        return _decode(ManagementQueueItem, raw)
 
     async def length_manual_review(self) -> int:
         client = await get_client()
@@ -156,7 +306,7 @@ class CorrectiveAndManagementRegistry:
 
     async def enqueue_priority(self, item: ManagementQueueItem) -> int:
         client = await get_client()
-        return await client.rpush(management_priority_processing_queue(), item.model_dump_json())
+        return await client.rpush(management_priority_processing_queue(), _encode(item))
 
     async def dequeue_priority(self, timeout: int = 0) -> ManagementQueueItem | None:
         client = await get_client()
@@ -170,7 +320,7 @@ class CorrectiveAndManagementRegistry:
             raw = await client.lpop(q)
             if raw is None:
                 return None
-        return ManagementQueueItem.model_validate_json(raw)
+        return _decode(ManagementQueueItem, raw)
 
     async def length_priority(self) -> int:
         client = await get_client()
@@ -178,7 +328,7 @@ class CorrectiveAndManagementRegistry:
 
     async def enqueue_batch_completion(self, item: ManagementQueueItem) -> int:
         client = await get_client()
-        return await client.rpush(management_batch_completion_queue(), item.model_dump_json())
+        return await client.rpush(management_batch_completion_queue(), _encode(item))
 
     async def dequeue_batch_completion(self, timeout: int = 0) -> ManagementQueueItem | None:
         client = await get_client()
@@ -192,7 +342,7 @@ class CorrectiveAndManagementRegistry:
             raw = await client.lpop(q)
             if raw is None:
                 return None
-        return ManagementQueueItem.model_validate_json(raw)
+        return _decode(ManagementQueueItem, raw)
 
     async def length_batch_completion(self) -> int:
         client = await get_client()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from collections.abc import Awaitable, Callable
 from typing import Any
@@ -7,7 +8,7 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from app.api.goflow_client import GoFlowClient
-from app.api.goflow_models import Job, JobStatusUpdate, ReportRequest, ResultPayload
+from app.api.goflow_models import Job, JobStatus, JobStatusUpdate, ReportRequest, ResultPayload
 
 
 class ProcessResult(BaseModel):
@@ -27,6 +28,9 @@ class GoFlowWorkflow:
         async with GoFlowClient(cfg) as client:
             wf = GoFlowWorkflow(client)
             await wf.run_once(process_fn)
+
+        # or, with a shared connection pool started in the app lifespan:
+        wf = GoFlowWorkflow(factory.client())
     """
 
     def __init__(self, client: GoFlowClient, *, logger: logging.Logger | None = None) -> None:
@@ -49,14 +53,18 @@ class GoFlowWorkflow:
 
         self.log.info("acquired job: %s", job.job_id)
 
-        # Update status: in progress
-        await self._safe_status_update(
-            job.project_id, JobStatusUpdate(status="in_progress", progress=0.0)
+        # Update status: in progress. Nothing depends on its response, so the round trip
+        # overlaps with processing; it is awaited before any later status is sent.
+        in_progress = asyncio.create_task(
+            self._safe_status_update(
+                job.project_id, JobStatusUpdate(status=JobStatus.IN_PROGRESS, progress=0.0)
+            )
         )
 
         try:
             # Process job via user provided function
             pr = await process_fn(job)
+            await in_progress
             # Submit result
             payload = ResultPayload(
                 project_id=job.project_id,
@@ -77,15 +85,21 @@ class GoFlowWorkflow:
 
             # Final status: completed
             await self._safe_status_update(
-                job.project_id, JobStatusUpdate(status="completed", progress=1.0)
+                job.project_id, JobStatusUpdate(status=JobStatus.COMPLETED, progress=1.0)
             )
             return True
         except Exception as ex:  # pragma: no cover - exercised in tests via fake exception
             self.log.exception("job processing failed: %s", ex)
+            await in_progress
             await self._safe_status_update(
-                job.project_id, JobStatusUpdate(status="failed", detail=str(ex))
+                job.project_id, JobStatusUpdate(status=JobStatus.FAILED, detail=str(ex))
             )
             return True
+        finally:
+            # Cancelled mid-processing (e.g. shutdown): do not leave the update orphaned
+            if not in_progress.done():
+                in_progress.cancel()
+                await asyncio.gather(in_progress, return_exceptions=True)
 
     async def _safe_status_update(self, project_id: str, update: JobStatusUpdate) -> None:
         try:
@@ -82,3 +82,29 @@ async def test_hot_reload_refreshes_registry(tmp_path: Path, monkeypatch):
         await task
     except asyncio.CancelledError:
         pass
+
+
+@pytest.mark.asyncio
+async def test_watcher_polling_defaults_off_and_env_enables(tmp_path: Path, monkeypatch):
+    seen: list[bool] = []
+
+    async def fake_awatch(_directory, debounce, force_polling):  # noqa: ARG001
+        seen.append(force_polling)
+        return
+        yield  # pragma: no cover - makes this an async generator
+
+    monkeypatch.setattr(config_hot_reload, "awatch", fake_awatch)
+
+    async def no_load(self, directory):  # type: ignore[no-untyped-def]  # noqa: ARG001
+        return {}
+
+    monkeypatch.setattr(ConfigRegistry, "aload_all_configs", no_load)
+    reg = ConfigRegistry()
+
+    monkeypatch.delenv("GF_CONFIG_WATCH_POLLING", raising=False)
+    await watch_and_reload_configs(tmp_path, reg)
+    monkeypatch.setenv("GF_CONFIG_WATCH_POLLING", "1")
+    await watch_and_reload_configs(tmp_path, reg)
+    await watch_and_reload_configs(tmp_path, reg, force_polling=False)
+
+    assert seen == [False, True, False]
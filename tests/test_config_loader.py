@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 import pytest
@@ -60,6 +61,65 @@ def test_load_all_configs_and_get(tmp_path: Path):
     assert reg.get(AnalysisType.AGES).analysis_type == AnalysisType.AGES
 
 
+def test_reload_reuses_unchanged_files(tmp_path: Path):
+    a = tmp_path / "activities.yaml"
+    b = tmp_path / "ages.yaml"
+    d_b = VALID_YAML.copy()
+    d_b["analysis_type"] = "ages"
+    write_yaml(a, VALID_YAML)
+    write_yaml(b, d_b)
+
+    reg = ConfigRegistry()
+    first = dict(reg.load_all_configs(tmp_path))
+
+    d_b["version"] = "1.0.1"
+    write_yaml(b, d_b)
+    st = b.stat()
+    os.utime(b, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    second = reg.refresh(tmp_path)
+
+    # Untouched file keeps its parsed object; the edited one is re-read
+    assert second[AnalysisType.ACTIVITIES] is first[AnalysisType.ACTIVITIES]
+    assert second[AnalysisType.AGES].version == "1.0.1"
+
+
+def test_apply_changes_rereads_only_changed_files(tmp_path: Path):
+    a = tmp_path / "activities.yaml"
+    b = tmp_path / "ages.yaml"
+    d_b = VALID_YAML.copy()
+    d_b["analysis_type"] = "ages"
+    write_yaml(a, VALID_YAML)
+    write_yaml(b, d_b)
+
+    reg = ConfigRegistry()
+    first = dict(reg.load_all_configs(tmp_path))
+
+    d_b["version"] = "2.0.0"
+    write_yaml(b, d_b)
+    updated = reg.apply_changes(
+        tmp_path, {("modified", str(b)), ("modified", str(tmp_path / "notes.txt"))}
+    )
+    assert updated[AnalysisType.ACTIVITIES] is first[AnalysisType.ACTIVITIES]
+    assert updated[AnalysisType.AGES].version == "2.0.0"
+
+    a.unlink()
+    remaining = reg.apply_changes(tmp_path, {("deleted", str(a))})
+    assert set(remaining) == {AnalysisType.AGES}
+
+
+@pytest.mark.asyncio
+async def test_aload_all_configs_matches_sync_load(tmp_path: Path):
+    d_b = VALID_YAML.copy()
+    d_b["analysis_type"] = "ages"
+    write_yaml(tmp_path / "activities.yaml", VALID_YAML)
+    write_yaml(tmp_path / "ages.yaml", d_b)
+
+    reg = ConfigRegistry()
+    loaded = await reg.aload_all_configs(tmp_path)
+    assert set(loaded) == {AnalysisType.ACTIVITIES, AnalysisType.AGES}
+    assert ConfigRegistry().load_all_configs(tmp_path) == loaded
+
+
 def test_invalid_schema_raises(tmp_path: Path):
     bad = tmp_path / "activities.yaml"
     data = VALID_YAML.copy()
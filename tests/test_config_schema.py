@@ -61,8 +61,8 @@ def test_valid_config_passes():
 
 def test_invalid_duplicate_qa_stages_rejected():
     cfg = make_valid_config()
-    # Introduce duplicates
-    cfg.qa_stages = [QAStage.STRUCTURAL, QAStage.STRUCTURAL]
+    # Introduce duplicates (configs are frozen, so copy without validation)
+    cfg = cfg.model_copy(update={"qa_stages": [QAStage.STRUCTURAL, QAStage.STRUCTURAL]})
     with pytest.raises(ValueError):
         # re-validate by constructing again
         AnalysisConfig(**cfg.model_dump())
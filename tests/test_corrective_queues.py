@@ -7,15 +7,44 @@ from app.config_schema import AnalysisType, QAStage
 from app.queue.queues import (
     CorrectiveAndManagementRegistry,
     CorrectiveQueueItem,
+    ManagementQueueItem,
+    corrective_queue_name,
+    management_batch_completion_queue,
+    management_manual_review_queue,
+    management_priority_processing_queue,
 )
 
 
+class FakePipeline:
+    def __init__(self, queue: "FakeQueue") -> None:
+        self._queue = queue
+        self._ops: list[tuple[str, tuple[str, ...]]] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    def rpush(self, q: str, *values: str) -> "FakePipeline":
+        self._ops.append((q, values))
+        return self
+
+    async def execute(self) -> list[int]:
+        self._queue.round_trips += 1
+        return [await self._queue.rpush(q, *values) for q, values in self._ops]
+
+
 class FakeQueue:
     def __init__(self):
         self.store: dict[str, list[str]] = {}
+        self.round_trips = 0
 
-    async def rpush(self, q: str, value: str) -> int:
-        self.store.setdefault(q, []).append(value)
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def rpush(self, q: str, *values: str) -> int:
+        self.store.setdefault(q, []).extend(values)
         return len(self.store[q])
 
     async def lpop(self, q: str):
@@ -23,6 +52,17 @@ class FakeQueue:
             return None
         return self.store[q].pop(0)
 
+    async def lmpop(self, num_keys: int, *keys: str, direction: str, count: int = 1):
+        assert direction == "LEFT" and num_keys == len(keys)
+        for q in keys:
+            if self.store.get(q):
+                popped, self.store[q] = self.store[q][:count], self.store[q][count:]
+                return [q, popped]
+        return None
+
+    async def blmpop(self, timeout: float, numkeys: int, *keys: str, direction: str, count=1):
+        return await self.lmpop(numkeys, *keys, direction=direction, count=count)
+
     async def brpop(self, q: str, timeout: int = 0):
         if q not in self.store or not self.store[q]:
             return None
@@ -54,3 +94,100 @@ async def test_corrective_enqueue_dequeue_and_length(monkeypatch):
     out = await reg.dequeue_corrective(QAStage.STRUCTURAL, AnalysisType.AGES)
     assert out and out.task_id == "t1"
     assert await reg.length_corrective(QAStage.STRUCTURAL, AnalysisType.AGES) == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_enqueue_groups_by_queue_in_one_round_trip(monkeypatch):
+    fake = FakeQueue()
+    monkeypatch.setattr(queues_mod, "get_client", lambda: asyncio.sleep(0, result=fake))
+
+    reg = CorrectiveAndManagementRegistry()
+
+    def corrective(task_id: str, at: AnalysisType) -> CorrectiveQueueItem:
+        return CorrectiveQueueItem(
+            task_id=task_id, analysis_type=at, stage=QAStage.STRUCTURAL, original_output="{}"
+        )
+
+    lengths = await reg.enqueue_corrective_many(
+        [
+            (QAStage.STRUCTURAL, AnalysisType.AGES, corrective("a1", AnalysisType.AGES)),
+            (QAStage.STRUCTURAL, AnalysisType.AGES, corrective("a2", AnalysisType.AGES)),
+            (QAStage.STRUCTURAL, AnalysisType.COLORS, corrective("c1", AnalysisType.COLORS)),
+        ]
+    )
+    assert fake.round_trips == 1
+    assert lengths == {
+        corrective_queue_name(QAStage.STRUCTURAL, AnalysisType.AGES): 2,
+        corrective_queue_name(QAStage.STRUCTURAL, AnalysisType.COLORS): 1,
+    }
+    first = await reg.dequeue_corrective(QAStage.STRUCTURAL, AnalysisType.AGES)
+    assert first and first.task_id == "a1"
+
+    lengths = await reg.enqueue_management_many(
+        [
+            (management_manual_review_queue(), ManagementQueueItem(task_id="m1", reason="r")),
+            (management_batch_completion_queue(), ManagementQueueItem(task_id="b1", reason="d")),
+        ]
+    )
+    assert fake.round_trips == 2
+    assert lengths == {management_manual_review_queue(): 1, management_batch_completion_queue(): 1}
+
+    assert await reg.enqueue_corrective_many([]) == {}
+    assert fake.round_trips == 2
+
+
+@pytest.mark.asyncio
+async def test_queue_payload_round_trip_keeps_enums_and_wire_format(monkeypatch):
+    fake = FakeQueue()
+    monkeypatch.setattr(queues_mod, "get_client", lambda: asyncio.sleep(0, result=fake))
+
+    reg = CorrectiveAndManagementRegistry()
+    item = CorrectiveQueueItem(
+        task_id="t2",
+        analysis_type=AnalysisType.COLORS,
+        stage=QAStage.DOMAIN_EXPERT,
+        original_output='{"a": 1}',
+        meta={"attempt": 2},
+    )
+    await reg.enqueue_corrective(QAStage.DOMAIN_EXPERT, AnalysisType.COLORS, item)
+
+    # Payload stays readable by the validating parser
+    raw = fake.store[corrective_queue_name(QAStage.DOMAIN_EXPERT, AnalysisType.COLORS)][0]
+    assert CorrectiveQueueItem.model_validate_json(raw) == item
+
+    out = await reg.dequeue_corrective(QAStage.DOMAIN_EXPERT, AnalysisType.COLORS)
+    assert out == item
+    assert out.analysis_type is AnalysisType.COLORS and out.stage is QAStage.DOMAIN_EXPERT
+
+
+@pytest.mark.asyncio
+async def test_dequeue_any_pops_first_non_empty_queue(monkeypatch):
+    fake = FakeQueue()
+    monkeypatch.setattr(queues_mod, "get_client", lambda: asyncio.sleep(0, result=fake))
+
+    reg = CorrectiveAndManagementRegistry()
+    stage = QAStage.CONTENT_QUALITY
+    assert await reg.dequeue_any_corrective(stage) is None
+
+    await reg.enqueue_corrective_many(
+        (
+            stage,
+            AnalysisType.WEATHER,
+            CorrectiveQueueItem(
+                task_id=f"w{i}", analysis_type=AnalysisType.WEATHER, stage=stage, original_output=""
+            ),
+        )
+        for i in range(3)
+    )
+    got = await reg.dequeue_any_corrective(stage, timeout=1, count=2)
+    assert got is not None
+    analysis_type, items = got
+    assert analysis_type is AnalysisType.WEATHER
+    assert [i.task_id for i in items] == ["w0", "w1"]
+
+    await reg.enqueue_batch_completion(ManagementQueueItem(task_id="b1", reason="done"))
+    await reg.enqueue_priority(ManagementQueueItem(task_id="p1", reason="urgent"))
+    got_mgmt = await reg.dequeue_any_management()
+    assert got_mgmt is not None
+    assert got_mgmt[0] == management_priority_processing_queue()
+    assert [i.task_id for i in got_mgmt[1]] == ["p1"]
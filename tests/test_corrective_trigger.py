@@ -1,3 +1,4 @@
+import json
 from typing import Any
 
 import pytest
@@ -61,6 +62,7 @@ async def test_trigger_enqueues_when_below_threshold(monkeypatch):
             return fake
 
     monkeypatch.setattr(ct, "Redis", RedisShim)
+    monkeypatch.setattr(ct, "_clients", {})
 
     # Build orchestrator result below threshold
     r1 = AgentRunResult(
@@ -83,4 +85,33 @@ async def test_trigger_enqueues_when_below_threshold(monkeypatch):
     assert fake.calls
     qname, payload = fake.calls[0]
     assert qname == "qa:corrective:test"
-    assert '"task_id": "t2"' in payload
+    assert json.loads(payload)["task_id"] == "t2"
+
+
+@pytest.mark.asyncio
+async def test_trigger_reuses_client_per_url(monkeypatch):
+    import app.agents.corrective_trigger as ct
+
+    created: list[FakeRedis] = []
+
+    class CountingRedis:
+        @staticmethod
+        def from_url(*args: Any, **kwargs: Any) -> FakeRedis:  # type: ignore
+            client = FakeRedis()
+            created.append(client)
+            return client
+
+    monkeypatch.setattr(ct, "Redis", CountingRedis)
+    monkeypatch.setattr(ct, "_clients", {})
+
+    res = OrchestratorResult(results=[], aggregate_confidence=0.1, context=None)
+    for task_id in ("t3", "t4"):
+        out = await trigger_corrective_if_needed(task_id=task_id, orchestrator_result=res)
+        assert out.triggered is True
+
+    # One client (and pool) serves both triggers
+    assert len(created) == 1
+    assert [json.loads(data)["task_id"] for _, data in created[0].calls] == ["t3", "t4"]
+
+    await ct.close()
+    assert ct._clients == {}
@@ -4,7 +4,13 @@ from sqlalchemy.exc import IntegrityError
 
 from app.db import schema
 from app.db.connection import dispose_engine, get_engine
-from app.db.dao import AuditLogDAO, QAAttemptDAO, TaskStateDAO, TransactionManager
+from app.db.dao import (
+    AuditLogDAO,
+    ProcessStateDAO,
+    QAAttemptDAO,
+    TaskStateDAO,
+    TransactionManager,
+)
 
 
 @pytest.mark.asyncio
@@ -18,6 +24,7 @@ async def test_batch_operations_and_transaction_management(monkeypatch):
         await conn.run_sync(schema.metadata.create_all)
 
     task_dao = TaskStateDAO()
+    proc_dao = ProcessStateDAO()
     qa_dao = QAAttemptDAO()
     audit_dao = AuditLogDAO()
 
@@ -29,6 +36,18 @@ async def test_batch_operations_and_transaction_management(monkeypatch):
     created_ids = await task_dao.create_tasks_bulk(items)
     assert created_ids == ["t1", "t2"]
 
+    # Bulk process states
+    process_ids = await proc_dao.create_process_states_bulk(
+        [("t1", "worker-1", "started"), ("t2", "worker-2", "started")]
+    )
+    assert len(process_ids) == 2
+    proc = await proc_dao.get_process_by_id(process_ids[1])
+    assert proc and proc["task_id"] == "t2" and proc["worker_id"] == "worker-2"
+
+    # Empty batches are a no-op
+    assert await proc_dao.create_process_states_bulk([]) == []
+    assert await audit_dao.create_audit_logs_bulk([]) == []
+
     # Bulk QA attempts
     attempt_ids = await qa_dao.log_qa_attempts_bulk(
         [
@@ -93,3 +112,112 @@ async def test_batch_operations_and_transaction_management(monkeypatch):
         assert int(res.scalar_one()) == 0
 
     await dispose_engine()
+
+
+@pytest.mark.asyncio
+async def test_dao_calls_join_transaction_manager(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+    engine = await get_engine()
+    async with engine.begin() as conn:
+        await conn.run_sync(schema.metadata.create_all)
+
+    task_dao = TaskStateDAO()
+    proc_dao = ProcessStateDAO()
+
+    # Both DAO writes commit together when the block exits cleanly
+    async with TransactionManager():
+        task_id = await task_dao.create_task(analysis_type="themes", status="pending")
+        process_id = await proc_dao.create_process_state(task_id, "worker-1", "started")
+    assert await proc_dao.get_process_by_id(process_id) is not None
+
+    # ...and are discarded together when it raises
+    class Boom(Exception):
+        pass
+
+    with pytest.raises(Boom):
+        async with TransactionManager():
+            task_id = await task_dao.create_task(analysis_type="ages", status="pending")
+            assert await task_dao.get_task_by_id(task_id) is not None  # visible in-txn
+            raise Boom
+    assert await task_dao.get_task_by_id(task_id) is None
+
+    await dispose_engine()
+
+
+@pytest.mark.asyncio
+async def test_transaction_manager_serializes_concurrent_dao_calls(monkeypatch):
+    import asyncio
+
+    monkeypatch.setenv("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+    engine = await get_engine()
+    async with engine.begin() as conn:
+        await conn.run_sync(schema.metadata.create_all)
+
+    task_dao = TaskStateDAO()
+    active = {"cur": 0, "max": 0}
+
+    async with TransactionManager() as session:
+        real_execute = session.execute
+
+        async def tracking_execute(*args, **kwargs):
+            active["cur"] += 1
+            active["max"] = max(active["max"], active["cur"])
+            try:
+                await asyncio.sleep(0)  # give a gathered sibling the chance to overlap
+                return await real_execute(*args, **kwargs)
+            finally:
+                active["cur"] -= 1
+
+        monkeypatch.setattr(session, "execute", tracking_execute)
+        task_ids = await asyncio.gather(
+            *(task_dao.create_task(analysis_type="themes", status="pending") for _ in range(5))
+        )
+        # A task spawned in the block keeps the context after the block exits
+        release = asyncio.Event()
+
+        async def late_call():
+            await release.wait()
+            await task_dao.update_task_status(task_ids[0], "done")
+
+        straggler = asyncio.create_task(late_call())
+
+    assert active["max"] == 1
+    for task_id in task_ids:
+        assert await task_dao.get_task_by_id(task_id) is not None
+
+    release.set()
+    with pytest.raises(RuntimeError, match="TransactionManager block exited"):
+        await straggler
+
+    await dispose_engine()
+
+
+@pytest.mark.asyncio
+async def test_transaction_manager_invalidates_caches_after_commit(monkeypatch, tmp_path):
+    import asyncio
+    import contextvars
+
+    # File-backed so the outside reader gets its own connection and sees committed rows
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'gf.db'}")
+
+    engine = await get_engine()
+    async with engine.begin() as conn:
+        await conn.run_sync(schema.metadata.create_all)
+
+    task_dao = TaskStateDAO()
+    task_id = await task_dao.create_task(analysis_type="themes", status="pending")
+
+    def read_outside():
+        # A fresh context: the read runs as if from code outside the block
+        return asyncio.create_task(task_dao.get_task_by_id(task_id), context=contextvars.Context())
+
+    async with TransactionManager():
+        await task_dao.update_task_status(task_id, "done")
+        # The outside reader still sees (and caches) the committed row
+        assert (await read_outside())["status"] == "pending"
+
+    assert (await read_outside())["status"] == "done"
+
+    await dispose_engine()
@@ -2,7 +2,12 @@ import pytest
 from sqlalchemy import text
 
 from app.db import schema
-from app.db.connection import dispose_engine, get_engine, get_sessionmaker
+from app.db.connection import (
+    dispose_engine,
+    get_engine,
+    get_sessionmaker,
+    load_settings,
+)
 
 
 @pytest.mark.asyncio
@@ -29,3 +34,32 @@ async def test_engine_creation_sqlite_aiosqlite(monkeypatch):
         assert result.scalar_one() == 2
 
     await dispose_engine()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_connections_use_wal(monkeypatch, tmp_path):
+    # WAL needs a file-backed database; :memory: always reports "memory"
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'gf.db'}")
+
+    engine = await get_engine()
+    async with engine.connect() as conn:
+        mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar_one()
+        sync = (await conn.execute(text("PRAGMA synchronous"))).scalar_one()
+    assert mode == "wal"
+    assert sync == 1  # NORMAL
+
+    await dispose_engine()
+
+
+def test_pool_limits_follow_max_concurrency(monkeypatch):
+    for var in ("DB_POOL_SIZE", "DB_MAX_OVERFLOW", "DB_POOL_TIMEOUT", "DB_POOL_RECYCLE"):
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.setenv("DB_MAX_CONCURRENCY", "16")
+
+    cfg = load_settings()
+    assert (cfg.pool_size, cfg.max_overflow) == (20, 16)
+    assert (cfg.pool_timeout, cfg.pool_recycle) == (30, 1800)
+
+    # Explicit pool settings win over the derived defaults
+    monkeypatch.setenv("DB_POOL_SIZE", "5")
+    assert load_settings().pool_size == 5
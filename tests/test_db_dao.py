@@ -1,9 +1,12 @@
+import json
+import uuid
+
 import pytest
 from sqlalchemy import text
 
 from app.db import schema
 from app.db.connection import dispose_engine, get_engine
-from app.db.dao import AuditLogDAO, ProcessStateDAO, QAAttemptDAO, TaskStateDAO
+from app.db.dao import AuditLogDAO, ProcessStateDAO, QAAttemptDAO, TaskStateDAO, _TTLCache, _uuid
 
 
 @pytest.mark.asyncio
@@ -70,5 +73,33 @@ async def test_dao_crud_sqlite_aiosqlite(monkeypatch):
     assert log_id
     logs = await audit_dao.get_audit_logs_by_process(process_id)
     assert len(logs) == 1 and logs[0]["event_type"] == "worker.finish"
+    # JSON params are serialized by the engine for SQLite; None stays SQL NULL
+    assert json.loads(logs[0]["event_data"]) == {"result": "success"}
+    async with engine.connect() as conn:
+        res = await conn.execute(
+            text("select validation_result, failure_reasons from qa_attempts where attempt_id=:a"),
+            {"a": attempt_id},
+        )
+        validation_result, failure_reasons = res.one()
+    assert json.loads(validation_result) == {"ok": True}
+    assert failure_reasons is None
 
     await dispose_engine()
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = _TTLCache(ttl_seconds=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # refreshes "a"
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+
+def test_generated_ids_are_time_ordered_uuid7():
+    ids = [_uuid() for _ in range(50)]
+    assert all(len(i) == 32 for i in ids)
+    assert all(uuid.UUID(hex=i).version == 7 for i in ids)
+    # Millisecond prefix is non-decreasing in generation order
+    assert [i[:12] for i in ids] == sorted(i[:12] for i in ids)
@@ -27,3 +27,10 @@ def test_schema_tables_and_foreign_keys_sqlite_memory():
 
     fks_audit = insp.get_foreign_keys("audit_logs")
     assert any(fk.get("referred_table") == "processing_state" for fk in fks_audit)
+
+    # Composite indexes for status polling and per-process audit reads
+    def index_columns(table):
+        return {ix["name"]: ix["column_names"] for ix in insp.get_indexes(table)}
+
+    assert index_columns("tasks")["ix_tasks_status_updated"] == ["status", "updated_at"]
+    assert index_columns("audit_logs")["ix_audit_logs_process_ts"] == ["process_id", "timestamp"]
@@ -1,9 +1,10 @@
+import json
 import types
 from typing import Any
 
 import pytest
 
-from app.api.goflow_client import GoFlowClient, GoFlowConfig
+from app.api.goflow_client import GoFlowClient, GoFlowClientFactory, GoFlowConfig
 
 
 class FakeResponse:
@@ -12,6 +13,10 @@ class FakeResponse:
         self._json = json_data
         self.request = types.SimpleNamespace()
 
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._json).encode()
+
     def json(self) -> dict[str, Any]:
         return self._json
 
@@ -21,10 +26,13 @@ class FakeResponse:
 
 
 class FakeAsyncClient:
-    def __init__(self, base_url: str, timeout: float, headers: dict[str, str]) -> None:
+    def __init__(
+        self, base_url: str, timeout: float, headers: dict[str, str], **kwargs: Any
+    ) -> None:
         self.base_url = base_url
         self.timeout = timeout
         self.headers = headers
+        self.kwargs = kwargs
         self.calls: list[tuple[str, str, dict[str, Any]]] = []
 
     async def aclose(self) -> None:  # pragma: no cover
@@ -68,3 +76,65 @@ async def test_goflow_client_post(monkeypatch):
         assert data["ok"] is True
         assert data["path"] == "/jobs"
         assert data["method"] == "POST"
+
+
+@pytest.mark.asyncio
+async def test_goflow_client_pool_settings_from_config(monkeypatch):
+    import app.api.goflow_client as gf
+
+    monkeypatch.setattr(gf, "AsyncRetrying", None)
+    monkeypatch.setattr(gf.httpx, "AsyncClient", FakeAsyncClient)
+
+    cfg = GoFlowConfig(
+        base_url="https://api.example.com", api_key="k", max_connections=8, http2=False
+    )
+    async with GoFlowClient(cfg) as client:
+        limits = client.client.kwargs["limits"]
+        assert limits.max_connections == 8
+        assert limits.max_keepalive_connections == cfg.max_keepalive_connections
+        assert client.client.kwargs["http2"] is False
+
+
+@pytest.mark.asyncio
+async def test_factory_shares_one_http_client(monkeypatch):
+    import app.api.goflow_client as gf
+
+    monkeypatch.setattr(gf, "AsyncRetrying", None)
+    monkeypatch.setattr(gf.httpx, "AsyncClient", FakeAsyncClient)
+
+    factory = GoFlowClientFactory(GoFlowConfig(base_url="https://api.example.com", api_key="k"))
+    with pytest.raises(RuntimeError):
+        factory.client()
+
+    await factory.startup()
+    first, second = factory.client(), factory.client()
+    assert first.client is second.client
+
+    # Leaving a context on a shared client must not tear the pool down
+    async with first as client:
+        await client.get("/ping")
+    assert second.client is first.client
+    assert len(first.client.calls) == 1
+
+    await factory.shutdown()
+    with pytest.raises(RuntimeError):
+        factory.client()
+
+
+@pytest.mark.asyncio
+async def test_goflow_client_uses_rotated_api_key(monkeypatch):
+    import app.api.goflow_client as gf
+
+    monkeypatch.setattr(gf.httpx, "AsyncClient", FakeAsyncClient)
+
+    cfg = GoFlowConfig(base_url="https://api.example.com", api_key="old")
+    async with GoFlowClient(cfg) as client:
+        assert client.client.headers["Authorization"] == "Bearer old"
+
+    rotated = cfg.model_copy(update={"api_key": "new"})
+    async with GoFlowClient(rotated) as client:
+        assert client.client.headers["Authorization"] == "Bearer new"
+
+    cfg.api_key = "newer"
+    async with GoFlowClient(cfg) as client:
+        assert client.client.headers["Authorization"] == "Bearer newer"
@@ -1,3 +1,4 @@
+import json
 import types
 from typing import Any
 
@@ -18,6 +19,10 @@ class FakeResponse:
         self._json = json_data or {"ok": True}
         self.request = types.SimpleNamespace()
 
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._json).encode()
+
     def json(self) -> dict[str, Any]:
         return self._json
 
@@ -29,7 +34,9 @@ class FakeResponse:
 class FlakyAsyncClient:
     """First returns 500, then 200 to exercise retry path."""
 
-    def __init__(self, base_url: str, timeout: float, headers: dict[str, str]) -> None:
+    def __init__(
+        self, base_url: str, timeout: float, headers: dict[str, str], **kwargs: Any
+    ) -> None:
         self.base_url = base_url
         self.timeout = timeout
         self.headers = headers
@@ -48,7 +55,9 @@ class FlakyAsyncClient:
 class ErroringAsyncClient:
     """Always return a specific status for mapping tests."""
 
-    def __init__(self, base_url: str, timeout: float, headers: dict[str, str]) -> None:
+    def __init__(
+        self, base_url: str, timeout: float, headers: dict[str, str], **kwargs: Any
+    ) -> None:
         self.base_url = base_url
         self.timeout = timeout
         self.headers = headers
@@ -83,7 +92,7 @@ async def test_error_mapping(monkeypatch):
     ec = ErroringAsyncClient("https://api.example.com", 30.0, {"a": "b"})
 
     class Factory:
-        def __call__(self, base_url: str, timeout: float, headers: dict[str, str]):
+        def __call__(self, base_url: str, timeout: float, headers: dict[str, str], **kwargs: Any):
             return ec
 
     monkeypatch.setattr(gf.httpx, "AsyncClient", Factory())
@@ -106,3 +115,34 @@ async def test_error_mapping(monkeypatch):
         ec.status_to_return = 503
         with pytest.raises(GoFlowServerError):
             await client.get("/ping")
+        # post() relies on the same typed mapping
+        ec.status_to_return = 401
+        with pytest.raises(GoFlowAuthError):
+            await client.post("/jobs", json={"x": 1})
+
+
+@pytest.mark.asyncio
+async def test_fallback_backoff_is_jittered_and_skips_final_sleep(monkeypatch):
+    import app.api.goflow_client as gf
+
+    monkeypatch.setattr(gf, "AsyncRetrying", None)
+    ec = ErroringAsyncClient("https://api.example.com", 30.0, {"a": "b"})
+    ec.status_to_return = 503
+    monkeypatch.setattr(gf.httpx, "AsyncClient", lambda *a, **kw: ec)
+
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(gf.asyncio, "sleep", fake_sleep)
+
+    cfg = GoFlowConfig(base_url="https://api.example.com", api_key="k", max_retries=3)
+    async with GoFlowClient(cfg) as client:
+        with pytest.raises(GoFlowServerError):
+            await client.get("/ping")
+
+    # Three attempts -> two sleeps, each within 0.5x..1.5x of the base delay
+    assert len(delays) == 2
+    assert 0.1 <= delays[0] <= 0.3
+    assert 0.2 <= delays[1] <= 0.6
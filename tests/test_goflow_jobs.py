@@ -1,10 +1,12 @@
+import json
 import types
 from typing import Any
 
 import pytest
+from pydantic import ValidationError
 
 from app.api.goflow_client import GoFlowClient, GoFlowConfig
-from app.api.goflow_models import JobStatusUpdate
+from app.api.goflow_models import JobStatus, JobStatusUpdate
 
 
 class FakeResponse:
@@ -13,6 +15,10 @@ class FakeResponse:
         self._json = json_data
         self.request = types.SimpleNamespace()
 
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._json).encode()
+
     def json(self) -> dict[str, Any]:
         return self._json
 
@@ -22,7 +28,9 @@ class FakeResponse:
 
 
 class FakeAsyncClient:
-    def __init__(self, base_url: str, timeout: float, headers: dict[str, str]) -> None:
+    def __init__(
+        self, base_url: str, timeout: float, headers: dict[str, str], **kwargs: Any
+    ) -> None:
         self.base_url = base_url
         self.timeout = timeout
         self.headers = headers
@@ -67,3 +75,31 @@ async def test_get_next_job_and_update_status(monkeypatch):
             "p1", JobStatusUpdate(status="in_progress", progress=0.25)
         )
         assert out["ok"] is True
+
+
+@pytest.mark.asyncio
+async def test_update_many_statuses_fans_out(monkeypatch):
+    import app.api.goflow_client as gf
+
+    monkeypatch.setattr(gf, "AsyncRetrying", None)
+    monkeypatch.setattr(gf.httpx, "AsyncClient", FakeAsyncClient)
+
+    cfg = GoFlowConfig(base_url="https://api.example.com", api_key="k")
+    async with GoFlowClient(cfg) as client:
+        out = await client.update_many_statuses(
+            [
+                ("p1", JobStatusUpdate(status="in_progress", progress=0.5)),
+                ("p2", JobStatusUpdate(status="completed", progress=1.0)),
+            ]
+        )
+        assert out == [{"ok": True}, {"ok": True}]
+        urls = sorted(url for _, url, _ in client.client.calls)
+        assert urls == ["/api/v1/agent/projects/p1/status", "/api/v1/agent/projects/p2/status"]
+
+
+def test_job_status_update_validates_status():
+    update = JobStatusUpdate(status="in_progress")
+    assert update.status is JobStatus.IN_PROGRESS
+    assert json.loads(update.model_dump_json())["status"] == "in_progress"
+    with pytest.raises(ValidationError):
+        JobStatusUpdate(status="bogus")
@@ -1,3 +1,4 @@
+import json
 import types
 from typing import Any
 
@@ -13,6 +14,10 @@ class FakeResponse:
         self._json = json_data
         self.request = types.SimpleNamespace()
 
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._json).encode()
+
     def json(self) -> dict[str, Any]:
         return self._json
 
@@ -22,7 +27,9 @@ class FakeResponse:
 
 
 class FakeAsyncClient:
-    def __init__(self, base_url: str, timeout: float, headers: dict[str, str]) -> None:
+    def __init__(
+        self, base_url: str, timeout: float, headers: dict[str, str], **kwargs: Any
+    ) -> None:
         self.base_url = base_url
         self.timeout = timeout
         self.headers = headers
@@ -60,6 +67,10 @@ async def test_submit_result_and_generate_report(monkeypatch):
         )
         res = await client.submit_analysis_result(payload)
         assert res["ok"] is True
+        # Body is sent pre-encoded by pydantic rather than as a dict for httpx to encode
+        _, _, kwargs = client.client.calls[-1]
+        assert "json" not in kwargs
+        assert json.loads(kwargs["content"]) == payload.model_dump()
 
         rep = await client.generate_project_report(ReportRequest(project_id="p1"))
         assert rep.project_id == "p1"
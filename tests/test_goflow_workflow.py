@@ -78,3 +78,56 @@ async def test_workflow_failure_path():
     # Ensure a failed status update was attempted
     failed_updates = [c for c in client.calls if c[0] == "update_status" and c[1][1] == "failed"]
     assert failed_updates, client.calls
+
+
+@pytest.mark.asyncio
+async def test_workflow_overlaps_in_progress_update_with_processing():
+    client = FakeClient()
+    wf = GoFlowWorkflow(client)
+    status_sent = asyncio.Event()
+
+    async def record_status(project_id: str, update: JobStatusUpdate):
+        client.calls.append(("update_status", (project_id, update.status, update.progress)))
+        status_sent.set()
+        return {"ok": True}
+
+    client.update_project_status = record_status  # type: ignore[method-assign]
+
+    async def process(job: Job) -> ProcessResult:
+        # The status update runs while the job is being processed
+        await asyncio.wait_for(status_sent.wait(), timeout=1.0)
+        return ProcessResult(result={"score": 0.8})
+
+    assert await wf.run_once(process) is True
+    methods = [m for m, _ in client.calls]
+    assert methods[:3] == ["get_next_job", "update_status", "submit"]
+    assert methods[-1] == "update_status"
+
+
+@pytest.mark.asyncio
+async def test_workflow_cancelled_mid_processing_cancels_in_progress_update():
+    client = FakeClient()
+    wf = GoFlowWorkflow(client)
+    status_started = asyncio.Event()
+    status_cancelled = asyncio.Event()
+
+    async def hanging_status(project_id: str, update: JobStatusUpdate):
+        status_started.set()
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            status_cancelled.set()
+            raise
+
+    client.update_project_status = hanging_status  # type: ignore[method-assign]
+
+    async def process(job: Job) -> ProcessResult:
+        await asyncio.sleep(30)
+        return ProcessResult(result={})
+
+    run = asyncio.create_task(wf.run_once(process))
+    await asyncio.wait_for(status_started.wait(), timeout=1.0)
+    run.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await run
+    assert status_cancelled.is_set()
@@ -51,3 +51,136 @@ async def test_ready_endpoint_false(monkeypatch):
         resp = await client.get("/ready")
         assert resp.status_code == 200
         assert resp.json() == {"ready": "false"}
+
+
+@pytest.mark.asyncio
+async def test_ready_waits_for_background_preload(monkeypatch):
+    import asyncio
+
+    from app import models as models_mod
+    from app.main import create_app
+
+    async def _ready_true(*_args, **_kwargs):
+        return True
+
+    monkeypatch.setattr(models_mod, "check_ollama_ready", _ready_true)
+
+    release = asyncio.Event()
+    local_app = create_app()
+    local_app.state.preload_task = asyncio.create_task(release.wait())
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=local_app),
+        base_url="http://test",
+    ) as client:
+        assert (await client.get("/ready")).json() == {"ready": "false"}
+        release.set()
+        await local_app.state.preload_task
+        assert (await client.get("/ready")).json() == {"ready": "true"}
+
+
+@pytest.mark.asyncio
+async def test_lifespan_shares_one_http2_client(monkeypatch):
+    from asgi_lifespan import LifespanManager
+
+    import app.main as main_mod
+
+    async def _no_preload(*_args, **_kwargs):
+        return None
+
+    monkeypatch.setattr(main_mod, "preload_qwen_models", _no_preload)
+    local_app = main_mod.create_app()
+    async with LifespanManager(local_app):
+        http = local_app.state.http
+        assert isinstance(http, httpx.AsyncClient) and not http.is_closed
+        assert http is main_mod.get_shared_client()
+    assert http.is_closed
+
+
+@pytest.mark.asyncio
+async def test_lifespan_loads_configs_while_preload_runs(monkeypatch):
+    import asyncio
+
+    from asgi_lifespan import LifespanManager
+
+    import app.main as main_mod
+
+    preload_cancelled = asyncio.Event()
+
+    async def _slow_preload(*_args, **_kwargs):
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            preload_cancelled.set()
+            raise
+
+    monkeypatch.setattr(main_mod, "preload_qwen_models", _slow_preload)
+    local_app = main_mod.create_app()
+    async with LifespanManager(local_app):
+        registry = local_app.state.config_registry
+        for _ in range(200):
+            if registry._configs:
+                break
+            await asyncio.sleep(0.01)
+        assert registry._configs
+        assert not local_app.state.preload_task.done()
+    assert preload_cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_failed_preload_is_retried_until_ready(monkeypatch):
+    import asyncio
+
+    from asgi_lifespan import LifespanManager
+
+    import app.main as main_mod
+    from app import models as models_mod
+
+    attempts = 0
+
+    async def _flaky_preload(*_args, **_kwargs):
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise httpx.ConnectError("ollama not up yet")
+
+    async def _ready_true(*_args, **_kwargs):
+        return True
+
+    monkeypatch.setattr(main_mod, "preload_qwen_models", _flaky_preload)
+    monkeypatch.setattr(main_mod, "_PRELOAD_RETRY_INITIAL_S", 0.0)
+    monkeypatch.setattr(models_mod, "check_ollama_ready", _ready_true)
+    local_app = main_mod.create_app()
+    async with LifespanManager(local_app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=local_app),
+            base_url="http://test",
+        ) as client:
+            await asyncio.wait_for(local_app.state.preload_task, timeout=5)
+            assert attempts == 3
+            assert (await client.get("/ready")).json() == {"ready": "true"}
+
+
+@pytest.mark.asyncio
+async def test_lifespan_closes_corrective_trigger_clients(monkeypatch):
+    from asgi_lifespan import LifespanManager
+
+    import app.agents.corrective_trigger as ct
+    import app.main as main_mod
+
+    class _Client:
+        closed = False
+
+        async def aclose(self):
+            self.closed = True
+
+    async def _no_preload(*_args, **_kwargs):
+        return None
+
+    monkeypatch.setattr(main_mod, "preload_qwen_models", _no_preload)
+    client = _Client()
+    local_app = main_mod.create_app()
+    async with LifespanManager(local_app):
+        monkeypatch.setitem(ct._clients, "redis://test", client)
+    assert client.closed
+    assert "redis://test" not in ct._clients
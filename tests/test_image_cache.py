@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 import time
@@ -75,3 +76,207 @@ async def test_cache_ttl_expiration_and_cleanup(tmp_path):
 
     assert not Path(entry.data_path).exists()
     assert not meta_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_cache_put_falls_back_when_copy_file_range_fails(tmp_path, monkeypatch):
+    def _refuse(*_args, **_kwargs):
+        raise OSError("EXDEV")
+
+    monkeypatch.setattr(os, "copy_file_range", _refuse, raising=False)
+    cfg = CacheConfig(cache_dir=str(tmp_path / "cache"), ttl_seconds=60, compression=False)
+    cache = ImageCache(cfg)
+
+    payload = os.urandom(4096)
+    src = tmp_path / "img4.jpg"
+    src.write_bytes(payload)
+
+    entry = await cache.put("https://example.com/image4.jpg", str(src))
+    assert Path(entry.data_path).read_bytes() == payload
+    assert entry.size_bytes == len(payload)
+
+
+@pytest.mark.asyncio
+async def test_cache_meta_memo_sees_rewritten_meta(tmp_path):
+    cfg = CacheConfig(cache_dir=str(tmp_path / "cache"), ttl_seconds=60, compression=False)
+    cache = ImageCache(cfg)
+
+    src = tmp_path / "img5.jpg"
+    src.write_bytes(b"memo")
+    url = "https://example.com/image5.jpg"
+    entry = await cache.put(url, str(src))
+
+    # First get populates the memo, second is served from it
+    assert await cache.get(url) is not None
+    assert await cache.get(url) is not None
+
+    meta_path = Path(entry.data_path).with_suffix(".json")
+    data = json.loads(meta_path.read_text())
+    data["created_at"] = time.time() - 999999
+    meta_path.write_text(json.dumps(data, indent=2))
+
+    # Bypass the in-process hot entries, which do not watch files, to reach the memo
+    cache._hot.clear()
+    assert await cache.get(url) is None
+
+
+@pytest.mark.asyncio
+async def test_cache_get_follows_meta_compression_flag(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    src = tmp_path / "img6.jpg"
+    src.write_bytes(b"plain")
+    url = "https://example.com/image6.jpg"
+
+    stored = await ImageCache(CacheConfig(cache_dir=cache_dir, compression=False)).put(
+        url, str(src)
+    )
+
+    # Entry written uncompressed is still found after compression is turned on
+    got = await ImageCache(CacheConfig(cache_dir=cache_dir, compression=True)).get(url)
+    assert got is not None and got.compressed is False
+    assert got.data_path == stored.data_path
+
+    Path(stored.data_path).unlink()
+    assert await ImageCache(CacheConfig(cache_dir=cache_dir)).get(url) is None
+
+
+@pytest.mark.asyncio
+async def test_put_removes_data_stored_under_the_other_mode(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    src = tmp_path / "payload.bin"
+    src.write_bytes(b"not an image header")
+    url = "https://example.com/switch.jpg"
+
+    plain = await ImageCache(CacheConfig(cache_dir=cache_dir, compression=False)).put(url, str(src))
+    packed = await ImageCache(CacheConfig(cache_dir=cache_dir, compression=True)).put(url, str(src))
+
+    assert packed.compressed is True
+    assert Path(packed.data_path).exists()
+    assert not Path(plain.data_path).exists()
+    assert sorted(p.name for p in Path(cache_dir).iterdir()) == [
+        f"{packed.key}.jpg.gz",
+        f"{packed.key}.json",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cleanup_expired_removes_only_expired_batch(tmp_path):
+    cfg = CacheConfig(cache_dir=str(tmp_path / "cache"), ttl_seconds=60, compression=False)
+    cache = ImageCache(cfg)
+    src = tmp_path / "img7.jpg"
+    src.write_bytes(b"batch")
+
+    entries = [await cache.put(f"https://example.com/b{i}.jpg", str(src)) for i in range(4)]
+    for entry in entries[:3]:
+        meta_path = Path(entry.data_path).with_suffix(".json")
+        data = json.loads(meta_path.read_text())
+        data["created_at"] = time.time() - 999999
+        meta_path.write_text(json.dumps(data))
+
+    assert await cache.cleanup_expired() == 3
+    assert [Path(e.data_path).exists() for e in entries] == [False, False, False, True]
+
+
+@pytest.mark.asyncio
+async def test_cache_hot_hits_skip_disk_until_invalidated(tmp_path, monkeypatch):
+    cfg = CacheConfig(cache_dir=str(tmp_path / "cache"), ttl_seconds=60, compression=False)
+    cache = ImageCache(cfg)
+    src = tmp_path / "img8.jpg"
+    src.write_bytes(b"hot")
+    url = "https://example.com/image8.jpg"
+
+    await cache.put(url, str(src))
+    first = await cache.get(url)
+    assert first is not None
+
+    async def _no_disk(*_args, **_kwargs):
+        raise AssertionError("hot hit should not read meta")
+
+    with monkeypatch.context() as m:
+        m.setattr(cache, "_read_meta", _no_disk)
+        assert await cache.get(url) is first
+
+    # Housekeeping removals drop the hot entry too
+    meta_path = Path(first.data_path).with_suffix(".json")
+    data = json.loads(meta_path.read_text())
+    data["created_at"] = time.time() - 999999
+    meta_path.write_text(json.dumps(data))
+    assert await cache.cleanup_expired() == 1
+    assert await cache.get(url) is None
+
+
+@pytest.mark.asyncio
+async def test_cache_put_stores_jpeg_uncompressed(tmp_path):
+    cfg = CacheConfig(cache_dir=str(tmp_path / "cache"), ttl_seconds=60, compression=True)
+    cache = ImageCache(cfg)
+    src = tmp_path / "img9.jpg"
+    src.write_bytes(b"\xff\xd8\xff\xe0" + os.urandom(64))
+    url = "https://example.com/image9.jpg"
+
+    entry = await cache.put(url, str(src))
+    assert entry.compressed is False
+    assert Path(entry.data_path).suffix == ".jpg"
+    assert Path(entry.data_path).read_bytes() == src.read_bytes()
+
+    got = await ImageCache(cfg).get(url)
+    assert got is not None and got.data_path == entry.data_path
+
+
+@pytest.mark.asyncio
+async def test_refresh_restarts_ttl_of_expired_entry(tmp_path):
+    cfg = CacheConfig(cache_dir=str(tmp_path / "cache"), ttl_seconds=60, compression=False)
+    cache = ImageCache(cfg)
+    src = tmp_path / "img10.jpg"
+    src.write_bytes(b"revalidate")
+    url = "https://example.com/image10.jpg"
+
+    entry = await cache.put(url, str(src), etag='"v1"')
+    meta_path = Path(entry.data_path).with_suffix(".json")
+    data = json.loads(meta_path.read_text())
+    data["created_at"] = time.time() - 999999
+    del data["etag"], data["last_modified"]  # meta written before validators existed
+    meta_path.write_text(json.dumps(data))
+    cache._hot.clear()
+
+    assert await cache.get(url) is None
+    stale = await cache.get(url, allow_expired=True)
+    assert stale is not None and stale.etag is None
+
+    refreshed = await cache.refresh(url, etag='"v2"')
+    assert refreshed is not None and refreshed.etag == '"v2"'
+    got = await ImageCache(cfg).get(url)
+    assert got is not None and got.etag == '"v2"'
+    assert Path(got.data_path).read_bytes() == b"revalidate"
+
+    assert await cache.refresh("https://example.com/missing.jpg") is None
+
+
+def test_instances_share_one_io_pool(tmp_path):
+    a = ImageCache(CacheConfig(cache_dir=str(tmp_path / "a")))
+    b = ImageCache(CacheConfig(cache_dir=str(tmp_path / "b")))
+    assert a._io_pool is b._io_pool
+
+
+@pytest.mark.asyncio
+async def test_meta_reads_do_not_queue_behind_the_io_pool(tmp_path):
+    import threading
+
+    cfg = CacheConfig(cache_dir=str(tmp_path / "cache"), ttl_seconds=60, compression=False)
+    cache = ImageCache(cfg)
+    src = tmp_path / "img10.jpg"
+    src.write_bytes(b"read")
+    url = "https://example.com/image10.jpg"
+    await cache.put(url, str(src))
+    cache._hot.clear()
+    cache._meta_memo.clear()
+
+    # Occupy every I/O pool worker, as a burst of puts or a scan would
+    release = threading.Event()
+    busy = [cache._io_pool.submit(release.wait) for _ in range(cache._io_pool._max_workers)]
+    try:
+        got = await asyncio.wait_for(cache.get(url), timeout=5)
+    finally:
+        release.set()
+    assert got is not None
+    for f in busy:
+        f.result()
@@ -1,4 +1,5 @@
 import asyncio
+import os
 from collections.abc import AsyncIterator
 from typing import Any
 
@@ -8,9 +9,12 @@ from app.images.downloader import DownloadConfig, DownloadRequest, ImageDownload
 
 
 class FakeStreamResponse:
-    def __init__(self, status_code: int, chunks: list[bytes]) -> None:
+    def __init__(
+        self, status_code: int, chunks: list[bytes], headers: dict[str, str] | None = None
+    ) -> None:
         self.status_code = status_code
         self._chunks = chunks
+        self.headers = headers or {}
 
     async def __aenter__(self):  # pragma: no cover
         return self
@@ -121,3 +125,271 @@ async def test_both_fail_raises(monkeypatch, tmp_path):
 
     with pytest.raises(RuntimeError):
         await d.download_to_path(req, str(dest))
+
+
+@pytest.mark.asyncio
+async def test_download_replaces_existing_file(monkeypatch, tmp_path):
+    import app.images.downloader as dl
+
+    monkeypatch.setattr(dl, "AsyncRetrying", None)
+
+    client = FakeAsyncClient(timeout=1.0, headers={})
+    client.map["https://primary/small.jpg"] = (200, [b"new", b"", b"!"])
+
+    def factory(timeout: float, headers: dict[str, str]):
+        return client
+
+    monkeypatch.setattr(dl.httpx, "AsyncClient", factory)
+
+    dest = tmp_path / "out4.jpg"
+    dest.write_bytes(b"stale-and-much-longer")
+
+    d = ImageDownloader(DownloadConfig(timeout_seconds=5.0, max_retries=1))
+    res = await d.download_to_path(
+        DownloadRequest(primary_url="https://primary/small.jpg"), str(dest)
+    )
+
+    assert res.bytes_written == 4
+    assert dest.read_bytes() == b"new!"
+
+
+@pytest.mark.asyncio
+async def test_download_coalesces_chunks_before_writing(monkeypatch, tmp_path):
+    import app.images.downloader as dl
+
+    monkeypatch.setattr(dl, "AsyncRetrying", None)
+
+    chunks = [bytes([i]) * 700 for i in range(5)]  # 3500 bytes in short pieces
+    client = FakeAsyncClient(timeout=1.0, headers={})
+    client.map["https://primary/chunked.jpg"] = (200, chunks)
+
+    def factory(timeout: float, headers: dict[str, str]):
+        return client
+
+    monkeypatch.setattr(dl.httpx, "AsyncClient", factory)
+
+    writes: list[int] = []
+    real_writev_all = dl._writev_all
+
+    def counting_writev_all(fd, parts):
+        writes.append(sum(map(len, parts)))
+        real_writev_all(fd, parts)
+
+    monkeypatch.setattr(dl, "_writev_all", counting_writev_all)
+
+    dest = tmp_path / "out5.jpg"
+    d = ImageDownloader(DownloadConfig(max_retries=1, flush_threshold=1024))
+    res = await d.download_to_path(
+        DownloadRequest(primary_url="https://primary/chunked.jpg"), str(dest)
+    )
+
+    assert res.bytes_written == 3500
+    assert dest.read_bytes() == b"".join(chunks)
+    assert writes == [1400, 1400, 700]
+
+
+@pytest.mark.asyncio
+async def test_injected_client_is_reused_and_left_open(monkeypatch, tmp_path):
+    import app.images.downloader as dl
+
+    monkeypatch.setattr(dl, "AsyncRetrying", None)
+
+    def no_factory(*_args, **_kwargs):
+        raise AssertionError("a shared client must not be replaced per call")
+
+    monkeypatch.setattr(dl.httpx, "AsyncClient", no_factory)
+
+    client = FakeAsyncClient(timeout=1.0, headers={})
+    client.map["https://primary/a.jpg"] = (200, [b"a"])
+    client.map["https://primary/b.jpg"] = (200, [b"bb"])
+    closed: list[bool] = []
+
+    async def record_close() -> None:
+        closed.append(True)
+
+    client.aclose = record_close
+
+    d = ImageDownloader(DownloadConfig(max_retries=1), http_client=client)
+    await d.download_to_path(
+        DownloadRequest(primary_url="https://primary/a.jpg"), str(tmp_path / "a")
+    )
+    await d.download_to_path(
+        DownloadRequest(primary_url="https://primary/b.jpg"), str(tmp_path / "b")
+    )
+
+    assert [url for _m, url in client.calls] == ["https://primary/a.jpg", "https://primary/b.jpg"]
+    assert closed == []
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_with_fallback(monkeypatch, tmp_path):
+    import app.images.downloader as dl
+
+    monkeypatch.setattr(dl, "AsyncRetrying", None)
+
+    primary_cancelled = asyncio.Event()
+
+    class SlowPrimaryClient(FakeAsyncClient):
+        def stream(self, method: str, url: str, **kwargs: Any) -> FakeStreamResponse:
+            if url != "https://primary/slow.jpg":
+                return super().stream(method, url, **kwargs)
+            self.calls.append((method, url))
+
+            class Hanging(FakeStreamResponse):
+                async def __aenter__(self):
+                    # No response headers: the hedge delay bounds time to first byte
+                    try:
+                        await asyncio.sleep(30)
+                    except asyncio.CancelledError:
+                        primary_cancelled.set()
+                        raise
+                    return self
+
+            return Hanging(200, [])
+
+    client = SlowPrimaryClient(timeout=1.0, headers={})
+    client.map["https://fallback/fast.jpg"] = (200, [b"fast"])
+
+    d = ImageDownloader(
+        DownloadConfig(max_retries=1, flush_threshold=1024, hedge_delay_seconds=0.01),
+        http_client=client,
+    )
+    dest = tmp_path / "out6.jpg"
+    req = DownloadRequest(
+        primary_url="https://primary/slow.jpg", fallback_url="https://fallback/fast.jpg"
+    )
+    res = await asyncio.wait_for(d.download_to_path(req, str(dest)), timeout=5)
+
+    assert res.from_fallback is True
+    assert dest.read_bytes() == b"fast"
+    assert primary_cancelled.is_set()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out6.jpg"]
+
+
+@pytest.mark.asyncio
+async def test_streaming_primary_is_not_hedged(monkeypatch, tmp_path):
+    import app.images.downloader as dl
+
+    monkeypatch.setattr(dl, "AsyncRetrying", None)
+
+    class SlowBody(FakeStreamResponse):
+        async def aiter_bytes(self, chunk_size: int) -> AsyncIterator[bytes]:
+            for c in self._chunks:
+                await asyncio.sleep(0.02)  # well past the hedge delay in total
+                yield c
+
+    class SlowBodyClient(FakeAsyncClient):
+        def stream(self, method: str, url: str, **kwargs: Any) -> FakeStreamResponse:
+            self.calls.append((method, url))
+            if url == "https://primary/big.jpg":
+                return SlowBody(200, [b"big"] * 5)
+            return FakeStreamResponse(200, [b"fallback"])
+
+    client = SlowBodyClient(timeout=1.0, headers={})
+    d = ImageDownloader(
+        DownloadConfig(max_retries=1, flush_threshold=1024, hedge_delay_seconds=0.01),
+        http_client=client,
+    )
+    dest = tmp_path / "big.jpg"
+    req = DownloadRequest(
+        primary_url="https://primary/big.jpg", fallback_url="https://fallback/big.jpg"
+    )
+    res = await asyncio.wait_for(d.download_to_path(req, str(dest)), timeout=5)
+
+    assert res.from_fallback is False
+    assert dest.read_bytes() == b"big" * 5
+    assert [url for _m, url in client.calls] == ["https://primary/big.jpg"]
+
+
+@pytest.mark.asyncio
+async def test_open_cancelled_mid_open_closes_the_fd(monkeypatch, tmp_path):
+    import threading
+
+    import app.images.downloader as dl
+
+    real_open, real_close = os.open, os.close
+    entered, release = threading.Event(), threading.Event()
+    opened: list[int] = []
+    closed: list[int] = []
+
+    def slow_open(*args):
+        entered.set()
+        release.wait(5)
+        fd = real_open(*args)
+        opened.append(fd)
+        return fd
+
+    def record_close(fd):
+        closed.append(fd)
+        real_close(fd)
+
+    monkeypatch.setattr(dl.os, "open", slow_open)
+    monkeypatch.setattr(dl.os, "close", record_close)
+
+    task = asyncio.create_task(dl._open_dest(str(tmp_path / "loser.part")))
+    await asyncio.to_thread(entered.wait, 5)
+    task.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert len(opened) == 1
+    assert closed == opened
+
+
+def test_writev_all_resumes_after_short_writes(monkeypatch, tmp_path):
+    import app.images.downloader as dl
+
+    real_writev = os.writev
+    calls: list[int] = []
+
+    def short_writev(fd, buffers):
+        calls.append(len(buffers))
+        # Accept at most 5 bytes per call, splitting fragments mid-way
+        data = b"".join(bytes(b) for b in buffers)[:5]
+        return real_writev(fd, [data])
+
+    monkeypatch.setattr(dl.os, "writev", short_writev)
+
+    path = tmp_path / "short.bin"
+    fd = os.open(path, dl._OPEN_FLAGS, 0o666)
+    try:
+        dl._writev_all(fd, [b"abc", b"", b"defgh", b"ijklmnop"])
+    finally:
+        os.close(fd)
+
+    assert path.read_bytes() == b"abcdefghijklmnop"
+    assert len(calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_conditional_request_not_modified_leaves_file(monkeypatch, tmp_path):
+    import app.images.downloader as dl
+
+    monkeypatch.setattr(dl, "AsyncRetrying", None)
+
+    sent: list[dict[str, str]] = []
+
+    class ConditionalClient(FakeAsyncClient):
+        def stream(self, method: str, url: str, **kwargs: Any) -> FakeStreamResponse:
+            sent.append(kwargs["headers"])
+            if kwargs["headers"].get("If-None-Match") == '"v1"':
+                return FakeStreamResponse(304, [], {"ETag": '"v1"'})
+            return FakeStreamResponse(200, [b"fresh"], {"ETag": '"v2"'})
+
+    d = ImageDownloader(DownloadConfig(max_retries=1), http_client=ConditionalClient(1.0, {}))
+    dest = tmp_path / "cached.jpg"
+    dest.write_bytes(b"cached")
+
+    res = await d.download_to_path(
+        DownloadRequest(primary_url="https://primary/c.jpg", etag='"v1"'), str(dest)
+    )
+    assert (res.not_modified, res.bytes_written, res.etag) == (True, 0, '"v1"')
+    assert dest.read_bytes() == b"cached"
+    assert sent[-1]["If-None-Match"] == '"v1"'
+
+    res = await d.download_to_path(DownloadRequest(primary_url="https://primary/c.jpg"), str(dest))
+    assert (res.not_modified, res.etag) == (False, '"v2"')
+    assert dest.read_bytes() == b"fresh"
+    assert "If-None-Match" not in sent[-1]
@@ -79,3 +79,43 @@ async def test_optimize_runs_all(tmp_path):
 
     stats = await cache.optimize()
     assert {"expired", "orphans", "purged"}.issubset(stats.keys())
+
+
+@pytest.mark.asyncio
+async def test_cleanup_orphans_keeps_compressed_entries(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache = ImageCache(CacheConfig(cache_dir=str(cache_dir), ttl_seconds=3600, compression=True))
+
+    src = tmp_path / "src.jpg"
+    src.write_bytes(os.urandom(64))
+    entry = await cache.put("https://ex.com/gz.jpg", str(src))
+
+    assert await cache.cleanup_orphans() == 0
+    assert Path(entry.data_path).exists()
+    assert await cache.get("https://ex.com/gz.jpg") is not None
+
+
+@pytest.mark.asyncio
+async def test_optimize_single_pass_counts(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cfg = CacheConfig(cache_dir=str(cache_dir), ttl_seconds=3600, max_cache_bytes=150)
+    cache = ImageCache(cfg)
+
+    src = tmp_path / "src.jpg"
+    src.write_bytes(os.urandom(100))
+    entries = []
+    for i in range(4):
+        entries.append(await cache.put(f"https://ex.com/o{i}.jpg", str(src)))
+        time.sleep(0.01)
+
+    # expire the oldest, orphan the second's data, leave two live 100-byte entries
+    meta0 = Path(entries[0].data_path).with_suffix(".json")
+    meta_data = json.loads(meta0.read_text())
+    meta_data["created_at"] = time.time() - 99999
+    meta0.write_text(json.dumps(meta_data))
+    Path(entries[1].data_path).with_suffix(".json").unlink()
+    (cache_dir / "stray.tmp").write_text("tmp")
+
+    stats = await cache.optimize()
+    assert stats == {"expired": 1, "orphans": 2, "purged": 1}
+    assert [Path(e.data_path).exists() for e in entries] == [False, False, False, True]
@@ -0,0 +1,49 @@
+import pytest
+from PIL import Image
+
+from app.images.validation import ImageValidator, ValidationConfig, _sniff
+
+
+@pytest.mark.parametrize(
+    ("fmt", "mode", "save_kwargs"),
+    [
+        ("JPEG", "RGB", {}),
+        ("JPEG", "RGB", {"progressive": True, "exif": Image.Exif()}),
+        ("JPEG", "L", {}),
+        ("PNG", "RGBA", {}),
+        ("WEBP", "RGB", {}),
+        ("WEBP", "RGB", {"lossless": True}),
+        ("WEBP", "RGBA", {}),
+    ],
+)
+def test_header_sniff_matches_pil(tmp_path, fmt, mode, save_kwargs):
+    path = tmp_path / f"img.{fmt.lower()}"
+    exif = save_kwargs.pop("exif", None)
+    if exif is not None:
+        exif[0x010E] = "x" * 4000  # push SOF behind a large APP1 segment
+        save_kwargs["exif"] = exif
+    Image.new(mode, (1001, 667)).save(path, format=fmt, **save_kwargs)
+
+    info = _sniff(str(path))
+    assert info is not None
+    with Image.open(path) as im:
+        assert (info.format, info.width, info.height) == (im.format, *im.size)
+
+
+@pytest.mark.asyncio
+async def test_validate_path_uses_header_and_falls_back_to_pil(tmp_path):
+    validator = ImageValidator(ValidationConfig())
+
+    jpeg = tmp_path / "ok.jpg"
+    Image.new("RGB", (800, 600)).save(jpeg)
+    res = await validator.validate_path(str(jpeg))
+    assert (res.ok, res.format, res.width, res.height) == (True, "JPEG", 800, 600)
+
+    gif = tmp_path / "anim.gif"
+    Image.new("P", (800, 600)).save(gif)
+    assert _sniff(str(gif)) is None
+    res = await validator.validate_path(str(gif))
+    assert res.ok is False and res.reason == "unsupported format: GIF"
+
+    res = await validator.validate_path(str(tmp_path / "missing.jpg"))
+    assert res.reason == "file not found"
@@ -16,3 +16,61 @@ async def test_metrics_endpoint_exposes_prometheus_text():
         assert "http_requests_total" in text
         assert "http_request_duration_seconds" in text
         assert "http_requests_in_progress" in text
+
+
+@pytest.mark.asyncio
+async def test_request_metrics_use_route_templates():
+    from fastapi import FastAPI
+    from prometheus_client import REGISTRY
+
+    from app.metrics import UNMATCHED_PATH, metrics_middleware
+
+    local_app = FastAPI()
+    local_app.middleware("http")(metrics_middleware)
+
+    @local_app.get("/items/{item_id}")
+    async def item(item_id: int) -> dict[str, int]:
+        return {"id": item_id}
+
+    def count(path: str, status: str) -> float:
+        labels = {"method": "GET", "path": path, "status": status}
+        return REGISTRY.get_sample_value("http_requests_total", labels) or 0.0
+
+    before_item = count("/items/{item_id}", "200")
+    before_unmatched = count(UNMATCHED_PATH, "404")
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=local_app),
+        base_url="http://test",
+    ) as client:
+        for i in range(3):
+            assert (await client.get(f"/items/{i}")).status_code == 200
+        assert (await client.get("/no/such/path")).status_code == 404
+
+    assert count("/items/{item_id}", "200") == before_item + 3
+    assert count("/items/2", "200") == 0.0
+    assert count(UNMATCHED_PATH, "404") == before_unmatched + 1
+
+
+@pytest.mark.asyncio
+async def test_probe_latency_kept_out_of_request_histogram():
+    from prometheus_client import REGISTRY
+
+    from app.metrics import build_request_latency_buckets
+
+    def observed(metric: str) -> float:
+        labels = {"method": "GET", "path": "/live"}
+        return REGISTRY.get_sample_value(f"{metric}_count", labels) or 0.0
+
+    before = observed("http_probe_duration_seconds")
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        assert (await client.get("/live")).status_code == 200
+
+    assert observed("http_probe_duration_seconds") == before + 1
+    assert observed("http_request_duration_seconds") == 0.0
+
+    coarse, fine = build_request_latency_buckets(), build_request_latency_buckets(True)
+    assert coarse[-1] == fine[-1] == 120.0
+    assert fine[0] < coarse[0] and list(fine) == sorted(fine)
@@ -1,3 +1,5 @@
+import json
+
 import httpx
 import pytest
 
@@ -7,6 +9,7 @@ from app.models import preload_qwen_models
 @pytest.mark.asyncio
 async def test_preload_qwen_models_triggers_pull_when_missing():
     called: list[tuple[str, str]] = []  # (method, path)
+    warmed: list[dict] = []
 
     def handler(request: httpx.Request) -> httpx.Response:
         called.append((request.method, request.url.path))
@@ -15,6 +18,9 @@ async def test_preload_qwen_models_triggers_pull_when_missing():
             return httpx.Response(200, json={"models": []})
         if request.method == "POST" and request.url.path.endswith("/api/pull"):
             return httpx.Response(200, json={"status": "success"})
+        if request.method == "POST" and request.url.path.endswith("/api/generate"):
+            warmed.append(json.loads(request.content))
+            return httpx.Response(200, json={"done": True})
         return httpx.Response(404)
 
     transport = httpx.MockTransport(handler)
@@ -34,3 +40,31 @@ async def test_preload_qwen_models_triggers_pull_when_missing():
         path for (method, path) in called if method == "GET" and path.endswith("/api/tags")
     ]
     assert len(tag_checks) == 2
+
+    # Each model is loaded into memory after the pull
+    assert sorted(w["model"] for w in warmed) == ["qwen2.5vl:32b", "qwen2.5vl:latest"]
+    assert all(w["prompt"] == "" and w["keep_alive"] == "30m" for w in warmed)
+
+
+@pytest.mark.asyncio
+async def test_preload_qwen_models_shares_one_client(monkeypatch):
+    import app.models as models_mod
+
+    created: list[httpx.AsyncClient] = []
+    real_client = httpx.AsyncClient
+
+    def counting_client(*args, **kwargs):
+        client = real_client(*args, **kwargs)
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(models_mod.httpx, "AsyncClient", counting_client)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"models": []})
+
+    await preload_qwen_models(
+        base_url="http://ollama.local:11434", transport=httpx.MockTransport(handler)
+    )
+
+    assert len(created) == 1
@@ -28,3 +28,19 @@ def test_apply_ollama_optimizations_overwrites_env(
                 del os.environ[k]
         for k, v in original.items():
             os.environ[k] = v
+
+
+def test_apply_ollama_optimizations_skips_keys_already_set(monkeypatch: pytest.MonkeyPatch) -> None:
+    for k, v in ollama_optimization_vars.items():
+        monkeypatch.setenv(k, v)
+
+    written: list[str] = []
+    real_setitem = os.environ.__class__.__setitem__
+
+    def recording_setitem(self, key, value):  # type: ignore[no-untyped-def]
+        written.append(key)
+        real_setitem(self, key, value)
+
+    monkeypatch.setattr(os.environ.__class__, "__setitem__", recording_setitem)
+    apply_ollama_optimizations()
+    assert written == []
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from app.agents.base import Agent, AgentRequest, AgentResponse
@@ -46,3 +48,72 @@ async def test_orchestrator_runs_agents_and_aggregates():
     # Registered stages list returned
     listed = orch.list_registered()
     assert listed
+
+
+@pytest.mark.asyncio
+async def test_run_all_bounds_concurrency_when_stages_exceed_limit():
+    active = {"cur": 0, "max": 0}
+
+    class SlowAgent(Agent):
+        def __init__(self, confidence: float) -> None:
+            super().__init__()
+            self._conf = confidence
+
+        async def run(self, request: AgentRequest) -> AgentResponse:
+            active["cur"] += 1
+            active["max"] = max(active["max"], active["cur"])
+            await asyncio.sleep(0.01)
+            active["cur"] -= 1
+            return AgentResponse(content="ok", confidence=self._conf, raw={})
+
+    orch = EnhancedQAOrchestrator(max_concurrency=1)
+    orch.register(QAStage.STRUCTURAL, SlowAgent(0.2))
+    orch.register(QAStage.CONTENT_QUALITY, SlowAgent(0.4))
+    orch.register(QAStage.DOMAIN_EXPERT, SlowAgent(0.6))
+
+    req = AgentRequest(analysis_type=AnalysisType.THEMES, qa_stage=None, prompt="p")
+    result = await orch.run_all(req)
+
+    assert active["max"] == 1
+    # Results keep registration order
+    assert [r.stage for r in result.results] == [
+        QAStage.STRUCTURAL,
+        QAStage.CONTENT_QUALITY,
+        QAStage.DOMAIN_EXPERT,
+    ]
+    assert abs(result.aggregate_confidence - 0.4) < 1e-6
+
+
+@pytest.mark.asyncio
+async def test_run_sequential_propagates_content_keyed_by_stage_value():
+    orch = EnhancedQAOrchestrator(max_concurrency=2)
+    orch.register(QAStage.STRUCTURAL, FakeAgent(0.6))
+    orch.register(QAStage.CONTENT_QUALITY, FakeAgent(0.4))
+
+    req = AgentRequest(analysis_type=AnalysisType.THEMES, qa_stage=None, prompt="p")
+    result = await orch.run_sequential(req)
+
+    assert result.context == {"structural_content": "ok", "content_quality_content": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_run_all_calls_share_the_concurrency_limit():
+    active = {"cur": 0, "max": 0}
+
+    class SlowAgent(Agent):
+        async def run(self, request: AgentRequest) -> AgentResponse:
+            active["cur"] += 1
+            active["max"] = max(active["max"], active["cur"])
+            await asyncio.sleep(0.01)
+            active["cur"] -= 1
+            return AgentResponse(content="ok", confidence=0.5, raw={})
+
+    orch = EnhancedQAOrchestrator(max_concurrency=2)
+    orch.register(QAStage.STRUCTURAL, SlowAgent())
+    orch.register(QAStage.CONTENT_QUALITY, SlowAgent())
+
+    req = AgentRequest(analysis_type=AnalysisType.THEMES, qa_stage=None, prompt="p")
+    # Each call fits the limit on its own; together they must not exceed it
+    await asyncio.gather(orch.run_all(req), orch.run_all(req))
+
+    assert active["max"] == 2
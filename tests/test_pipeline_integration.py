@@ -0,0 +1,11 @@
+from app.pipeline_integration import PLACEHOLDER_BASE64_IMAGE, render_prompt
+
+
+def test_render_prompt_substitutes_all_keys_in_one_pass():
+    template = f"img={PLACEHOLDER_BASE64_IMAGE} ctx={{{{CTX}}}} again={PLACEHOLDER_BASE64_IMAGE}"
+    placeholders = {PLACEHOLDER_BASE64_IMAGE: "QUJD{{CTX}}", "{{CTX}}": "scene", "{{CTXS}}": "x"}
+
+    # Inserted values are not rescanned, so the image payload keeps its literal text
+    assert render_prompt(template, placeholders) == ("img=QUJD{{CTX}} ctx=scene again=QUJD{{CTX}}")
+    assert render_prompt("{{CTXS}}/{{CTX}}", placeholders) == "x/scene"
+    assert render_prompt(template, {}) == template
@@ -12,9 +12,33 @@ from app.queue.queues import (
 )
 
 
+class FakePipeline:
+    def __init__(self, queue: "FakeQueue") -> None:
+        self._queue = queue
+        self._ops: list[str] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    def llen(self, q: str) -> "FakePipeline":
+        self._ops.append(q)
+        return self
+
+    async def execute(self) -> list[int]:
+        self._queue.round_trips += 1
+        return [len(self._queue.store.get(q, [])) for q in self._ops]
+
+
 class FakeQueue:
     def __init__(self):
         self.store: dict[str, list[str]] = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
 
     async def rpush(self, q: str, value: str) -> int:
         self.store.setdefault(q, []).append(value)
@@ -61,3 +85,5 @@ async def test_queue_monitor_alerts(monkeypatch):
     # Callback also received same alert
     assert len(received) == 1
     assert received[0].queue == q1
+    # All queue lengths were sampled in a single pipelined round trip
+    assert fake.round_trips == 1
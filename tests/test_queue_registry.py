@@ -60,3 +60,28 @@ async def test_registry_enqueue_dequeue_and_length(monkeypatch):
     # Empty now
     assert await registry.dequeue(qname) is None
     assert await registry.length(qname) == 0
+
+
+@pytest.mark.asyncio
+async def test_registry_round_trips_non_json_native_payload(monkeypatch):
+    from decimal import Decimal
+
+    from pydantic import BaseModel
+
+    class Box(BaseModel):
+        w: int
+
+    fake = FakeQueue()
+    monkeypatch.setattr(queues_mod, "get_client", lambda: asyncio.sleep(0, result=fake))
+
+    registry = QueueRegistry()
+    qname = analysis_queue_name(AnalysisType.AGES)
+    item = QueueItem(
+        task_id="t3",
+        payload={"tags": {"a"}, "price": Decimal("1.50"), "blob": b"x", "box": Box(w=2)},
+    )
+
+    assert await registry.enqueue(qname, item) == 1
+    out = await registry.dequeue(qname)
+    assert out == QueueItem.model_validate_json(item.model_dump_json())
+    assert out.payload == {"tags": ["a"], "price": "1.50", "blob": "x", "box": {"w": 2}}